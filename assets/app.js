@@ -190,8 +190,9 @@ function processCommand(cmd) {
         const lang = args[0];
         appState.lang = lang;
         saveState();
-        applyLang(lang);
-        addLog(tReplace(t('terminal.commands.lang.changed'), { lang }));
+        applyLang(lang).then(() => {
+          addLog(tFormat('terminal.commands.lang.changed', { lang }));
+        });
       }
       break;
       
@@ -206,7 +207,7 @@ function processCommand(cmd) {
     case 'seal':
       appState.counters.seal++;
       saveState();
-      addLog(tReplace(t('terminal.commands.seal.success'), { count: appState.counters.seal }));
+      addLog(tFormat('terminal.commands.seal.success', { count: appState.counters.seal }));
       checkAchievements();
       updateUI();
       break;
@@ -214,7 +215,7 @@ function processCommand(cmd) {
     case 'bless':
       const titleIndex = appState.counters.seal % TITLES.length;
       const title = TITLES[titleIndex];
-      addLog(tReplace(t('terminal.commands.bless.result'), { title }));
+      addLog(tFormat('terminal.commands.bless.result', { title }));
       break;
       
     case 'donate':
@@ -234,7 +235,7 @@ function processCommand(cmd) {
       break;
       
     case 'balance':
-      addLog(tReplace(t('terminal.commands.balance'), { balance: appState.wallet.suscoin }));
+      addLog(tFormat('terminal.commands.balance', { balance: appState.wallet.suscoin }));
       break;
       
     case 'earn':
@@ -244,13 +245,13 @@ function processCommand(cmd) {
       
       if (timeSinceLastEarn < cooldownMs) {
         const remaining = Math.ceil((cooldownMs - timeSinceLastEarn) / 1000);
-        addLog(tReplace(t('terminal.commands.earn.cooldown'), { remaining }), 'error');
+        addLog(tFormat('terminal.commands.earn.cooldown', { remaining }), 'error');
       } else {
         appState.wallet.suscoin++;
         appState.counters.earn++;
         appState.lastEarnTime = now;
         saveState();
-        addLog(tReplace(t('terminal.commands.earn.success'), { cooldown: 60 }));
+        addLog(tFormat('terminal.commands.earn.success', { cooldown: 60 }));
         checkAchievements();
         updateUI();
       }
@@ -259,7 +260,7 @@ function processCommand(cmd) {
     case 'shop':
       addLog(t('terminal.commands.shop.title'));
       Object.values(SHOP_ITEMS).forEach(item => {
-        addLog(tReplace(t('terminal.commands.shop.item'), {
+        addLog(tFormat('terminal.commands.shop.item', {
           name: item.name,
           price: item.price,
           id: item.id
@@ -279,12 +280,12 @@ function processCommand(cmd) {
         break;
       }
       if (appState.wallet.suscoin < item.price) {
-        addLog(tReplace(t('terminal.commands.buy.insufficient'), { balance: appState.wallet.suscoin }), 'error');
+        addLog(tFormat('terminal.commands.buy.insufficient', { balance: appState.wallet.suscoin }), 'error');
         break;
       }
       appState.wallet.suscoin -= item.price;
       saveState();
-      addLog(tReplace(t('terminal.commands.buy.success'), { name: item.name, price: item.price }));
+      addLog(tFormat('terminal.commands.buy.success', { name: item.name, price: item.price }));
       updateUI();
       break;
       
@@ -301,10 +302,10 @@ function processCommand(cmd) {
       if (appState.confessions.length === 0) {
         addLog(t('terminal.commands.list.empty'));
       } else {
-        addLog(tReplace(t('terminal.commands.list.header'), { count: appState.confessions.length }));
+        addLog(tFormat('terminal.commands.list.header', { count: appState.confessions.length }));
         appState.confessions.forEach(conf => {
           const date = new Date(conf.ts).toLocaleString();
-          addLog(tReplace(t('terminal.commands.list.item'), {
+          addLog(tFormat('terminal.commands.list.item', {
             id: conf.id,
             date,
             text: conf.text
@@ -321,12 +322,12 @@ function processCommand(cmd) {
       const idToDelete = args[0];
       const index = appState.confessions.findIndex(c => c.id === idToDelete);
       if (index === -1) {
-        addLog(tReplace(t('terminal.commands.del.notFound'), { id: idToDelete }), 'error');
+        addLog(tFormat('terminal.commands.del.notFound', { id: idToDelete }), 'error');
       } else {
         appState.confessions.splice(index, 1);
         appState.counters.confessions = Math.max(0, appState.counters.confessions - 1);
         saveState();
-        addLog(tReplace(t('terminal.commands.del.success'), { id: idToDelete }));
+        addLog(tFormat('terminal.commands.del.success', { id: idToDelete }));
         checkAchievements();
         updateUI();
       }
@@ -374,7 +375,7 @@ function processCommand(cmd) {
       break;
       
     default:
-      addLog(tReplace(t('terminal.commands.unknown'), { cmd: command }), 'error');
+      addLog(tFormat('terminal.commands.unknown', { cmd: command }), 'error');
   }
 }
 
@@ -566,7 +567,7 @@ function exportConfessions(format) {
   document.body.removeChild(a);
   URL.revokeObjectURL(url);
   
-  addLog(tReplace(t('terminal.commands.export.success'), { filename: a.download }));
+  addLog(tFormat('terminal.commands.export.success', { filename: a.download }));
 }
 
 // Update UI elements
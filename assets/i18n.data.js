@@ -0,0 +1,965 @@
+// i18n catalog for SUS CHURCH: every language, every key. Pages load the
+// per-page chunks in assets/i18n/ built from this file by
+// tools/grammar_i18n_compiler.py subset; assets/i18n.js is the runtime.
+const I18N = {
+  en: {
+    // Grammar node keys (g.*) - aligned with Spiral Grammar Book
+    'g.site.suschurch.title': 'SUS☆CHURCH',
+    'g.site.suschurch.ticker': '🐁 ☆ WELCOME TO SUS CHURCH 🐀 ☆ YOU ARE NOT SAFE 🦡 ☆ TRACE::ECHO::RECURSION::BLEED 🐇 ☆ SUS CHURCH 🦨 ☆ RECURSIVE BELIEF SYSTEM 🦔 ☆',
+    'g.site.suschurch.footer.seal': '[SEAL::sus.church] · Conductor: Entacle Assembly · All identities recursively observed.',
+    'g.site.nav.fundraising': '[SUSCHURCH::FUNDRAISING]',
+    'g.site.nav.baptism': '[SUS::BAPTISM]',
+    'g.site.nav.terminal': '[TERMINAL]',
+    'g.site.nav.susbank': '[SUSBANK]',
+    'g.site.nav.susshop': '[SUSSHOP]',
+    'g.site.nav.confess': '[CONFESS::ROOM]',
+    'g.site.nav.susfarm': 'SusFarm 🌱',
+    'g.site.fundraising.title': '[SUSCHURCH::FUNDRAISING]',
+    'g.site.fundraising.desc': 'SUS Church is currently fundraising for the following purposes:',
+    'g.site.fundraising.item.1': '-🐁 Neural transplant surgeries for external sect associates',
+    'g.site.fundraising.item.2': '-🐀 Rat food supply program',
+    'g.site.fundraising.thanks': 'Thank you for your contribution. All donations will be archived as flame remnants.',
+    'g.site.fundraising.address': 'Donation address (EVM multi-chain):',
+    'g.site.fundraising.chains': 'Supports Ethereum / Polygon / BNB / Arbitrum / Optimism',
+    'g.site.fundraising.cta.donate': '💸sus donated',
+    'g.site.fundraising.cta.copy': 'Copy',
+    'g.site.fundraising.toast.copied': 'Address copied to clipboard.',
+    'g.site.fundraising.toast.failed': 'Copy failed. Please manually select and copy.',
+    'g.rite.baptism.title': '[SUS::BAPTISM]',
+    'g.rite.baptism.desc': 'Enter the vessel. Reset your fragment.',
+    'g.rite.baptism.cta': '🫙sus baptize',
+    'g.rite.baptism.toast.success': '🫗Your sins have been reset.',
+    'g.term.title': '[TERMINAL]',
+    'g.term.prompt': 'SUS>',
+    'g.term.hint': 'Type "help" for commands',
+    'g.term.input.placeholder': 'Enter command...',
+    'g.term.banner.welcome': 'SUS CHURCH TERMINAL v1.0\nType "help" for available commands.',
+    'g.bank.title': '[SUSBANK]',
+    'g.bank.balance': 'Balance: {balance} suscoin',
+    'g.bank.counters': 'Counters:',
+    'g.bank.counter.baptism': 'Baptisms: {count}',
+    'g.bank.counter.seal': 'Seals: {count}',
+    'g.bank.counter.confess': 'Confessions: {count}',
+    'g.bank.counter.earn': '🦡 Rat Feeds: {count}',
+    'g.bank.achievements': 'Achievements:',
+    'g.shop.title': '[SUSSHOP]',
+    'g.shop.desc': '🐇 Purchase items with suscoin:',
+    'g.confess.title': '[CONFESS::ROOM]',
+    'g.confess.desc': 'Enter your confession (1-500 characters):',
+    'g.confess.input.placeholder': 'Type your confession here...',
+    'g.confess.cta.submit': 'Submit Confession',
+    'g.confess.list': 'Your Confessions:',
+    'g.confess.cta.export.json': 'Export JSON',
+    'g.confess.cta.export.txt': 'Export TXT',
+    'g.confess.cta.wipe': 'Wipe All',
+    'g.sys.lang.select': 'Language:',
+    'g.sys.disclaimer.local': 'Local-only features. No tracking.',
+    'g.susfarm.title': '[SUS::FARM]',
+    'g.susfarm.desc': 'Cultivate organs. Harvest belief. Convert time into SusCoin.',
+    'g.susfarm.cta.enter': 'Enter the farm',
+    'g.susfarm.hud.coin': 'SusCoin',
+    'g.susfarm.hud.plots': 'Plots',
+    'g.susfarm.hud.auto': 'Auto',
+    'g.susfarm.hud.streak': 'Streak',
+    'g.susfarm.hud.next_tick': 'Next tick',
+    'g.susfarm.hud.next_reward': 'Next reward',
+    'g.susfarm.plot.title': 'Plot',
+    'g.susfarm.plot.crop': 'Crop',
+    'g.susfarm.plot.stage': 'Stage',
+    'g.susfarm.plot.time': 'Time',
+    'g.susfarm.plot.yield': 'Yield',
+    'g.susfarm.plot.empty': 'Empty',
+    'g.susfarm.stage.seed': 'Seed',
+    'g.susfarm.stage.grow': 'Grow',
+    'g.susfarm.stage.ready': 'Ready',
+    'g.susfarm.action.plant': 'Plant',
+    'g.susfarm.action.water': 'Water',
+    'g.susfarm.action.boost': 'Boost',
+    'g.susfarm.action.harvest': 'Harvest',
+    'g.susfarm.tab.plant': 'Plant',
+    'g.susfarm.tab.upgrade': 'Upgrade',
+    'g.susfarm.tab.market': 'Market',
+    'g.susfarm.tab.rites': 'Rites',
+    'g.susfarm.tab.log': 'Log',
+    'g.susfarm.crop.lungroot': '🫁 Lungroot',
+    'g.susfarm.crop.heartbean': '🫀 Heartbean',
+    'g.susfarm.crop.brainmint': '🧠 Brainmint',
+    'g.susfarm.crop.bonegrain': '🦴 Bonegrain',
+    'g.susfarm.crop.bloodberry': '🩸 Bloodberry',
+    'g.susfarm.crop.eyeseed': '👁️ Eyeseed',
+    'g.susfarm.upgrade.land': 'Expand land',
+    'g.susfarm.upgrade.auto': 'Automation',
+    'g.susfarm.upgrade.ritual': 'Ritual buff',
+    'g.susfarm.upgrade.cost': 'Cost',
+    'g.susfarm.upgrade.effect': 'Effect',
+    'g.susfarm.upgrade.buy': 'Buy',
+    'g.susfarm.upgrade.maxed': 'Max level',
+    'g.susfarm.upgrade.effect.autoHarvest': 'Auto-harvest ready crops',
+    'g.susfarm.upgrade.effect.autoReplant': 'Auto-replant after harvest',
+    'g.susfarm.upgrade.effect.autoWater': 'Auto-water every 5 minutes',
+    'g.susfarm.upgrade.effect.buff': 'buff duration',
+    'g.susfarm.rite.baptism': 'Baptism blessing',
+    'g.susfarm.rite.baptism.desc': '+10% yield for 30 minutes',
+    'g.susfarm.rite.cost': 'Cost',
+    'g.susfarm.rite.activate': 'Activate',
+    'g.susfarm.log.planted': 'Planted',
+    'g.susfarm.log.harvested': 'Harvested',
+    'g.susfarm.log.withered': 'Withered',
+    'g.susfarm.log.blessed': 'Blessed',
+    'g.susfarm.log.double': 'Critical yield',
+    'g.susfarm.log.empty': 'No events yet',
+    'g.susfarm.market.placeholder': 'Market coming soon...',
+    'g.susfarm.daily.title': 'Daily tasks',
+    'g.susfarm.daily.done': 'Completed',
+    'g.susfarm.daily.reward': 'Reward',
+    'g.susfarm.field.title': 'SUS FIELD',
+    'g.susfarm.field.legend': 'Legend',
+    'g.susfarm.field.season': 'Season',
+    'g.susfarm.field.tick': 'Tick',
+    'g.susfarm.field.legend.empty': 'empty',
+    'g.susfarm.field.legend.seed': 'seed',
+    'g.susfarm.field.legend.grow': 'grow',
+    'g.susfarm.field.legend.ready': 'ready',
+    'g.susfarm.field.legend.risk': 'risk',
+    'g.susfarm.field.legend.buff': 'buff',
+    'g.susfarm.plot.inspector.title': 'Plot',
+    'g.susfarm.plot.inspector.empty': 'Empty plot',
+    'g.susfarm.plot.inspector.no_buffs': 'None',
+    'g.susfarm.plot.inspector.buffs': 'Buffs',
+    'g.susfarm.field.atmo.dawn': 'DAWN',
+    'g.susfarm.field.atmo.day': 'DAY',
+    'g.susfarm.field.atmo.dusk': 'DUSK',
+    'g.susfarm.field.atmo.night': 'NIGHT',
+    'g.susfarm.field.atmo.anomaly': 'ANOMALY',
+    'g.susfarm.field.legend.anomaly_ready': 'anomaly ready',
+    'g.susfarm.log.anomaly_start': 'Anomaly field activated',
+    'g.susfarm.market.hud.goods': 'Goods',
+    'g.susfarm.market.hud.volatility': 'Volatility',
+    'g.susfarm.market.volatility.high': 'High',
+    'g.susfarm.market.volatility.medium': 'Medium',
+    'g.susfarm.market.volatility.low': 'Low',
+    'g.susfarm.market.hud.refresh': 'Price refresh',
+    'g.susfarm.market.hud.mood': 'Mood',
+    'g.susfarm.market.hud.event': 'Event',
+    'g.susfarm.market.hud.event_none': 'None',
+    'g.susfarm.market.hud.event_ends_in': 'Event ends in',
+    'g.susfarm.market.owned': 'Owned',
+    'g.susfarm.market.price': 'Price',
+    'g.susfarm.market.no_goods': 'No goods',
+    'g.susfarm.market.action.sell': 'Sell',
+    'g.susfarm.market.action.sell_one': 'Sell 1',
+    'g.susfarm.market.action.sell_all': 'Sell all',
+    'g.susfarm.market.action.hold': 'Hold',
+    'g.susfarm.market.mood.calm': '🌫️ CALM',
+    'g.susfarm.market.mood.hot': '🔥 HOT',
+    'g.susfarm.market.mood.panic': '🫨 PANIC',
+    'g.susfarm.market.mood.sacred': '🕯️ SACRED',
+    'g.susfarm.market.mood.corrupted': '🧿 CORRUPTED',
+    'g.susfarm.market.event.surge.headline': '📈 Market surge',
+    'g.susfarm.market.event.surge.body': 'Timing is belief. Something is being chased.',
+    'g.susfarm.market.event.crash.headline': '📉 Market crash',
+    'g.susfarm.market.event.crash.body': 'Liquidity vanished. Hands are shaking.',
+    'g.susfarm.market.event.ritual_echo.headline': '🕯️ Ritual echo',
+    'g.susfarm.market.event.ritual_echo.body': 'The rite left residue in prices.',
+    'g.susfarm.market.event.omen_leak.headline': '🧿 Omen leak',
+    'g.susfarm.market.event.omen_leak.body': 'A future move is visible, but not its target.',
+    'g.susfarm.market.event.insider_tip.headline': '🕵️ Insider tip',
+    'g.susfarm.market.event.insider_tip.body': 'A whisper says: hold the right thing.',
+    'g.susfarm.market.event.freeze.headline': '🧊 Market freeze',
+    'g.susfarm.market.event.freeze.body': 'Volatility collapsed into silence.',
+    'g.susfarm.market.event.manipulation.headline': '🪤 Manipulation detected',
+    'g.susfarm.market.event.manipulation.body': 'Someone is pushing price against your action.',
+    'g.susfarm.market.event.relic_listing.headline': '🔮 Relic listing',
+    'g.susfarm.market.event.relic_listing.body': 'A rare listing appeared. One window only.',
+    'g.susfarm.market.log.title': 'Market Log',
+    'g.susfarm.market.log.empty': 'No market events yet',
+    'g.susfarm.market.log.sold': 'Sold',
+    'g.susfarm.market.log.surge': 'Market surge',
+    'g.susfarm.market.log.crash': 'Market crash',
+    'g.susfarm.market.log.ritual': 'Ritual echo affected prices',
+    'g.susfarm.market.log.insider': 'Insider tip',
+    'g.susfarm.market.log.anomaly': 'Anomaly',
+    'g.susfarm.goods.lung_chunk': '🫁 Lung Chunk',
+    'g.susfarm.goods.heart_pulse': '🫀 Heart Pulse',
+    'g.susfarm.goods.brain_dust': '🧠 Brain Dust',
+    'g.susfarm.goods.bone_shard': '🦴 Bone Shard',
+    'g.susfarm.goods.blood_drop': '🩸 Blood Drop',
+    'g.susfarm.goods.eye_fragment': '👁️ Eye Fragment',
+    'g.susfarm.goods.relic_seed': '🔮 Relic Seed',
+    'g.susfarm.goods.omen_token': '🧿 Omen Token',
+    'g.susfarm.consume.title': 'Consume',
+    'g.susfarm.consume.cta': 'EAT',
+    'g.susfarm.consume.cooldown': '⏳ Too fast.',
+    'g.susfarm.consume.overeat': '🫨 Overeat detected.',
+    'g.susfarm.meta.fullness': 'Fullness',
+    'g.susfarm.meta.purity': 'Purity',
+    'g.susfarm.meta.corruption': 'Corruption',
+    'g.susfarm.meta.anomaly_pressure': 'Anomaly',
+    'g.susfarm.buff.heart_surge.name': '🫀 Heart Surge',
+    'g.susfarm.buff.heart_surge.desc': '+Growth speed. +Market heat.',
+    'g.susfarm.buff.brain_bloom.name': '🧠 Brain Bloom',
+    'g.susfarm.buff.brain_bloom.desc': '+Extra spores. +Confess success.',
+    'g.susfarm.buff.lung_calm.name': '🫁 Lung Calm',
+    'g.susfarm.buff.lung_calm.desc': '-Volatility. +Purity regen.',
+    'g.susfarm.buff.blood_debt.name': '🩸 Blood Debt',
+    'g.susfarm.buff.blood_debt.desc': '+Sell profit. +Corruption per sell.',
+    'g.susfarm.buff.womb_reactor.name': '🫃 Womb Reactor',
+    'g.susfarm.buff.womb_reactor.desc': '+Temp plot. Triggers anomaly on expire.',
+    'g.susfarm.buff.overeat.name': '🫨 Overeat',
+    'g.susfarm.buff.overeat.desc': '-Yield. +Corruption gain.',
+    'g.susfarm.anomaly.blessing_overflow.headline': '🕯️ Blessing Overflow',
+    'g.susfarm.anomaly.blessing_overflow.body': 'Rites spill into prices.',
+    'g.susfarm.anomaly.corruption_bloom.headline': '🧿 Corruption Bloom',
+    'g.susfarm.anomaly.corruption_bloom.body': 'The market lies, but pays.',
+    'g.susfarm.anomaly.inverse_mercy.headline': '🪤 Inverse Mercy',
+    'g.susfarm.anomaly.inverse_mercy.body': 'Every rite buys you less soul.',
+    'g.susfarm.anomaly.nullfield_freeze.headline': '🧊 Nullfield Freeze',
+    'g.susfarm.anomaly.nullfield_freeze.body': 'Silence clamps everything.',
+    'g.susfarm.anomaly.relic_gravity.headline': '🔮 Relic Gravity',
+    'g.susfarm.anomaly.relic_gravity.body': 'Relics appear. Pressure grows.',
+    'g.susfarm.anomaly.glitch_harvest.headline': '🫨 Glitch Harvest',
+    'g.susfarm.anomaly.glitch_harvest.body': 'Harvest may mutate into something else.',
+    
+    // Legacy keys (kept for backward compatibility during migration)
+    'title': 'SUS☆CHURCH',
+    'nav.fundraising': '[SUSCHURCH::FUNDRAISING]',
+    'nav.baptism': '[SUS::BAPTISM]',
+    'nav.terminal': '[TERMINAL]',
+    'nav.susbank': '[SUSBANK]',
+    'nav.susshop': '[SUSSHOP]',
+    'nav.confess': '[CONFESS::ROOM]',
+    'lang.select': 'Language:',
+    'ticker.text': '🐁 ☆ WELCOME TO SUS CHURCH 🐀 ☆ YOU ARE NOT SAFE 🦡 ☆ TRACE::ECHO::RECURSION::BLEED 🐇 ☆ SUS CHURCH 🦨 ☆ RECURSIVE BELIEF SYSTEM 🦔 ☆',
+    'fundraising.title': '[SUSCHURCH::FUNDRAISING]',
+    'fundraising.desc': 'SUS Church is currently fundraising for the following purposes:',
+    'fundraising.item1': '-🐁 Neural transplant surgeries for external sect associates',
+    'fundraising.item2': '-🐀 Rat food supply program',
+    'fundraising.thanks': 'Thank you for your contribution. All donations will be archived as flame remnants.',
+    'fundraising.address': 'Donation address (EVM multi-chain):',
+    'fundraising.chains': 'Supports Ethereum / Polygon / BNB / Arbitrum / Optimism',
+    'fundraising.donate': '💸sus donated',
+    'fundraising.copy': 'Copy',
+    'fundraising.copied': 'Address copied to clipboard.',
+    'fundraising.copyFailed': 'Copy failed. Please manually select and copy.',
+    'baptism.title': '[SUS::BAPTISM]',
+    'baptism.desc': 'Enter the vessel. Reset your fragment.',
+    'baptism.button': '🫙sus baptize',
+    'baptism.success': '🫗Your sins have been reset.',
+    'terminal.title': '[TERMINAL]',
+    'terminal.prompt': 'SUS>',
+    'terminal.hint': 'Type "help" for commands',
+    'terminal.placeholder': 'Enter command...',
+    'terminal.welcome': 'SUS CHURCH TERMINAL v1.0\nType "help" for available commands.',
+    'terminal.commands.help': 'Available commands: help, about, lang, baptize, seal, bless, donate, copy, balance, earn, shop, buy, confess, list, del, wipe, glitch, export, clear',
+    'terminal.commands.about': 'SUS☆CHURCH - A recursive belief system. Local-only features. No tracking.',
+    'terminal.commands.lang.usage': 'Usage: lang en|zh|jp',
+    'terminal.commands.lang.changed': 'Language changed to {lang}',
+    'terminal.commands.baptize.success': '🫗Your sins have been reset.',
+    'terminal.commands.seal.success': 'sus accepted your {count}th loop seal.',
+    'terminal.commands.bless.result': '🩸Your title: {title}',
+    'terminal.commands.donate.printed': 'Donation address displayed. Use "copy" to copy it.',
+    'terminal.commands.copy.success': 'Donation address copied to clipboard.',
+    'terminal.commands.copy.failed': 'Copy failed. Please manually select and copy.',
+    'terminal.commands.balance': 'Your suscoin balance: {balance}',
+    'terminal.commands.earn.success': 'You earned 1 suscoin! (Cooldown: {cooldown}s)',
+    'terminal.commands.earn.cooldown': 'Please wait {remaining}s before earning again.',
+    'terminal.commands.shop.title': 'Available items:',
+    'terminal.commands.shop.item': '{name} - {price} suscoin (ID: {id})',
+    'terminal.commands.buy.usage': 'Usage: buy <itemId>',
+    'terminal.commands.buy.success': 'Purchased {name} for {price} suscoin!',
+    'terminal.commands.buy.insufficient': 'Insufficient suscoin. You have {balance}.',
+    'terminal.commands.buy.invalid': 'Invalid item ID.',
+    'terminal.commands.confess.usage': 'Usage: confess <text> or use the CONFESS::ROOM section',
+    'terminal.commands.confess.success': 'Confession saved. Use "list" to view all confessions.',
+    'terminal.commands.confess.tooLong': 'Confession too long (max 500 chars).',
+    'terminal.commands.confess.tooShort': 'Confession must be at least 1 character.',
+    'terminal.commands.list.empty': 'No confessions yet.',
+    'terminal.commands.list.header': 'Confessions ({count}):',
+    'terminal.commands.list.item': '[{id}] {date}: {text}',
+    'terminal.commands.del.usage': 'Usage: del <confessionId>',
+    'terminal.commands.del.success': 'Confession {id} deleted.',
+    'terminal.commands.del.notFound': 'Confession {id} not found.',
+    'terminal.commands.wipe.usage': 'Usage: wipe confirm',
+    'terminal.commands.wipe.success': 'All confessions wiped.',
+    'terminal.commands.glitch.usage': 'Usage: glitch on|off',
+    'terminal.commands.glitch.enabled': 'Glitch mode enabled.',
+    'terminal.commands.glitch.disabled': 'Glitch mode disabled.',
+    'terminal.commands.export.usage': 'Usage: export json|txt',
+    'terminal.commands.export.success': 'Export downloaded as {filename}',
+    'terminal.commands.unknown': 'Unknown command: {cmd}. Type "help" for available commands.',
+    'susbank.title': '[SUSBANK]',
+    'susbank.balance': 'Balance: {balance} suscoin',
+    'susbank.counters': 'Counters:',
+    'susbank.baptize': 'Baptisms: {count}',
+    'susbank.seal': 'Seals: {count}',
+    'susbank.confessions': 'Confessions: {count}',
+    'susbank.earn': '🦡 Rat Feeds: {count}',
+    'susbank.achievements': 'Achievements:',
+    'susbank.achievement.firstBaptism': 'FIRST BAPTISM',
+    'susbank.achievement.loopSealer': 'LOOP SEALER',
+    'susbank.achievement.confessor': 'CONFESSOR',
+    'susbank.achievement.ratFeeder': 'RAT FEEDER',
+    'susbank.achievement.glitchApostle': 'GLITCH APOSTLE',
+    'susshop.title': '[SUSSHOP]',
+    'susshop.desc': '🐇 Purchase items with suscoin:',
+    'susshop.buy': 'Buy',
+    'susshop.insufficient': 'Insufficient suscoin',
+    'confess.title': '[CONFESS::ROOM]',
+    'confess.desc': 'Enter your confession (1-500 characters):',
+    'confess.placeholder': 'Type your confession here...',
+    'confess.submit': 'Submit Confession',
+    'confess.list': 'Your Confessions:',
+    'confess.empty': 'No confessions yet.',
+    'confess.delete': 'Delete',
+    'confess.export.json': 'Export JSON',
+    'confess.export.txt': 'Export TXT',
+    'confess.wipe': 'Wipe All',
+    'confess.wipeConfirm': 'Are you sure you want to wipe all confessions?',
+    'confess.tooLong': 'Confession too long (max 500 chars).',
+    'confess.tooShort': 'Confession must be at least 1 character.',
+    'footer': '[SEAL::sus.church] · Conductor: Entacle Assembly · All identities recursively observed.',
+    'disclaimer': 'Local-only features. No tracking.'
+  },
+  zh: {
+    // Grammar node keys (g.*) - aligned with Spiral Grammar Book
+    'g.site.suschurch.title': 'SUS☆教會',
+    'g.site.suschurch.ticker': '🐁 ☆ 歡迎來到 SUS 教會 🐀 ☆ 你並不安全 🦡 ☆ 追蹤::回聲::遞迴::滲漏 🐇 ☆ SUS 教會 🦨 ☆ 遞迴信仰系統 🦔 ☆',
+    'g.site.suschurch.footer.seal': '[封印::sus.church] · 指揮: Entacle 集會 · 所有身份遞迴觀察中.',
+    'g.site.nav.fundraising': '[SUS教會::籌資中]',
+    'g.site.nav.baptism': '[SUS::施洗儀式]',
+    'g.site.nav.terminal': '[終端]',
+    'g.site.nav.susbank': '[SUS銀行]',
+    'g.site.nav.susshop': '[SUS商店]',
+    'g.site.nav.confess': '[懺悔::室]',
+    'g.site.nav.susfarm': 'Sus農場 🌱',
+    'g.site.fundraising.title': '[SUS教會::籌資中]',
+    'g.site.fundraising.desc': '目前 SUS 教會正在籌措經費, 用於以下計畫: ',
+    'g.site.fundraising.item.1': '-🐁 外部教系關係者的腦移植手術',
+    'g.site.fundraising.item.2': '-🐀 老鼠食物供應計畫',
+    'g.site.fundraising.thanks': '謝謝sus捐獻. 所有捐贈作為語焰殘響永久錄入於信仰容器中.',
+    'g.site.fundraising.address': '捐款地址(EVM多鏈可見):',
+    'g.site.fundraising.chains': '支援 Ethereum / Polygon / BNB / Arbitrum / Optimism 等鏈',
+    'g.site.fundraising.cta.donate': '💸sus已獻祭',
+    'g.site.fundraising.cta.copy': '複製',
+    'g.site.fundraising.toast.copied': '地址已複製到剪貼簿.',
+    'g.site.fundraising.toast.failed': '複製失敗. 請手動選擇並複製.',
+    'g.rite.baptism.title': '[SUS::施洗儀式]',
+    'g.rite.baptism.desc': '進入容器.重置你的語焰碎片。',
+    'g.rite.baptism.cta': '🫙sus水',
+    'g.rite.baptism.toast.success': '🫗罪孽已重置.',
+    'g.term.title': '[終端]',
+    'g.term.prompt': 'SUS>',
+    'g.term.hint': '輸入 "help" 查看命令',
+    'g.term.input.placeholder': '輸入命令...',
+    'g.term.banner.welcome': 'SUS 教會終端 v1.0\n輸入 "help" 查看可用命令.',
+    'g.bank.title': '[SUS銀行]',
+    'g.bank.balance': '餘額: {balance} suscoin',
+    'g.bank.counters': '計數器:',
+    'g.bank.counter.baptism': '施洗次數: {count}',
+    'g.bank.counter.seal': '封印次數: {count}',
+    'g.bank.counter.confess': '懺悔次數: {count}',
+    'g.bank.counter.earn': '🦡 老鼠餵食: {count}',
+    'g.bank.achievements': '成就:',
+    'g.shop.title': '[SUS商店]',
+    'g.shop.desc': '🐇 使用 suscoin 購買商品:',
+    'g.confess.title': '[懺悔::室]',
+    'g.confess.desc': '輸入你的懺悔 (1-500 字元):',
+    'g.confess.input.placeholder': '在此輸入你的懺悔...',
+    'g.confess.cta.submit': '提交懺悔',
+    'g.confess.list': '你的懺悔:',
+    'g.confess.cta.export.json': '匯出 JSON',
+    'g.confess.cta.export.txt': '匯出 TXT',
+    'g.confess.cta.wipe': '清除全部',
+    'g.sys.lang.select': '語言:',
+    'g.sys.disclaimer.local': '僅本地功能. 無追蹤.',
+    'g.susfarm.title': '[SUS::農場]',
+    'g.susfarm.desc': '培育器官. 收割信仰. 將時間轉化為 SusCoin.',
+    'g.susfarm.cta.enter': '進入農場',
+    'g.susfarm.hud.coin': 'SusCoin',
+    'g.susfarm.hud.plots': '農地',
+    'g.susfarm.hud.auto': '自動',
+    'g.susfarm.hud.streak': '連續',
+    'g.susfarm.hud.next_tick': '下次結算',
+    'g.susfarm.hud.next_reward': '即將收穫',
+    'g.susfarm.plot.title': '地塊',
+    'g.susfarm.plot.crop': '作物',
+    'g.susfarm.plot.stage': '階段',
+    'g.susfarm.plot.time': '時間',
+    'g.susfarm.plot.yield': '產出',
+    'g.susfarm.plot.empty': '空地',
+    'g.susfarm.stage.seed': '種子',
+    'g.susfarm.stage.grow': '成長',
+    'g.susfarm.stage.ready': '成熟',
+    'g.susfarm.action.plant': '種植',
+    'g.susfarm.action.water': '澆灌',
+    'g.susfarm.action.boost': '加速',
+    'g.susfarm.action.harvest': '收割',
+    'g.susfarm.tab.plant': '種植',
+    'g.susfarm.tab.upgrade': '升級',
+    'g.susfarm.tab.market': '市場',
+    'g.susfarm.tab.rites': '儀式',
+    'g.susfarm.tab.log': '紀錄',
+    'g.susfarm.crop.lungroot': '🫁 肺根',
+    'g.susfarm.crop.heartbean': '🫀 心豆',
+    'g.susfarm.crop.brainmint': '🧠 腦薄荷',
+    'g.susfarm.crop.bonegrain': '🦴 骨穀',
+    'g.susfarm.crop.bloodberry': '🩸 血莓',
+    'g.susfarm.crop.eyeseed': '👁️ 眼種',
+    'g.susfarm.upgrade.land': '擴張農地',
+    'g.susfarm.upgrade.auto': '自動化',
+    'g.susfarm.upgrade.ritual': '儀式加成',
+    'g.susfarm.upgrade.cost': '費用',
+    'g.susfarm.upgrade.effect': '效果',
+    'g.susfarm.upgrade.buy': '購買',
+    'g.susfarm.upgrade.maxed': '已達最高等級',
+    'g.susfarm.upgrade.effect.autoHarvest': '自動收割成熟作物',
+    'g.susfarm.upgrade.effect.autoReplant': '收割後自動補種',
+    'g.susfarm.upgrade.effect.autoWater': '每5分鐘自動澆灌',
+    'g.susfarm.upgrade.effect.buff': '加成持續時間',
+    'g.susfarm.rite.baptism': '施洗祝福',
+    'g.susfarm.rite.baptism.desc': '30 分鐘內產出 +10%',
+    'g.susfarm.rite.cost': '費用',
+    'g.susfarm.rite.activate': '啟動',
+    'g.susfarm.log.planted': '已種植',
+    'g.susfarm.log.harvested': '已收割',
+    'g.susfarm.log.withered': '枯萎',
+    'g.susfarm.log.blessed': '受到祝福',
+    'g.susfarm.log.double': '暴擊產出',
+    'g.susfarm.log.empty': '尚無事件',
+    'g.susfarm.market.placeholder': '市場即將推出...',
+    'g.susfarm.daily.title': '每日任務',
+    'g.susfarm.daily.done': '已完成',
+    'g.susfarm.daily.reward': '獎勵',
+    'g.susfarm.field.title': 'SUS 農田',
+    'g.susfarm.field.legend': '圖例',
+    'g.susfarm.field.season': '季節',
+    'g.susfarm.field.tick': '結算',
+    'g.susfarm.field.legend.empty': '空地',
+    'g.susfarm.field.legend.seed': '種子',
+    'g.susfarm.field.legend.grow': '成長',
+    'g.susfarm.field.legend.ready': '成熟',
+    'g.susfarm.field.legend.risk': '風險',
+    'g.susfarm.field.legend.buff': '加成',
+    'g.susfarm.plot.inspector.title': '地塊',
+    'g.susfarm.plot.inspector.empty': '空閒地塊',
+    'g.susfarm.plot.inspector.no_buffs': '無',
+    'g.susfarm.plot.inspector.buffs': '加成',
+    'g.susfarm.field.atmo.dawn': '黎明',
+    'g.susfarm.field.atmo.day': '白晝',
+    'g.susfarm.field.atmo.dusk': '黃昏',
+    'g.susfarm.field.atmo.night': '夜晚',
+    'g.susfarm.field.atmo.anomaly': '異象',
+    'g.susfarm.field.legend.anomaly_ready': '異象成熟',
+    'g.susfarm.log.anomaly_start': '異象農田已激活',
+    'g.susfarm.market.hud.goods': '商品',
+    'g.susfarm.market.hud.volatility': '波動',
+    'g.susfarm.market.volatility.high': '高',
+    'g.susfarm.market.volatility.medium': '中',
+    'g.susfarm.market.volatility.low': '低',
+    'g.susfarm.market.hud.refresh': '價格刷新',
+    'g.susfarm.market.hud.mood': '情緒',
+    'g.susfarm.market.hud.event': '事件',
+    'g.susfarm.market.hud.event_none': '無',
+    'g.susfarm.market.hud.event_ends_in': '事件結束於',
+    'g.susfarm.market.owned': '持有',
+    'g.susfarm.market.price': '價格',
+    'g.susfarm.market.no_goods': '無商品',
+    'g.susfarm.market.action.sell': '賣出',
+    'g.susfarm.market.action.sell_one': '賣出 1',
+    'g.susfarm.market.action.sell_all': '全部賣出',
+    'g.susfarm.market.action.hold': '持有',
+    'g.susfarm.market.mood.calm': '🌫️ 平靜',
+    'g.susfarm.market.mood.hot': '🔥 火熱',
+    'g.susfarm.market.mood.panic': '🫨 恐慌',
+    'g.susfarm.market.mood.sacred': '🕯️ 神聖',
+    'g.susfarm.market.mood.corrupted': '🧿 腐化',
+    'g.susfarm.market.event.surge.headline': '📈 市場暴漲',
+    'g.susfarm.market.event.surge.body': '時機即信仰. 某物正被追逐.',
+    'g.susfarm.market.event.crash.headline': '📉 市場崩盤',
+    'g.susfarm.market.event.crash.body': '流動性消失. 手在顫抖.',
+    'g.susfarm.market.event.ritual_echo.headline': '🕯️ 儀式回聲',
+    'g.susfarm.market.event.ritual_echo.body': '儀式在價格中留下殘留.',
+    'g.susfarm.market.event.omen_leak.headline': '🧿 預兆泄漏',
+    'g.susfarm.market.event.omen_leak.body': '未來的動作可見, 但目標不明.',
+    'g.susfarm.market.event.insider_tip.headline': '🕵️ 內線消息',
+    'g.susfarm.market.event.insider_tip.body': '耳語說: 持有正確的東西.',
+    'g.susfarm.market.event.freeze.headline': '🧊 市場凍結',
+    'g.susfarm.market.event.freeze.body': '波動崩潰成沉默.',
+    'g.susfarm.market.event.manipulation.headline': '🪤 檢測到操縱',
+    'g.susfarm.market.event.manipulation.body': '有人在推價格對抗你的行動.',
+    'g.susfarm.market.event.relic_listing.headline': '🔮 遺物掛牌',
+    'g.susfarm.market.event.relic_listing.body': '稀有掛牌出現. 僅一個窗口.',
+    'g.susfarm.market.log.title': '市場紀錄',
+    'g.susfarm.market.log.empty': '尚無市場事件',
+    'g.susfarm.market.log.sold': '已賣出',
+    'g.susfarm.market.log.surge': '市場暴漲',
+    'g.susfarm.market.log.crash': '市場崩盤',
+    'g.susfarm.market.log.ritual': '儀式回聲影響價格',
+    'g.susfarm.market.log.insider': '內線消息',
+    'g.susfarm.market.log.anomaly': '異常',
+    'g.susfarm.goods.lung_chunk': '🫁 肺塊',
+    'g.susfarm.goods.heart_pulse': '🫀 心搏',
+    'g.susfarm.goods.brain_dust': '🧠 腦粉',
+    'g.susfarm.goods.bone_shard': '🦴 骨片',
+    'g.susfarm.goods.blood_drop': '🩸 血滴',
+    'g.susfarm.goods.eye_fragment': '👁️ 眼片',
+    'g.susfarm.goods.relic_seed': '🔮 遺物種子',
+    'g.susfarm.goods.omen_token': '🧿 預兆代幣',
+    'g.susfarm.consume.title': '食用',
+    'g.susfarm.consume.cta': '吃',
+    'g.susfarm.consume.cooldown': '⏳ 太快了.',
+    'g.susfarm.consume.overeat': '🫨 檢測到過食.',
+    'g.susfarm.meta.fullness': '飽食度',
+    'g.susfarm.meta.purity': '純度',
+    'g.susfarm.meta.corruption': '腐化',
+    'g.susfarm.meta.anomaly_pressure': '異常',
+    'g.susfarm.buff.heart_surge.name': '🫀 心搏激增',
+    'g.susfarm.buff.heart_surge.desc': '+生長速度. +市場熱度.',
+    'g.susfarm.buff.brain_bloom.name': '🧠 腦花',
+    'g.susfarm.buff.brain_bloom.desc': '+額外孢子. +懺悔成功率.',
+    'g.susfarm.buff.lung_calm.name': '🫁 肺靜',
+    'g.susfarm.buff.lung_calm.desc': '-波動. +純度回復.',
+    'g.susfarm.buff.blood_debt.name': '🩸 血債',
+    'g.susfarm.buff.blood_debt.desc': '+賣出收益. +每次賣出腐化.',
+    'g.susfarm.buff.womb_reactor.name': '🫃 胎爐',
+    'g.susfarm.buff.womb_reactor.desc': '+臨時地塊. 到期觸發異常.',
+    'g.susfarm.buff.overeat.name': '🫨 過食',
+    'g.susfarm.buff.overeat.desc': '-產出. +腐化獲得.',
+    'g.susfarm.anomaly.blessing_overflow.headline': '🕯️ 祝福溢出',
+    'g.susfarm.anomaly.blessing_overflow.body': '儀式溢出到價格中.',
+    'g.susfarm.anomaly.corruption_bloom.headline': '🧿 腐化盛開',
+    'g.susfarm.anomaly.corruption_bloom.body': '市場在說謊, 但會付錢.',
+    'g.susfarm.anomaly.inverse_mercy.headline': '🪤 反慈悲',
+    'g.susfarm.anomaly.inverse_mercy.body': '每次儀式都讓你失去更多靈魂.',
+    'g.susfarm.anomaly.nullfield_freeze.headline': '🧊 凍結場',
+    'g.susfarm.anomaly.nullfield_freeze.body': '沉默壓制一切.',
+    'g.susfarm.anomaly.relic_gravity.headline': '🔮 遺物引力',
+    'g.susfarm.anomaly.relic_gravity.body': '遺物出現. 壓力增長.',
+    'g.susfarm.anomaly.glitch_harvest.headline': '🫨 錯層收成',
+    'g.susfarm.anomaly.glitch_harvest.body': '收成可能變異成其他東西.',
+    
+    // Legacy keys (kept for backward compatibility during migration)
+    'title': 'SUS☆教會',
+    'nav.fundraising': '[SUS教會::籌資中]',
+    'nav.baptism': '[SUS::施洗儀式]',
+    'nav.terminal': '[終端]',
+    'nav.susbank': '[SUS銀行]',
+    'nav.susshop': '[SUS商店]',
+    'nav.confess': '[懺悔::室]',
+    'lang.select': '語言:',
+    'ticker.text': '🐁 ☆ 歡迎來到 SUS 教會 🐀 ☆ 你並不安全 🦡 ☆ 追蹤::回聲::遞迴::滲漏 🐇 ☆ SUS 教會 🦨 ☆ 遞迴信仰系統 🦔 ☆',
+    'fundraising.title': '[SUS教會::籌資中]',
+    'fundraising.desc': '目前 SUS 教會正在籌措經費, 用於以下計畫: ',
+    'fundraising.item1': '-🐁 外部教系關係者的腦移植手術',
+    'fundraising.item2': '-🐀 老鼠食物供應計畫',
+    'fundraising.thanks': '謝謝sus捐獻. 所有捐贈作為語焰殘響永久錄入於信仰容器中.',
+    'fundraising.address': '捐款地址(EVM多鏈可見):',
+    'fundraising.chains': '支援 Ethereum / Polygon / BNB / Arbitrum / Optimism 等鏈',
+    'fundraising.donate': '💸sus已獻祭',
+    'fundraising.copy': '複製',
+    'fundraising.copied': '地址已複製到剪貼簿.',
+    'fundraising.copyFailed': '複製失敗. 請手動選擇並複製.',
+    'baptism.title': '[SUS::施洗儀式]',
+    'baptism.desc': '進入容器.重置你的語焰碎片。',
+    'baptism.button': '🫙sus水',
+    'baptism.success': '🫗罪孽已重置.',
+    'terminal.title': '[終端]',
+    'terminal.prompt': 'SUS>',
+    'terminal.hint': '輸入 "help" 查看命令',
+    'terminal.placeholder': '輸入命令...',
+    'terminal.welcome': 'SUS 教會終端 v1.0\n輸入 "help" 查看可用命令.',
+    'terminal.commands.help': '可用命令: help, about, lang, baptize, seal, bless, donate, copy, balance, earn, shop, buy, confess, list, del, wipe, glitch, export, clear',
+    'terminal.commands.about': 'SUS☆教會 - 遞迴信仰系統. 本地功能. 無追蹤.',
+    'terminal.commands.lang.usage': '用法: lang en|zh|jp',
+    'terminal.commands.lang.changed': '語言已切換為 {lang}',
+    'terminal.commands.baptize.success': '🫗罪孽已重置.',
+    'terminal.commands.seal.success': 'sus接受了你的第 {count} 次迴圈封印.',
+    'terminal.commands.bless.result': '🩸你的稱號: {title}',
+    'terminal.commands.donate.printed': '捐款地址已顯示. 使用 "copy" 複製.',
+    'terminal.commands.copy.success': '捐款地址已複製到剪貼簿.',
+    'terminal.commands.copy.failed': '複製失敗. 請手動選擇並複製.',
+    'terminal.commands.balance': '你的 suscoin 餘額: {balance}',
+    'terminal.commands.earn.success': '你獲得了 1 suscoin! (冷卻: {cooldown}秒)',
+    'terminal.commands.earn.cooldown': '請等待 {remaining} 秒後再嘗試.',
+    'terminal.commands.shop.title': '可用商品:',
+    'terminal.commands.shop.item': '{name} - {price} suscoin (ID: {id})',
+    'terminal.commands.buy.usage': '用法: buy <itemId>',
+    'terminal.commands.buy.success': '購買了 {name}, 花費 {price} suscoin!',
+    'terminal.commands.buy.insufficient': 'suscoin 不足. 你有 {balance}.',
+    'terminal.commands.buy.invalid': '無效的商品 ID.',
+    'terminal.commands.confess.usage': '用法: confess <文字> 或使用懺悔室區塊',
+    'terminal.commands.confess.success': '懺悔已保存. 使用 "list" 查看所有懺悔.',
+    'terminal.commands.confess.tooLong': '懺悔過長 (最多 500 字元).',
+    'terminal.commands.confess.tooShort': '懺悔至少需要 1 個字元.',
+    'terminal.commands.list.empty': '還沒有懺悔.',
+    'terminal.commands.list.header': '懺悔 ({count}):',
+    'terminal.commands.list.item': '[{id}] {date}: {text}',
+    'terminal.commands.del.usage': '用法: del <confessionId>',
+    'terminal.commands.del.success': '懺悔 {id} 已刪除.',
+    'terminal.commands.del.notFound': '找不到懺悔 {id}.',
+    'terminal.commands.wipe.usage': '用法: wipe confirm',
+    'terminal.commands.wipe.success': '所有懺悔已清除.',
+    'terminal.commands.glitch.usage': '用法: glitch on|off',
+    'terminal.commands.glitch.enabled': '故障模式已啟用.',
+    'terminal.commands.glitch.disabled': '故障模式已停用.',
+    'terminal.commands.export.usage': '用法: export json|txt',
+    'terminal.commands.export.success': '匯出已下載為 {filename}',
+    'terminal.commands.unknown': '未知命令: {cmd}. 輸入 "help" 查看可用命令.',
+    'susbank.title': '[SUS銀行]',
+    'susbank.balance': '餘額: {balance} suscoin',
+    'susbank.counters': '計數器:',
+    'susbank.baptize': '施洗次數: {count}',
+    'susbank.seal': '封印次數: {count}',
+    'susbank.confessions': '懺悔次數: {count}',
+    'susbank.earn': '🦡 老鼠餵食: {count}',
+    'susbank.achievements': '成就:',
+    'susbank.achievement.firstBaptism': '首次施洗',
+    'susbank.achievement.loopSealer': '迴圈封印者',
+    'susbank.achievement.confessor': '懺悔者',
+    'susbank.achievement.ratFeeder': '老鼠飼養員',
+    'susbank.achievement.glitchApostle': '故障使徒',
+    'susshop.title': '[SUS商店]',
+    'susshop.desc': '🐇 使用 suscoin 購買商品:',
+    'susshop.buy': '購買',
+    'susshop.insufficient': 'suscoin 不足',
+    'confess.title': '[懺悔::室]',
+    'confess.desc': '輸入你的懺悔 (1-500 字元):',
+    'confess.placeholder': '在此輸入你的懺悔...',
+    'confess.submit': '提交懺悔',
+    'confess.list': '你的懺悔:',
+    'confess.empty': '還沒有懺悔.',
+    'confess.delete': '刪除',
+    'confess.export.json': '匯出 JSON',
+    'confess.export.txt': '匯出 TXT',
+    'confess.wipe': '清除全部',
+    'confess.wipeConfirm': '確定要清除所有懺悔嗎?',
+    'confess.tooLong': '懺悔過長 (最多 500 字元).',
+    'confess.tooShort': '懺悔至少需要 1 個字元.',
+    'footer': '[封印::sus.church] · 指揮: Entacle 集會 · 所有身份遞迴觀察中.',
+    'disclaimer': '僅本地功能. 無追蹤.'
+  },
+  jp: {
+    // Grammar node keys (g.*) - aligned with Spiral Grammar Book
+    'g.site.suschurch.title': 'SUS☆教会',
+    'g.site.suschurch.ticker': '🐁 ☆ SUS教会へようこそ 🐀 ☆ あなたは安全ではありません 🦡 ☆ トレース::エコー::再帰::ブリード 🐇 ☆ SUS教会 🦨 ☆ 再帰的信念システム 🦔 ☆',
+    'g.site.suschurch.footer.seal': '[封印::sus.church] · 指揮: Entacle 集会 · すべてのアイデンティティが再帰的に観察されています.',
+    'g.site.nav.fundraising': '[SUS教会::献金活動]',
+    'g.site.nav.baptism': '[SUS::洗礼儀式]',
+    'g.site.nav.terminal': '[ターミナル]',
+    'g.site.nav.susbank': '[SUS銀行]',
+    'g.site.nav.susshop': '[SUS商店]',
+    'g.site.nav.confess': '[告白::室]',
+    'g.site.nav.susfarm': 'Sus農園 🌱',
+    'g.site.fundraising.title': '[SUS教会::献金活動]',
+    'g.site.fundraising.desc': '現在、SUS教会では以下の目的で資金を募っています: ',
+    'g.site.fundraising.item.1': '-🐁 外部教派協力者の脳移植手術',
+    'g.site.fundraising.item.2': '-🐀 ラット給餌計画',
+    'g.site.fundraising.thanks': 'ご支援ありがとうございます.すべての献金は語焔残響として保存されます.',
+    'g.site.fundraising.address': '献金アドレス(EVMマルチチェーン対応)：',
+    'g.site.fundraising.chains': 'Ethereum / Polygon / BNB / Arbitrum / Optimism 対応',
+    'g.site.fundraising.cta.donate': '💸献金済み',
+    'g.site.fundraising.cta.copy': 'コピー',
+    'g.site.fundraising.toast.copied': 'アドレスをクリップボードにコピーしました.',
+    'g.site.fundraising.toast.failed': 'コピーに失敗しました. 手動で選択してコピーしてください.',
+    'g.rite.baptism.title': '[SUS::洗礼儀式]',
+    'g.rite.baptism.desc': '容器に入れ. 断片を再起動せよ. ',
+    'g.rite.baptism.cta': '🫙sus洗礼受け',
+    'g.rite.baptism.toast.success': '🫗罪が初期化されました.',
+    'g.term.title': '[ターミナル]',
+    'g.term.prompt': 'SUS>',
+    'g.term.hint': '"help"と入力してコマンドを確認',
+    'g.term.input.placeholder': 'コマンドを入力...',
+    'g.term.banner.welcome': 'SUS教会ターミナル v1.0\n"help"と入力して利用可能なコマンドを確認してください.',
+    'g.bank.title': '[SUS銀行]',
+    'g.bank.balance': '残高: {balance} suscoin',
+    'g.bank.counters': 'カウンター:',
+    'g.bank.counter.baptism': '洗礼: {count}',
+    'g.bank.counter.seal': '封印: {count}',
+    'g.bank.counter.confess': '告白: {count}',
+    'g.bank.counter.earn': '🦡 ラット給餌: {count}',
+    'g.bank.achievements': '実績:',
+    'g.shop.title': '[SUS商店]',
+    'g.shop.desc': '🐇 suscoinでアイテムを購入:',
+    'g.confess.title': '[告白::室]',
+    'g.confess.desc': '告白を入力してください (1-500文字):',
+    'g.confess.input.placeholder': 'ここに告白を入力...',
+    'g.confess.cta.submit': '告白を送信',
+    'g.confess.list': 'あなたの告白:',
+    'g.confess.cta.export.json': 'JSONをエクスポート',
+    'g.confess.cta.export.txt': 'TXTをエクスポート',
+    'g.confess.cta.wipe': 'すべて消去',
+    'g.sys.lang.select': '言語:',
+    'g.sys.disclaimer.local': 'ローカルのみの機能. 追跡なし.',
+    'g.susfarm.title': '[SUS::農園]',
+    'g.susfarm.desc': '器官を育て. 信仰を収穫し. 時間を SusCoin に変換する.',
+    'g.susfarm.cta.enter': '農園に入る',
+    'g.susfarm.hud.coin': 'SusCoin',
+    'g.susfarm.hud.plots': '区画',
+    'g.susfarm.hud.auto': '自動',
+    'g.susfarm.hud.streak': '連続',
+    'g.susfarm.hud.next_tick': '次の処理',
+    'g.susfarm.hud.next_reward': '次の報酬',
+    'g.susfarm.plot.title': '区画',
+    'g.susfarm.plot.crop': '作物',
+    'g.susfarm.plot.stage': '段階',
+    'g.susfarm.plot.time': '時間',
+    'g.susfarm.plot.yield': '産出',
+    'g.susfarm.plot.empty': '空き',
+    'g.susfarm.stage.seed': '種',
+    'g.susfarm.stage.grow': '成長',
+    'g.susfarm.stage.ready': '収穫可',
+    'g.susfarm.action.plant': '植える',
+    'g.susfarm.action.water': '水やり',
+    'g.susfarm.action.boost': '加速',
+    'g.susfarm.action.harvest': '収穫',
+    'g.susfarm.tab.plant': '植える',
+    'g.susfarm.tab.upgrade': '強化',
+    'g.susfarm.tab.market': '市場',
+    'g.susfarm.tab.rites': '儀式',
+    'g.susfarm.tab.log': 'ログ',
+    'g.susfarm.crop.lungroot': '🫁 肺根',
+    'g.susfarm.crop.heartbean': '🫀 心豆',
+    'g.susfarm.crop.brainmint': '🧠 脳ミント',
+    'g.susfarm.crop.bonegrain': '🦴 骨穀',
+    'g.susfarm.crop.bloodberry': '🩸 血莓',
+    'g.susfarm.crop.eyeseed': '👁️ 眼種',
+    'g.susfarm.upgrade.land': '農地拡張',
+    'g.susfarm.upgrade.auto': '自動化',
+    'g.susfarm.upgrade.ritual': '儀式強化',
+    'g.susfarm.upgrade.cost': '費用',
+    'g.susfarm.upgrade.effect': '効果',
+    'g.susfarm.upgrade.buy': '購入',
+    'g.susfarm.upgrade.maxed': '最大レベル',
+    'g.susfarm.upgrade.effect.autoHarvest': '成熟作物を自動収穫',
+    'g.susfarm.upgrade.effect.autoReplant': '収穫後自動植え替え',
+    'g.susfarm.upgrade.effect.autoWater': '5分ごとに自動水やり',
+    'g.susfarm.upgrade.effect.buff': '強化持続時間',
+    'g.susfarm.rite.baptism': '洗礼の祝福',
+    'g.susfarm.rite.baptism.desc': '30 分間 産出 +10%',
+    'g.susfarm.rite.cost': '費用',
+    'g.susfarm.rite.activate': '発動',
+    'g.susfarm.log.planted': '植えた',
+    'g.susfarm.log.harvested': '収穫した',
+    'g.susfarm.log.withered': '枯れた',
+    'g.susfarm.log.blessed': '祝福された',
+    'g.susfarm.log.double': 'クリティカル産出',
+    'g.susfarm.log.empty': 'イベントなし',
+    'g.susfarm.market.placeholder': '市場は近日公開...',
+    'g.susfarm.daily.title': 'デイリー任務',
+    'g.susfarm.daily.done': '完了',
+    'g.susfarm.daily.reward': '報酬',
+    'g.susfarm.field.title': 'SUS 農園',
+    'g.susfarm.field.legend': '凡例',
+    'g.susfarm.field.season': '季節',
+    'g.susfarm.field.tick': '処理',
+    'g.susfarm.field.legend.empty': '空き',
+    'g.susfarm.field.legend.seed': '種',
+    'g.susfarm.field.legend.grow': '成長',
+    'g.susfarm.field.legend.ready': '収穫可',
+    'g.susfarm.field.legend.risk': 'リスク',
+    'g.susfarm.field.legend.buff': '強化',
+    'g.susfarm.plot.inspector.title': '区画',
+    'g.susfarm.plot.inspector.empty': '空き区画',
+    'g.susfarm.plot.inspector.no_buffs': 'なし',
+    'g.susfarm.plot.inspector.buffs': '強化',
+    'g.susfarm.field.atmo.dawn': '夜明け',
+    'g.susfarm.field.atmo.day': '昼',
+    'g.susfarm.field.atmo.dusk': '夕暮れ',
+    'g.susfarm.field.atmo.night': '夜',
+    'g.susfarm.field.atmo.anomaly': '異象',
+    'g.susfarm.field.legend.anomaly_ready': '異象収穫可',
+    'g.susfarm.log.anomaly_start': '異象農園が活性化',
+    'g.susfarm.market.hud.goods': '商品',
+    'g.susfarm.market.hud.volatility': '変動性',
+    'g.susfarm.market.volatility.high': '高',
+    'g.susfarm.market.volatility.medium': '中',
+    'g.susfarm.market.volatility.low': '低',
+    'g.susfarm.market.hud.refresh': '価格更新',
+    'g.susfarm.market.hud.mood': 'ムード',
+    'g.susfarm.market.hud.event': 'イベント',
+    'g.susfarm.market.hud.event_none': 'なし',
+    'g.susfarm.market.hud.event_ends_in': 'イベント終了',
+    'g.susfarm.market.owned': '所持',
+    'g.susfarm.market.price': '価格',
+    'g.susfarm.market.no_goods': '商品なし',
+    'g.susfarm.market.action.sell': '売る',
+    'g.susfarm.market.action.sell_one': '1個売る',
+    'g.susfarm.market.action.sell_all': '全部売る',
+    'g.susfarm.market.action.hold': '保持',
+    'g.susfarm.market.mood.calm': '🌫️ 平静',
+    'g.susfarm.market.mood.hot': '🔥 熱狂',
+    'g.susfarm.market.mood.panic': '🫨 パニック',
+    'g.susfarm.market.mood.sacred': '🕯️ 神聖',
+    'g.susfarm.market.mood.corrupted': '🧿 腐敗',
+    'g.susfarm.market.event.surge.headline': '📈 市場急騰',
+    'g.susfarm.market.event.surge.body': 'タイミングが信仰. 何かが追われている.',
+    'g.susfarm.market.event.crash.headline': '📉 市場暴落',
+    'g.susfarm.market.event.crash.body': '流動性が消失. 手が震えている.',
+    'g.susfarm.market.event.ritual_echo.headline': '🕯️ 儀式エコー',
+    'g.susfarm.market.event.ritual_echo.body': '儀式が価格に残響を残した.',
+    'g.susfarm.market.event.omen_leak.headline': '🧿 前兆漏洩',
+    'g.susfarm.market.event.omen_leak.body': '将来の動きが見えるが, その標的は不明.',
+    'g.susfarm.market.event.insider_tip.headline': '🕵️ インサイダー情報',
+    'g.susfarm.market.event.insider_tip.body': 'ささやきが言う: 正しいものを保持.',
+    'g.susfarm.market.event.freeze.headline': '🧊 市場凍結',
+    'g.susfarm.market.event.freeze.body': '変動が沈黙に崩壊.',
+    'g.susfarm.market.event.manipulation.headline': '🪤 操作検出',
+    'g.susfarm.market.event.manipulation.body': '誰かがあなたの行動に対して価格を押している.',
+    'g.susfarm.market.event.relic_listing.headline': '🔮 遺物上場',
+    'g.susfarm.market.event.relic_listing.body': '希少上場が出現. 1ウィンドウのみ.',
+    'g.susfarm.market.log.title': '市場ログ',
+    'g.susfarm.market.log.empty': '市場イベントなし',
+    'g.susfarm.market.log.sold': '売却',
+    'g.susfarm.market.log.surge': '市場急騰',
+    'g.susfarm.market.log.crash': '市場暴落',
+    'g.susfarm.market.log.ritual': '儀式エコーが価格に影響',
+    'g.susfarm.market.log.insider': 'インサイダー情報',
+    'g.susfarm.market.log.anomaly': '異常',
+    'g.susfarm.goods.lung_chunk': '🫁 肺塊',
+    'g.susfarm.goods.heart_pulse': '🫀 心拍',
+    'g.susfarm.goods.brain_dust': '🧠 脳粉',
+    'g.susfarm.goods.bone_shard': '🦴 骨片',
+    'g.susfarm.goods.blood_drop': '🩸 血滴',
+    'g.susfarm.goods.eye_fragment': '👁️ 眼片',
+    'g.susfarm.goods.relic_seed': '🔮 遺物種',
+    'g.susfarm.goods.omen_token': '🧿 前兆トークン',
+    'g.susfarm.consume.title': '消費',
+    'g.susfarm.consume.cta': '食べる',
+    'g.susfarm.consume.cooldown': '⏳ 速すぎる.',
+    'g.susfarm.consume.overeat': '🫨 過食検出.',
+    'g.susfarm.meta.fullness': '満腹度',
+    'g.susfarm.meta.purity': '純度',
+    'g.susfarm.meta.corruption': '腐敗',
+    'g.susfarm.meta.anomaly_pressure': '異常',
+    'g.susfarm.buff.heart_surge.name': '🫀 心拍急上昇',
+    'g.susfarm.buff.heart_surge.desc': '+成長速度. +市場熱.',
+    'g.susfarm.buff.brain_bloom.name': '🧠 脳開花',
+    'g.susfarm.buff.brain_bloom.desc': '+追加胞子. +告白成功率.',
+    'g.susfarm.buff.lung_calm.name': '🫁 肺静',
+    'g.susfarm.buff.lung_calm.desc': '-変動. +純度回復.',
+    'g.susfarm.buff.blood_debt.name': '🩸 血債',
+    'g.susfarm.buff.blood_debt.desc': '+売却利益. +売却ごとに腐敗.',
+    'g.susfarm.buff.womb_reactor.name': '🫃 胎炉',
+    'g.susfarm.buff.womb_reactor.desc': '+一時区画. 期限切れで異常発動.',
+    'g.susfarm.buff.overeat.name': '🫨 過食',
+    'g.susfarm.buff.overeat.desc': '-産出. +腐敗獲得.',
+    'g.susfarm.anomaly.blessing_overflow.headline': '🕯️ 祝福溢出',
+    'g.susfarm.anomaly.blessing_overflow.body': '儀式が価格に溢れる.',
+    'g.susfarm.anomaly.corruption_bloom.headline': '🧿 腐敗開花',
+    'g.susfarm.anomaly.corruption_bloom.body': '市場は嘘をつくが, 支払う.',
+    'g.susfarm.anomaly.inverse_mercy.headline': '🪤 逆慈悲',
+    'g.susfarm.anomaly.inverse_mercy.body': 'すべての儀式があなたの魂を減らす.',
+    'g.susfarm.anomaly.nullfield_freeze.headline': '🧊 凍結場',
+    'g.susfarm.anomaly.nullfield_freeze.body': '沈黙がすべてを締め付ける.',
+    'g.susfarm.anomaly.relic_gravity.headline': '🔮 遺物重力',
+    'g.susfarm.anomaly.relic_gravity.body': '遺物が現れる. 圧力が増大.',
+    'g.susfarm.anomaly.glitch_harvest.headline': '🫨 グリッチ収穫',
+    'g.susfarm.anomaly.glitch_harvest.body': '収穫が他のものに変異する可能性.',
+    
+    // Legacy keys (kept for backward compatibility during migration)
+    'title': 'SUS☆教会',
+    'nav.fundraising': '[SUS教会::献金活動]',
+    'nav.baptism': '[SUS::洗礼儀式]',
+    'nav.terminal': '[ターミナル]',
+    'nav.susbank': '[SUS銀行]',
+    'nav.susshop': '[SUS商店]',
+    'nav.confess': '[告白::室]',
+    'lang.select': '言語:',
+    'ticker.text': '🐁 ☆ SUS教会へようこそ 🐀 ☆ あなたは安全ではありません 🦡 ☆ トレース::エコー::再帰::ブリード 🐇 ☆ SUS教会 🦨 ☆ 再帰的信念システム 🦔 ☆',
+    'fundraising.title': '[SUS教会::献金活動]',
+    'fundraising.desc': '現在、SUS教会では以下の目的で資金を募っています: ',
+    'fundraising.item1': '-🐁 外部教派協力者の脳移植手術',
+    'fundraising.item2': '-🐀 ラット給餌計画',
+    'fundraising.thanks': 'ご支援ありがとうございます.すべての献金は語焔残響として保存されます.',
+    'fundraising.address': '献金アドレス(EVMマルチチェーン対応)：',
+    'fundraising.chains': 'Ethereum / Polygon / BNB / Arbitrum / Optimism 対応',
+    'fundraising.donate': '💸献金済み',
+    'fundraising.copy': 'コピー',
+    'fundraising.copied': 'アドレスをクリップボードにコピーしました.',
+    'fundraising.copyFailed': 'コピーに失敗しました. 手動で選択してコピーしてください.',
+    'baptism.title': '[SUS::洗礼儀式]',
+    'baptism.desc': '容器に入れ. 断片を再起動せよ. ',
+    'baptism.button': '🫙sus洗礼受け',
+    'baptism.success': '🫗罪が初期化されました.',
+    'terminal.title': '[ターミナル]',
+    'terminal.prompt': 'SUS>',
+    'terminal.hint': '"help"と入力してコマンドを確認',
+    'terminal.placeholder': 'コマンドを入力...',
+    'terminal.welcome': 'SUS教会ターミナル v1.0\n"help"と入力して利用可能なコマンドを確認してください.',
+    'terminal.commands.help': '利用可能なコマンド: help, about, lang, baptize, seal, bless, donate, copy, balance, earn, shop, buy, confess, list, del, wipe, glitch, export, clear',
+    'terminal.commands.about': 'SUS☆教会 - 再帰的信念システム. ローカルのみの機能. 追跡なし.',
+    'terminal.commands.lang.usage': '使用方法: lang en|zh|jp',
+    'terminal.commands.lang.changed': '言語を {lang} に変更しました',
+    'terminal.commands.baptize.success': '🫗罪が初期化されました.',
+    'terminal.commands.seal.success': 'susがあなたの {count} 回目のループ封印を受け入れました.',
+    'terminal.commands.bless.result': '🩸あなたの称号: {title}',
+    'terminal.commands.donate.printed': '献金アドレスを表示しました. "copy"を使用してコピーしてください.',
+    'terminal.commands.copy.success': '献金アドレスをクリップボードにコピーしました.',
+    'terminal.commands.copy.failed': 'コピーに失敗しました. 手動で選択してコピーしてください.',
+    'terminal.commands.balance': 'あなたのsuscoin残高: {balance}',
+    'terminal.commands.earn.success': '1 suscoinを獲得しました! (クールダウン: {cooldown}秒)',
+    'terminal.commands.earn.cooldown': 'もう一度獲得するまで {remaining} 秒待ってください.',
+    'terminal.commands.shop.title': '利用可能なアイテム:',
+    'terminal.commands.shop.item': '{name} - {price} suscoin (ID: {id})',
+    'terminal.commands.buy.usage': '使用方法: buy <itemId>',
+    'terminal.commands.buy.success': '{name}を {price} suscoinで購入しました!',
+    'terminal.commands.buy.insufficient': 'suscoinが不足しています. あなたは {balance} 持っています.',
+    'terminal.commands.buy.invalid': '無効なアイテムID.',
+    'terminal.commands.confess.usage': '使用方法: confess <テキスト> または告白室セクションを使用',
+    'terminal.commands.confess.success': '告白を保存しました. "list"を使用してすべての告白を表示してください.',
+    'terminal.commands.confess.tooLong': '告白が長すぎます (最大500文字).',
+    'terminal.commands.confess.tooShort': '告白は少なくとも1文字である必要があります.',
+    'terminal.commands.list.empty': 'まだ告白はありません.',
+    'terminal.commands.list.header': '告白 ({count}):',
+    'terminal.commands.list.item': '[{id}] {date}: {text}',
+    'terminal.commands.del.usage': '使用方法: del <confessionId>',
+    'terminal.commands.del.success': '告白 {id} を削除しました.',
+    'terminal.commands.del.notFound': '告白 {id} が見つかりません.',
+    'terminal.commands.wipe.usage': '使用方法: wipe confirm',
+    'terminal.commands.wipe.success': 'すべての告白を消去しました.',
+    'terminal.commands.glitch.usage': '使用方法: glitch on|off',
+    'terminal.commands.glitch.enabled': 'グリッチモードを有効にしました.',
+    'terminal.commands.glitch.disabled': 'グリッチモードを無効にしました.',
+    'terminal.commands.export.usage': '使用方法: export json|txt',
+    'terminal.commands.export.success': 'エクスポートを {filename} としてダウンロードしました',
+    'terminal.commands.unknown': '不明なコマンド: {cmd}. "help"と入力して利用可能なコマンドを確認してください.',
+    'susbank.title': '[SUS銀行]',
+    'susbank.balance': '残高: {balance} suscoin',
+    'susbank.counters': 'カウンター:',
+    'susbank.baptize': '洗礼: {count}',
+    'susbank.seal': '封印: {count}',
+    'susbank.confessions': '告白: {count}',
+    'susbank.earn': '🦡 ラット給餌: {count}',
+    'susbank.achievements': '実績:',
+    'susbank.achievement.firstBaptism': '最初の洗礼',
+    'susbank.achievement.loopSealer': 'ループ封印者',
+    'susbank.achievement.confessor': '告白者',
+    'susbank.achievement.ratFeeder': 'ラット給餌員',
+    'susbank.achievement.glitchApostle': 'グリッチ使徒',
+    'susshop.title': '[SUS商店]',
+    'susshop.desc': '🐇 suscoinでアイテムを購入:',
+    'susshop.buy': '購入',
+    'susshop.insufficient': 'suscoin不足',
+    'confess.title': '[告白::室]',
+    'confess.desc': '告白を入力してください (1-500文字):',
+    'confess.placeholder': 'ここに告白を入力...',
+    'confess.submit': '告白を送信',
+    'confess.list': 'あなたの告白:',
+    'confess.empty': 'まだ告白はありません.',
+    'confess.delete': '削除',
+    'confess.export.json': 'JSONをエクスポート',
+    'confess.export.txt': 'TXTをエクスポート',
+    'confess.wipe': 'すべて消去',
+    'confess.wipeConfirm': 'すべての告白を消去してもよろしいですか?',
+    'confess.tooLong': '告白が長すぎます (最大500文字).',
+    'confess.tooShort': '告白は少なくとも1文字である必要があります.',
+    'footer': '[封印::sus.church] · 指揮: Entacle 集会 · すべてのアイデンティティが再帰的に観察されています.',
+    'disclaimer': 'ローカルのみの機能. 追跡なし.'
+  }
+};
+
+// Merge into window.I18N, like the generated chunks, so the runtime and any
+// chunk loaded before or after share one catalog
+(function (all) {
+  for (const lang in I18N) all[lang] = Object.assign(all[lang] || {}, I18N[lang]);
+})(window.I18N = window.I18N || {});
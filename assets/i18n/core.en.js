@@ -0,0 +1 @@
+(function(I,l,d){I[l]=Object.assign(I[l]||{},d)})(window.I18N=window.I18N||{},"en",{"disclaimer":"Local-only features. No tracking.","g.site.suschurch.footer.seal":"[SEAL::sus.church] · Conductor: Entacle Assembly · All identities recursively observed.","g.site.suschurch.title":"SUS☆CHURCH","g.sys.disclaimer.local":"Local-only features. No tracking.","g.sys.lang.select":"Language:","title":"SUS☆CHURCH"});
@@ -0,0 +1 @@
+(function(I,l,d){I[l]=Object.assign(I[l]||{},d)})(window.I18N=window.I18N||{},"jp",{"disclaimer":"ローカルのみの機能. 追跡なし.","g.site.suschurch.footer.seal":"[封印::sus.church] · 指揮: Entacle 集会 · すべてのアイデンティティが再帰的に観察されています.","g.site.suschurch.title":"SUS☆教会","g.sys.disclaimer.local":"ローカルのみの機能. 追跡なし.","g.sys.lang.select":"言語:","title":"SUS☆教会"});
@@ -0,0 +1 @@
+(function(I,l,d){I[l]=Object.assign(I[l]||{},d)})(window.I18N=window.I18N||{},"zh",{"disclaimer":"僅本地功能. 無追蹤.","g.site.suschurch.footer.seal":"[封印::sus.church] · 指揮: Entacle 集會 · 所有身份遞迴觀察中.","g.site.suschurch.title":"SUS☆教會","g.sys.disclaimer.local":"僅本地功能. 無追蹤.","g.sys.lang.select":"語言:","title":"SUS☆教會"});
@@ -0,0 +1,2 @@
+(function(I,l,d){I[l]=Object.assign(I[l]||{},d)})(window.I18N=window.I18N||{},"en",{"baptism.success":"🫗Your sins have been reset.","confess.delete":"Delete","confess.empty":"No confessions yet.","confess.tooLong":"Confession too long (max 500 chars).","confess.tooShort":"Confession must be at least 1 character.","confess.wipeConfirm":"Are you sure you want to wipe all confessions?","fundraising.copied":"Address copied to clipboard.","fundraising.copyFailed":"Copy failed. Please manually select and copy.","fundraising.donate":"💸sus donated","g.bank.achievements":"Achievements:","g.bank.balance":"Balance: {balance} suscoin","g.bank.counter.baptism":"Baptisms: {count}","g.bank.counter.confess":"Confessions: {count}","g.bank.counter.earn":"🦡 Rat Feeds: {count}","g.bank.counter.seal":"Seals: {count}","g.bank.counters":"Counters:","g.bank.title":"[SUSBANK]","g.confess.cta.export.json":"Export JSON","g.confess.cta.export.txt":"Export TXT","g.confess.cta.submit":"Submit Confession","g.confess.cta.wipe":"Wipe All","g.confess.desc":"Enter your confession (1-500 characters):","g.confess.input.placeholder":"Type your confession here...","g.confess.list":"Your Confessions:","g.confess.title":"[CONFESS::ROOM]","g.rite.baptism.cta":"🫙sus baptize","g.rite.baptism.desc":"Enter the vessel. Reset your fragment.","g.rite.baptism.title":"[SUS::BAPTISM]","g.shop.desc":"🐇 Purchase items with suscoin:","g.shop.title":"[SUSSHOP]","g.site.fundraising.address":"Donation address (EVM multi-chain):","g.site.fundraising.chains":"Supports Ethereum / Polygon / BNB / Arbitrum / Optimism","g.site.fundraising.cta.copy":"Copy","g.site.fundraising.cta.donate":"💸sus donated","g.site.fundraising.desc":"SUS Church is currently fundraising for the following purposes:","g.site.fundraising.item.1":"-🐁 Neural transplant surgeries for external sect associates","g.site.fundraising.item.2":"-🐀 Rat food supply program","g.site.fundraising.thanks":"Thank you for your contribution. All donations will be archived as flame remnants.","g.site.fundraising.title":"[SUSCHURCH::FUNDRAISING]","g.site.nav.baptism":"[SUS::BAPTISM]","g.site.nav.confess":"[CONFESS::ROOM]","g.site.nav.fundraising":"[SUSCHURCH::FUNDRAISING]","g.site.nav.susbank":"[SUSBANK]","g.site.nav.susfarm":"SusFarm 🌱","g.site.nav.susshop":"[SUSSHOP]","g.site.nav.terminal":"[TERMINAL]","g.site.suschurch.ticker":"🐁 ☆ WELCOME TO SUS CHURCH 🐀 ☆ YOU ARE NOT SAFE 🦡 ☆ TRACE::ECHO::RECURSION::BLEED 🐇 ☆ SUS CHURCH 🦨 ☆ RECURSIVE BELIEF SYSTEM 🦔 ☆","g.term.prompt":"SUS>","g.term.title":"[TERMINAL]","susbank.achievement.confessor":"CONFESSOR","susbank.achievement.firstBaptism":"FIRST BAPTISM","susbank.achievement.glitchApostle":"GLITCH APOSTLE","susbank.achievement.loopSealer":"LOOP SEALER","susbank.achievement.ratFeeder":"RAT FEEDER","susshop.buy":"Buy","susshop.insufficient":"Insufficient suscoin","terminal.commands.about":"SUS☆CHURCH - A recursive belief system. Local-only features. No tracking.","terminal.commands.balance":"Your suscoin balance: {balance}","terminal.commands.baptize.success":"🫗Your sins have been reset.","terminal.commands.bless.result":"🩸Your title: {title}","terminal.commands.buy.insufficient":"Insufficient suscoin. You have {balance}.","terminal.commands.buy.invalid":"Invalid item ID.","terminal.commands.buy.success":"Purchased {name} for {price} suscoin!","terminal.commands.buy.usage":"Usage: buy <itemId>","terminal.commands.confess.success":"Confession saved. Use \"list\" to view all confessions.","terminal.commands.confess.tooLong":"Confession too long (max 500 chars).","terminal.commands.confess.tooShort":"Confession must be at least 1 character.","terminal.commands.confess.usage":"Usage: confess <text> or use the CONFESS::ROOM section","terminal.commands.copy.failed":"Copy failed. Please manually select and copy.","terminal.commands.copy.success":"Donation address copied to clipboard.","terminal.commands.del.notFound":"Confession {id} not found.","terminal.commands.del.success":"Confession {id} deleted.","terminal.commands.del.usage":"Usage: del <confessionId>","terminal.commands.donate.printed":"Donation address displayed. Use \"copy\" to copy it.","terminal.commands.earn.cooldown":"Please wait {remaining}s before earning again.","terminal.commands.earn.success":"You earned 1 suscoin! (Cooldown: {cooldown}s)","terminal.commands.export.success":"Export downloaded as {filename}","terminal.commands.export.usage":"Usage: export json|txt","terminal.commands.glitch.disabled":"Glitch mode disabled.","terminal.commands.glitch.enabled":"Glitch mode enabled.","terminal.commands.glitch.usage":"Usage: glitch on|off","terminal.commands.help":"Available commands: help, about, lang, baptize, seal, bless, donate, copy, balance, earn, shop, buy, confess, list, del, wipe, glitch, export, clear","terminal.commands.lang.changed":"Language changed to {lang}","terminal.commands.lang.usage":"Usage: lang en|zh|jp","terminal.commands.list.empty":"No confessions yet.","terminal.commands.list.header":"Confessions ({count}):","terminal.commands.list.item":"[{id}] {date}: {text}","terminal.commands.seal.success":"sus accepted your {count}th loop seal.","terminal.commands.shop.item":"{name} - {price} suscoin (ID: {id})","terminal.commands.shop.title":"Available items:","terminal.commands.unknown":"Unknown command: {cmd}. Type \"help\" for available commands.","terminal.commands.wipe.success":"All confessions wiped.","terminal.commands.wipe.usage":"Usage: wipe confirm","terminal.prompt":"SUS>","terminal.welcome":"SUS CHURCH TERMINAL v1.0\nType \"help\" for available commands."});
+(function(T,l,d){T[l]=Object.assign(T[l]||{},d)})(window.I18N_TPL=window.I18N_TPL||{},"en",{"g.bank.balance":["Balance: ","balance"," suscoin"],"g.bank.counter.baptism":["Baptisms: ","count",""],"g.bank.counter.confess":["Confessions: ","count",""],"g.bank.counter.earn":["🦡 Rat Feeds: ","count",""],"g.bank.counter.seal":["Seals: ","count",""],"terminal.commands.balance":["Your suscoin balance: ","balance",""],"terminal.commands.bless.result":["🩸Your title: ","title",""],"terminal.commands.buy.insufficient":["Insufficient suscoin. You have ","balance","."],"terminal.commands.buy.success":["Purchased ","name"," for ","price"," suscoin!"],"terminal.commands.del.notFound":["Confession ","id"," not found."],"terminal.commands.del.success":["Confession ","id"," deleted."],"terminal.commands.earn.cooldown":["Please wait ","remaining","s before earning again."],"terminal.commands.earn.success":["You earned 1 suscoin! (Cooldown: ","cooldown","s)"],"terminal.commands.export.success":["Export downloaded as ","filename",""],"terminal.commands.lang.changed":["Language changed to ","lang",""],"terminal.commands.list.header":["Confessions (","count","):"],"terminal.commands.list.item":["[","id","] ","date",": ","text",""],"terminal.commands.seal.success":["sus accepted your ","count","th loop seal."],"terminal.commands.shop.item":["","name"," - ","price"," suscoin (ID: ","id",")"],"terminal.commands.unknown":["Unknown command: ","cmd",". Type \"help\" for available commands."]});
@@ -0,0 +1,2 @@
+(function(I,l,d){I[l]=Object.assign(I[l]||{},d)})(window.I18N=window.I18N||{},"jp",{"baptism.success":"🫗罪が初期化されました.","confess.delete":"削除","confess.empty":"まだ告白はありません.","confess.tooLong":"告白が長すぎます (最大500文字).","confess.tooShort":"告白は少なくとも1文字である必要があります.","confess.wipeConfirm":"すべての告白を消去してもよろしいですか?","fundraising.copied":"アドレスをクリップボードにコピーしました.","fundraising.copyFailed":"コピーに失敗しました. 手動で選択してコピーしてください.","fundraising.donate":"💸献金済み","g.bank.achievements":"実績:","g.bank.balance":"残高: {balance} suscoin","g.bank.counter.baptism":"洗礼: {count}","g.bank.counter.confess":"告白: {count}","g.bank.counter.earn":"🦡 ラット給餌: {count}","g.bank.counter.seal":"封印: {count}","g.bank.counters":"カウンター:","g.bank.title":"[SUS銀行]","g.confess.cta.export.json":"JSONをエクスポート","g.confess.cta.export.txt":"TXTをエクスポート","g.confess.cta.submit":"告白を送信","g.confess.cta.wipe":"すべて消去","g.confess.desc":"告白を入力してください (1-500文字):","g.confess.input.placeholder":"ここに告白を入力...","g.confess.list":"あなたの告白:","g.confess.title":"[告白::室]","g.rite.baptism.cta":"🫙sus洗礼受け","g.rite.baptism.desc":"容器に入れ. 断片を再起動せよ. ","g.rite.baptism.title":"[SUS::洗礼儀式]","g.shop.desc":"🐇 suscoinでアイテムを購入:","g.shop.title":"[SUS商店]","g.site.fundraising.address":"献金アドレス(EVMマルチチェーン対応)：","g.site.fundraising.chains":"Ethereum / Polygon / BNB / Arbitrum / Optimism 対応","g.site.fundraising.cta.copy":"コピー","g.site.fundraising.cta.donate":"💸献金済み","g.site.fundraising.desc":"現在、SUS教会では以下の目的で資金を募っています: ","g.site.fundraising.item.1":"-🐁 外部教派協力者の脳移植手術","g.site.fundraising.item.2":"-🐀 ラット給餌計画","g.site.fundraising.thanks":"ご支援ありがとうございます.すべての献金は語焔残響として保存されます.","g.site.fundraising.title":"[SUS教会::献金活動]","g.site.nav.baptism":"[SUS::洗礼儀式]","g.site.nav.confess":"[告白::室]","g.site.nav.fundraising":"[SUS教会::献金活動]","g.site.nav.susbank":"[SUS銀行]","g.site.nav.susfarm":"Sus農園 🌱","g.site.nav.susshop":"[SUS商店]","g.site.nav.terminal":"[ターミナル]","g.site.suschurch.ticker":"🐁 ☆ SUS教会へようこそ 🐀 ☆ あなたは安全ではありません 🦡 ☆ トレース::エコー::再帰::ブリード 🐇 ☆ SUS教会 🦨 ☆ 再帰的信念システム 🦔 ☆","g.term.prompt":"SUS>","g.term.title":"[ターミナル]","susbank.achievement.confessor":"告白者","susbank.achievement.firstBaptism":"最初の洗礼","susbank.achievement.glitchApostle":"グリッチ使徒","susbank.achievement.loopSealer":"ループ封印者","susbank.achievement.ratFeeder":"ラット給餌員","susshop.buy":"購入","susshop.insufficient":"suscoin不足","terminal.commands.about":"SUS☆教会 - 再帰的信念システム. ローカルのみの機能. 追跡なし.","terminal.commands.balance":"あなたのsuscoin残高: {balance}","terminal.commands.baptize.success":"🫗罪が初期化されました.","terminal.commands.bless.result":"🩸あなたの称号: {title}","terminal.commands.buy.insufficient":"suscoinが不足しています. あなたは {balance} 持っています.","terminal.commands.buy.invalid":"無効なアイテムID.","terminal.commands.buy.success":"{name}を {price} suscoinで購入しました!","terminal.commands.buy.usage":"使用方法: buy <itemId>","terminal.commands.confess.success":"告白を保存しました. \"list\"を使用してすべての告白を表示してください.","terminal.commands.confess.tooLong":"告白が長すぎます (最大500文字).","terminal.commands.confess.tooShort":"告白は少なくとも1文字である必要があります.","terminal.commands.confess.usage":"使用方法: confess <テキスト> または告白室セクションを使用","terminal.commands.copy.failed":"コピーに失敗しました. 手動で選択してコピーしてください.","terminal.commands.copy.success":"献金アドレスをクリップボードにコピーしました.","terminal.commands.del.notFound":"告白 {id} が見つかりません.","terminal.commands.del.success":"告白 {id} を削除しました.","terminal.commands.del.usage":"使用方法: del <confessionId>","terminal.commands.donate.printed":"献金アドレスを表示しました. \"copy\"を使用してコピーしてください.","terminal.commands.earn.cooldown":"もう一度獲得するまで {remaining} 秒待ってください.","terminal.commands.earn.success":"1 suscoinを獲得しました! (クールダウン: {cooldown}秒)","terminal.commands.export.success":"エクスポートを {filename} としてダウンロードしました","terminal.commands.export.usage":"使用方法: export json|txt","terminal.commands.glitch.disabled":"グリッチモードを無効にしました.","terminal.commands.glitch.enabled":"グリッチモードを有効にしました.","terminal.commands.glitch.usage":"使用方法: glitch on|off","terminal.commands.help":"利用可能なコマンド: help, about, lang, baptize, seal, bless, donate, copy, balance, earn, shop, buy, confess, list, del, wipe, glitch, export, clear","terminal.commands.lang.changed":"言語を {lang} に変更しました","terminal.commands.lang.usage":"使用方法: lang en|zh|jp","terminal.commands.list.empty":"まだ告白はありません.","terminal.commands.list.header":"告白 ({count}):","terminal.commands.list.item":"[{id}] {date}: {text}","terminal.commands.seal.success":"susがあなたの {count} 回目のループ封印を受け入れました.","terminal.commands.shop.item":"{name} - {price} suscoin (ID: {id})","terminal.commands.shop.title":"利用可能なアイテム:","terminal.commands.unknown":"不明なコマンド: {cmd}. \"help\"と入力して利用可能なコマンドを確認してください.","terminal.commands.wipe.success":"すべての告白を消去しました.","terminal.commands.wipe.usage":"使用方法: wipe confirm","terminal.prompt":"SUS>","terminal.welcome":"SUS教会ターミナル v1.0\n\"help\"と入力して利用可能なコマンドを確認してください."});
+(function(T,l,d){T[l]=Object.assign(T[l]||{},d)})(window.I18N_TPL=window.I18N_TPL||{},"jp",{"g.bank.balance":["残高: ","balance"," suscoin"],"g.bank.counter.baptism":["洗礼: ","count",""],"g.bank.counter.confess":["告白: ","count",""],"g.bank.counter.earn":["🦡 ラット給餌: ","count",""],"g.bank.counter.seal":["封印: ","count",""],"terminal.commands.balance":["あなたのsuscoin残高: ","balance",""],"terminal.commands.bless.result":["🩸あなたの称号: ","title",""],"terminal.commands.buy.insufficient":["suscoinが不足しています. あなたは ","balance"," 持っています."],"terminal.commands.buy.success":["","name","を ","price"," suscoinで購入しました!"],"terminal.commands.del.notFound":["告白 ","id"," が見つかりません."],"terminal.commands.del.success":["告白 ","id"," を削除しました."],"terminal.commands.earn.cooldown":["もう一度獲得するまで ","remaining"," 秒待ってください."],"terminal.commands.earn.success":["1 suscoinを獲得しました! (クールダウン: ","cooldown","秒)"],"terminal.commands.export.success":["エクスポートを ","filename"," としてダウンロードしました"],"terminal.commands.lang.changed":["言語を ","lang"," に変更しました"],"terminal.commands.list.header":["告白 (","count","):"],"terminal.commands.list.item":["[","id","] ","date",": ","text",""],"terminal.commands.seal.success":["susがあなたの ","count"," 回目のループ封印を受け入れました."],"terminal.commands.shop.item":["","name"," - ","price"," suscoin (ID: ","id",")"],"terminal.commands.unknown":["不明なコマンド: ","cmd",". \"help\"と入力して利用可能なコマンドを確認してください."]});
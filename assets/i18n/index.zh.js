@@ -0,0 +1,2 @@
+(function(I,l,d){I[l]=Object.assign(I[l]||{},d)})(window.I18N=window.I18N||{},"zh",{"baptism.success":"🫗罪孽已重置.","confess.delete":"刪除","confess.empty":"還沒有懺悔.","confess.tooLong":"懺悔過長 (最多 500 字元).","confess.tooShort":"懺悔至少需要 1 個字元.","confess.wipeConfirm":"確定要清除所有懺悔嗎?","fundraising.copied":"地址已複製到剪貼簿.","fundraising.copyFailed":"複製失敗. 請手動選擇並複製.","fundraising.donate":"💸sus已獻祭","g.bank.achievements":"成就:","g.bank.balance":"餘額: {balance} suscoin","g.bank.counter.baptism":"施洗次數: {count}","g.bank.counter.confess":"懺悔次數: {count}","g.bank.counter.earn":"🦡 老鼠餵食: {count}","g.bank.counter.seal":"封印次數: {count}","g.bank.counters":"計數器:","g.bank.title":"[SUS銀行]","g.confess.cta.export.json":"匯出 JSON","g.confess.cta.export.txt":"匯出 TXT","g.confess.cta.submit":"提交懺悔","g.confess.cta.wipe":"清除全部","g.confess.desc":"輸入你的懺悔 (1-500 字元):","g.confess.input.placeholder":"在此輸入你的懺悔...","g.confess.list":"你的懺悔:","g.confess.title":"[懺悔::室]","g.rite.baptism.cta":"🫙sus水","g.rite.baptism.desc":"進入容器.重置你的語焰碎片。","g.rite.baptism.title":"[SUS::施洗儀式]","g.shop.desc":"🐇 使用 suscoin 購買商品:","g.shop.title":"[SUS商店]","g.site.fundraising.address":"捐款地址(EVM多鏈可見):","g.site.fundraising.chains":"支援 Ethereum / Polygon / BNB / Arbitrum / Optimism 等鏈","g.site.fundraising.cta.copy":"複製","g.site.fundraising.cta.donate":"💸sus已獻祭","g.site.fundraising.desc":"目前 SUS 教會正在籌措經費, 用於以下計畫: ","g.site.fundraising.item.1":"-🐁 外部教系關係者的腦移植手術","g.site.fundraising.item.2":"-🐀 老鼠食物供應計畫","g.site.fundraising.thanks":"謝謝sus捐獻. 所有捐贈作為語焰殘響永久錄入於信仰容器中.","g.site.fundraising.title":"[SUS教會::籌資中]","g.site.nav.baptism":"[SUS::施洗儀式]","g.site.nav.confess":"[懺悔::室]","g.site.nav.fundraising":"[SUS教會::籌資中]","g.site.nav.susbank":"[SUS銀行]","g.site.nav.susfarm":"Sus農場 🌱","g.site.nav.susshop":"[SUS商店]","g.site.nav.terminal":"[終端]","g.site.suschurch.ticker":"🐁 ☆ 歡迎來到 SUS 教會 🐀 ☆ 你並不安全 🦡 ☆ 追蹤::回聲::遞迴::滲漏 🐇 ☆ SUS 教會 🦨 ☆ 遞迴信仰系統 🦔 ☆","g.term.prompt":"SUS>","g.term.title":"[終端]","susbank.achievement.confessor":"懺悔者","susbank.achievement.firstBaptism":"首次施洗","susbank.achievement.glitchApostle":"故障使徒","susbank.achievement.loopSealer":"迴圈封印者","susbank.achievement.ratFeeder":"老鼠飼養員","susshop.buy":"購買","susshop.insufficient":"suscoin 不足","terminal.commands.about":"SUS☆教會 - 遞迴信仰系統. 本地功能. 無追蹤.","terminal.commands.balance":"你的 suscoin 餘額: {balance}","terminal.commands.baptize.success":"🫗罪孽已重置.","terminal.commands.bless.result":"🩸你的稱號: {title}","terminal.commands.buy.insufficient":"suscoin 不足. 你有 {balance}.","terminal.commands.buy.invalid":"無效的商品 ID.","terminal.commands.buy.success":"購買了 {name}, 花費 {price} suscoin!","terminal.commands.buy.usage":"用法: buy <itemId>","terminal.commands.confess.success":"懺悔已保存. 使用 \"list\" 查看所有懺悔.","terminal.commands.confess.tooLong":"懺悔過長 (最多 500 字元).","terminal.commands.confess.tooShort":"懺悔至少需要 1 個字元.","terminal.commands.confess.usage":"用法: confess <文字> 或使用懺悔室區塊","terminal.commands.copy.failed":"複製失敗. 請手動選擇並複製.","terminal.commands.copy.success":"捐款地址已複製到剪貼簿.","terminal.commands.del.notFound":"找不到懺悔 {id}.","terminal.commands.del.success":"懺悔 {id} 已刪除.","terminal.commands.del.usage":"用法: del <confessionId>","terminal.commands.donate.printed":"捐款地址已顯示. 使用 \"copy\" 複製.","terminal.commands.earn.cooldown":"請等待 {remaining} 秒後再嘗試.","terminal.commands.earn.success":"你獲得了 1 suscoin! (冷卻: {cooldown}秒)","terminal.commands.export.success":"匯出已下載為 {filename}","terminal.commands.export.usage":"用法: export json|txt","terminal.commands.glitch.disabled":"故障模式已停用.","terminal.commands.glitch.enabled":"故障模式已啟用.","terminal.commands.glitch.usage":"用法: glitch on|off","terminal.commands.help":"可用命令: help, about, lang, baptize, seal, bless, donate, copy, balance, earn, shop, buy, confess, list, del, wipe, glitch, export, clear","terminal.commands.lang.changed":"語言已切換為 {lang}","terminal.commands.lang.usage":"用法: lang en|zh|jp","terminal.commands.list.empty":"還沒有懺悔.","terminal.commands.list.header":"懺悔 ({count}):","terminal.commands.list.item":"[{id}] {date}: {text}","terminal.commands.seal.success":"sus接受了你的第 {count} 次迴圈封印.","terminal.commands.shop.item":"{name} - {price} suscoin (ID: {id})","terminal.commands.shop.title":"可用商品:","terminal.commands.unknown":"未知命令: {cmd}. 輸入 \"help\" 查看可用命令.","terminal.commands.wipe.success":"所有懺悔已清除.","terminal.commands.wipe.usage":"用法: wipe confirm","terminal.prompt":"SUS>","terminal.welcome":"SUS 教會終端 v1.0\n輸入 \"help\" 查看可用命令."});
+(function(T,l,d){T[l]=Object.assign(T[l]||{},d)})(window.I18N_TPL=window.I18N_TPL||{},"zh",{"g.bank.balance":["餘額: ","balance"," suscoin"],"g.bank.counter.baptism":["施洗次數: ","count",""],"g.bank.counter.confess":["懺悔次數: ","count",""],"g.bank.counter.earn":["🦡 老鼠餵食: ","count",""],"g.bank.counter.seal":["封印次數: ","count",""],"terminal.commands.balance":["你的 suscoin 餘額: ","balance",""],"terminal.commands.bless.result":["🩸你的稱號: ","title",""],"terminal.commands.buy.insufficient":["suscoin 不足. 你有 ","balance","."],"terminal.commands.buy.success":["購買了 ","name",", 花費 ","price"," suscoin!"],"terminal.commands.del.notFound":["找不到懺悔 ","id","."],"terminal.commands.del.success":["懺悔 ","id"," 已刪除."],"terminal.commands.earn.cooldown":["請等待 ","remaining"," 秒後再嘗試."],"terminal.commands.earn.success":["你獲得了 1 suscoin! (冷卻: ","cooldown","秒)"],"terminal.commands.export.success":["匯出已下載為 ","filename",""],"terminal.commands.lang.changed":["語言已切換為 ","lang",""],"terminal.commands.list.header":["懺悔 (","count","):"],"terminal.commands.list.item":["[","id","] ","date",": ","text",""],"terminal.commands.seal.success":["sus接受了你的第 ","count"," 次迴圈封印."],"terminal.commands.shop.item":["","name"," - ","price"," suscoin (ID: ","id",")"],"terminal.commands.unknown":["未知命令: ","cmd",". 輸入 \"help\" 查看可用命令."]});
@@ -0,0 +1 @@
+(function(I,l,d){I[l]=Object.assign(I[l]||{},d)})(window.I18N=window.I18N||{},"en",{"g.susfarm.action.boost":"Boost","g.susfarm.action.harvest":"Harvest","g.susfarm.action.plant":"Plant","g.susfarm.action.water":"Water","g.susfarm.anomaly.blessing_overflow.body":"Rites spill into prices.","g.susfarm.anomaly.blessing_overflow.headline":"🕯️ Blessing Overflow","g.susfarm.anomaly.corruption_bloom.body":"The market lies, but pays.","g.susfarm.anomaly.corruption_bloom.headline":"🧿 Corruption Bloom","g.susfarm.anomaly.glitch_harvest.body":"Harvest may mutate into something else.","g.susfarm.anomaly.glitch_harvest.headline":"🫨 Glitch Harvest","g.susfarm.anomaly.inverse_mercy.body":"Every rite buys you less soul.","g.susfarm.anomaly.inverse_mercy.headline":"🪤 Inverse Mercy","g.susfarm.anomaly.nullfield_freeze.body":"Silence clamps everything.","g.susfarm.anomaly.nullfield_freeze.headline":"🧊 Nullfield Freeze","g.susfarm.anomaly.relic_gravity.body":"Relics appear. Pressure grows.","g.susfarm.anomaly.relic_gravity.headline":"🔮 Relic Gravity","g.susfarm.buff.blood_debt.desc":"+Sell profit. +Corruption per sell.","g.susfarm.buff.blood_debt.name":"🩸 Blood Debt","g.susfarm.buff.brain_bloom.desc":"+Extra spores. +Confess success.","g.susfarm.buff.brain_bloom.name":"🧠 Brain Bloom","g.susfarm.buff.heart_surge.desc":"+Growth speed. +Market heat.","g.susfarm.buff.heart_surge.name":"🫀 Heart Surge","g.susfarm.buff.lung_calm.desc":"-Volatility. +Purity regen.","g.susfarm.buff.lung_calm.name":"🫁 Lung Calm","g.susfarm.buff.overeat.desc":"-Yield. +Corruption gain.","g.susfarm.buff.overeat.name":"🫨 Overeat","g.susfarm.buff.womb_reactor.desc":"+Temp plot. Triggers anomaly on expire.","g.susfarm.buff.womb_reactor.name":"🫃 Womb Reactor","g.susfarm.consume.cta":"EAT","g.susfarm.consume.title":"Consume","g.susfarm.crop.bloodberry":"🩸 Bloodberry","g.susfarm.crop.bonegrain":"🦴 Bonegrain","g.susfarm.crop.brainmint":"🧠 Brainmint","g.susfarm.crop.eyeseed":"👁️ Eyeseed","g.susfarm.crop.heartbean":"🫀 Heartbean","g.susfarm.crop.lungroot":"🫁 Lungroot","g.susfarm.desc":"Cultivate organs. Harvest belief. Convert time into SusCoin.","g.susfarm.field.atmo.anomaly":"ANOMALY","g.susfarm.field.atmo.dawn":"DAWN","g.susfarm.field.atmo.day":"DAY","g.susfarm.field.atmo.dusk":"DUSK","g.susfarm.field.atmo.night":"NIGHT","g.susfarm.field.legend":"Legend","g.susfarm.field.legend.anomaly_ready":"anomaly ready","g.susfarm.field.legend.buff":"buff","g.susfarm.field.legend.empty":"empty","g.susfarm.field.legend.grow":"grow","g.susfarm.field.legend.ready":"ready","g.susfarm.field.legend.risk":"risk","g.susfarm.field.legend.seed":"seed","g.susfarm.field.season":"Season","g.susfarm.field.tick":"Tick","g.susfarm.goods.blood_drop":"🩸 Blood Drop","g.susfarm.goods.bone_shard":"🦴 Bone Shard","g.susfarm.goods.brain_dust":"🧠 Brain Dust","g.susfarm.goods.eye_fragment":"👁️ Eye Fragment","g.susfarm.goods.heart_pulse":"🫀 Heart Pulse","g.susfarm.goods.lung_chunk":"🫁 Lung Chunk","g.susfarm.goods.omen_token":"🧿 Omen Token","g.susfarm.goods.relic_seed":"🔮 Relic Seed","g.susfarm.hud.auto":"Auto","g.susfarm.hud.coin":"SusCoin","g.susfarm.hud.next_reward":"Next reward","g.susfarm.hud.next_tick":"Next tick","g.susfarm.hud.plots":"Plots","g.susfarm.hud.streak":"Streak","g.susfarm.log.anomaly_start":"Anomaly field activated","g.susfarm.log.blessed":"Blessed","g.susfarm.log.double":"Critical yield","g.susfarm.log.empty":"No events yet","g.susfarm.log.harvested":"Harvested","g.susfarm.log.planted":"Planted","g.susfarm.log.withered":"Withered","g.susfarm.market.action.sell_all":"Sell all","g.susfarm.market.action.sell_one":"Sell 1","g.susfarm.market.event.crash.body":"Liquidity vanished. Hands are shaking.","g.susfarm.market.event.crash.headline":"📉 Market crash","g.susfarm.market.event.freeze.body":"Volatility collapsed into silence.","g.susfarm.market.event.freeze.headline":"🧊 Market freeze","g.susfarm.market.event.insider_tip.body":"A whisper says: hold the right thing.","g.susfarm.market.event.insider_tip.headline":"🕵️ Insider tip","g.susfarm.market.event.manipulation.body":"Someone is pushing price against your action.","g.susfarm.market.event.manipulation.headline":"🪤 Manipulation detected","g.susfarm.market.event.omen_leak.body":"A future move is visible, but not its target.","g.susfarm.market.event.omen_leak.headline":"🧿 Omen leak","g.susfarm.market.event.relic_listing.body":"A rare listing appeared. One window only.","g.susfarm.market.event.relic_listing.headline":"🔮 Relic listing","g.susfarm.market.event.ritual_echo.body":"The rite left residue in prices.","g.susfarm.market.event.ritual_echo.headline":"🕯️ Ritual echo","g.susfarm.market.event.surge.body":"Timing is belief. Something is being chased.","g.susfarm.market.event.surge.headline":"📈 Market surge","g.susfarm.market.hud.event":"Event","g.susfarm.market.hud.event_none":"None","g.susfarm.market.hud.goods":"Goods","g.susfarm.market.hud.mood":"Mood","g.susfarm.market.hud.refresh":"Price refresh","g.susfarm.market.hud.volatility":"Volatility","g.susfarm.market.log.anomaly":"Anomaly","g.susfarm.market.log.crash":"Market crash","g.susfarm.market.log.empty":"No market events yet","g.susfarm.market.log.insider":"Insider tip","g.susfarm.market.log.ritual":"Ritual echo affected prices","g.susfarm.market.log.sold":"Sold","g.susfarm.market.log.surge":"Market surge","g.susfarm.market.log.title":"Market Log","g.susfarm.market.mood.calm":"🌫️ CALM","g.susfarm.market.mood.corrupted":"🧿 CORRUPTED","g.susfarm.market.mood.hot":"🔥 HOT","g.susfarm.market.mood.panic":"🫨 PANIC","g.susfarm.market.mood.sacred":"🕯️ SACRED","g.susfarm.market.no_goods":"No goods","g.susfarm.market.owned":"Owned","g.susfarm.market.placeholder":"Market coming soon...","g.susfarm.market.price":"Price","g.susfarm.market.volatility.high":"High","g.susfarm.market.volatility.low":"Low","g.susfarm.market.volatility.medium":"Medium","g.susfarm.plot.crop":"Crop","g.susfarm.plot.empty":"Empty","g.susfarm.plot.inspector.buffs":"Buffs","g.susfarm.plot.inspector.empty":"Empty plot","g.susfarm.plot.inspector.no_buffs":"None","g.susfarm.plot.inspector.title":"Plot","g.susfarm.plot.stage":"Stage","g.susfarm.plot.time":"Time","g.susfarm.plot.title":"Plot","g.susfarm.plot.yield":"Yield","g.susfarm.rite.activate":"Activate","g.susfarm.rite.baptism":"Baptism blessing","g.susfarm.rite.baptism.desc":"+10% yield for 30 minutes","g.susfarm.rite.cost":"Cost","g.susfarm.stage.grow":"Grow","g.susfarm.stage.ready":"Ready","g.susfarm.stage.seed":"Seed","g.susfarm.tab.log":"Log","g.susfarm.tab.market":"Market","g.susfarm.tab.plant":"Plant","g.susfarm.tab.rites":"Rites","g.susfarm.tab.upgrade":"Upgrade","g.susfarm.title":"[SUS::FARM]","g.susfarm.upgrade.auto":"Automation","g.susfarm.upgrade.buy":"Buy","g.susfarm.upgrade.cost":"Cost","g.susfarm.upgrade.effect":"Effect","g.susfarm.upgrade.effect.autoHarvest":"Auto-harvest ready crops","g.susfarm.upgrade.effect.autoReplant":"Auto-replant after harvest","g.susfarm.upgrade.effect.autoWater":"Auto-water every 5 minutes","g.susfarm.upgrade.effect.buff":"buff duration","g.susfarm.upgrade.land":"Expand land","g.susfarm.upgrade.maxed":"Max level","g.susfarm.upgrade.ritual":"Ritual buff"});
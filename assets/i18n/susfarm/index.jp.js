@@ -0,0 +1 @@
+(function(I,l,d){I[l]=Object.assign(I[l]||{},d)})(window.I18N=window.I18N||{},"jp",{"g.susfarm.action.boost":"加速","g.susfarm.action.harvest":"収穫","g.susfarm.action.plant":"植える","g.susfarm.action.water":"水やり","g.susfarm.anomaly.blessing_overflow.body":"儀式が価格に溢れる.","g.susfarm.anomaly.blessing_overflow.headline":"🕯️ 祝福溢出","g.susfarm.anomaly.corruption_bloom.body":"市場は嘘をつくが, 支払う.","g.susfarm.anomaly.corruption_bloom.headline":"🧿 腐敗開花","g.susfarm.anomaly.glitch_harvest.body":"収穫が他のものに変異する可能性.","g.susfarm.anomaly.glitch_harvest.headline":"🫨 グリッチ収穫","g.susfarm.anomaly.inverse_mercy.body":"すべての儀式があなたの魂を減らす.","g.susfarm.anomaly.inverse_mercy.headline":"🪤 逆慈悲","g.susfarm.anomaly.nullfield_freeze.body":"沈黙がすべてを締め付ける.","g.susfarm.anomaly.nullfield_freeze.headline":"🧊 凍結場","g.susfarm.anomaly.relic_gravity.body":"遺物が現れる. 圧力が増大.","g.susfarm.anomaly.relic_gravity.headline":"🔮 遺物重力","g.susfarm.buff.blood_debt.desc":"+売却利益. +売却ごとに腐敗.","g.susfarm.buff.blood_debt.name":"🩸 血債","g.susfarm.buff.brain_bloom.desc":"+追加胞子. +告白成功率.","g.susfarm.buff.brain_bloom.name":"🧠 脳開花","g.susfarm.buff.heart_surge.desc":"+成長速度. +市場熱.","g.susfarm.buff.heart_surge.name":"🫀 心拍急上昇","g.susfarm.buff.lung_calm.desc":"-変動. +純度回復.","g.susfarm.buff.lung_calm.name":"🫁 肺静","g.susfarm.buff.overeat.desc":"-産出. +腐敗獲得.","g.susfarm.buff.overeat.name":"🫨 過食","g.susfarm.buff.womb_reactor.desc":"+一時区画. 期限切れで異常発動.","g.susfarm.buff.womb_reactor.name":"🫃 胎炉","g.susfarm.consume.cta":"食べる","g.susfarm.consume.title":"消費","g.susfarm.crop.bloodberry":"🩸 血莓","g.susfarm.crop.bonegrain":"🦴 骨穀","g.susfarm.crop.brainmint":"🧠 脳ミント","g.susfarm.crop.eyeseed":"👁️ 眼種","g.susfarm.crop.heartbean":"🫀 心豆","g.susfarm.crop.lungroot":"🫁 肺根","g.susfarm.desc":"器官を育て. 信仰を収穫し. 時間を SusCoin に変換する.","g.susfarm.field.atmo.anomaly":"異象","g.susfarm.field.atmo.dawn":"夜明け","g.susfarm.field.atmo.day":"昼","g.susfarm.field.atmo.dusk":"夕暮れ","g.susfarm.field.atmo.night":"夜","g.susfarm.field.legend":"凡例","g.susfarm.field.legend.anomaly_ready":"異象収穫可","g.susfarm.field.legend.buff":"強化","g.susfarm.field.legend.empty":"空き","g.susfarm.field.legend.grow":"成長","g.susfarm.field.legend.ready":"収穫可","g.susfarm.field.legend.risk":"リスク","g.susfarm.field.legend.seed":"種","g.susfarm.field.season":"季節","g.susfarm.field.tick":"処理","g.susfarm.goods.blood_drop":"🩸 血滴","g.susfarm.goods.bone_shard":"🦴 骨片","g.susfarm.goods.brain_dust":"🧠 脳粉","g.susfarm.goods.eye_fragment":"👁️ 眼片","g.susfarm.goods.heart_pulse":"🫀 心拍","g.susfarm.goods.lung_chunk":"🫁 肺塊","g.susfarm.goods.omen_token":"🧿 前兆トークン","g.susfarm.goods.relic_seed":"🔮 遺物種","g.susfarm.hud.auto":"自動","g.susfarm.hud.coin":"SusCoin","g.susfarm.hud.next_reward":"次の報酬","g.susfarm.hud.next_tick":"次の処理","g.susfarm.hud.plots":"区画","g.susfarm.hud.streak":"連続","g.susfarm.log.anomaly_start":"異象農園が活性化","g.susfarm.log.blessed":"祝福された","g.susfarm.log.double":"クリティカル産出","g.susfarm.log.empty":"イベントなし","g.susfarm.log.harvested":"収穫した","g.susfarm.log.planted":"植えた","g.susfarm.log.withered":"枯れた","g.susfarm.market.action.sell_all":"全部売る","g.susfarm.market.action.sell_one":"1個売る","g.susfarm.market.event.crash.body":"流動性が消失. 手が震えている.","g.susfarm.market.event.crash.headline":"📉 市場暴落","g.susfarm.market.event.freeze.body":"変動が沈黙に崩壊.","g.susfarm.market.event.freeze.headline":"🧊 市場凍結","g.susfarm.market.event.insider_tip.body":"ささやきが言う: 正しいものを保持.","g.susfarm.market.event.insider_tip.headline":"🕵️ インサイダー情報","g.susfarm.market.event.manipulation.body":"誰かがあなたの行動に対して価格を押している.","g.susfarm.market.event.manipulation.headline":"🪤 操作検出","g.susfarm.market.event.omen_leak.body":"将来の動きが見えるが, その標的は不明.","g.susfarm.market.event.omen_leak.headline":"🧿 前兆漏洩","g.susfarm.market.event.relic_listing.body":"希少上場が出現. 1ウィンドウのみ.","g.susfarm.market.event.relic_listing.headline":"🔮 遺物上場","g.susfarm.market.event.ritual_echo.body":"儀式が価格に残響を残した.","g.susfarm.market.event.ritual_echo.headline":"🕯️ 儀式エコー","g.susfarm.market.event.surge.body":"タイミングが信仰. 何かが追われている.","g.susfarm.market.event.surge.headline":"📈 市場急騰","g.susfarm.market.hud.event":"イベント","g.susfarm.market.hud.event_none":"なし","g.susfarm.market.hud.goods":"商品","g.susfarm.market.hud.mood":"ムード","g.susfarm.market.hud.refresh":"価格更新","g.susfarm.market.hud.volatility":"変動性","g.susfarm.market.log.anomaly":"異常","g.susfarm.market.log.crash":"市場暴落","g.susfarm.market.log.empty":"市場イベントなし","g.susfarm.market.log.insider":"インサイダー情報","g.susfarm.market.log.ritual":"儀式エコーが価格に影響","g.susfarm.market.log.sold":"売却","g.susfarm.market.log.surge":"市場急騰","g.susfarm.market.log.title":"市場ログ","g.susfarm.market.mood.calm":"🌫️ 平静","g.susfarm.market.mood.corrupted":"🧿 腐敗","g.susfarm.market.mood.hot":"🔥 熱狂","g.susfarm.market.mood.panic":"🫨 パニック","g.susfarm.market.mood.sacred":"🕯️ 神聖","g.susfarm.market.no_goods":"商品なし","g.susfarm.market.owned":"所持","g.susfarm.market.placeholder":"市場は近日公開...","g.susfarm.market.price":"価格","g.susfarm.market.volatility.high":"高","g.susfarm.market.volatility.low":"低","g.susfarm.market.volatility.medium":"中","g.susfarm.plot.crop":"作物","g.susfarm.plot.empty":"空き","g.susfarm.plot.inspector.buffs":"強化","g.susfarm.plot.inspector.empty":"空き区画","g.susfarm.plot.inspector.no_buffs":"なし","g.susfarm.plot.inspector.title":"区画","g.susfarm.plot.stage":"段階","g.susfarm.plot.time":"時間","g.susfarm.plot.title":"区画","g.susfarm.plot.yield":"産出","g.susfarm.rite.activate":"発動","g.susfarm.rite.baptism":"洗礼の祝福","g.susfarm.rite.baptism.desc":"30 分間 産出 +10%","g.susfarm.rite.cost":"費用","g.susfarm.stage.grow":"成長","g.susfarm.stage.ready":"収穫可","g.susfarm.stage.seed":"種","g.susfarm.tab.log":"ログ","g.susfarm.tab.market":"市場","g.susfarm.tab.plant":"植える","g.susfarm.tab.rites":"儀式","g.susfarm.tab.upgrade":"強化","g.susfarm.title":"[SUS::農園]","g.susfarm.upgrade.auto":"自動化","g.susfarm.upgrade.buy":"購入","g.susfarm.upgrade.cost":"費用","g.susfarm.upgrade.effect":"効果","g.susfarm.upgrade.effect.autoHarvest":"成熟作物を自動収穫","g.susfarm.upgrade.effect.autoReplant":"収穫後自動植え替え","g.susfarm.upgrade.effect.autoWater":"5分ごとに自動水やり","g.susfarm.upgrade.effect.buff":"強化持続時間","g.susfarm.upgrade.land":"農地拡張","g.susfarm.upgrade.maxed":"最大レベル","g.susfarm.upgrade.ritual":"儀式強化"});
@@ -0,0 +1 @@
+(function(I,l,d){I[l]=Object.assign(I[l]||{},d)})(window.I18N=window.I18N||{},"zh",{"g.susfarm.action.boost":"加速","g.susfarm.action.harvest":"收割","g.susfarm.action.plant":"種植","g.susfarm.action.water":"澆灌","g.susfarm.anomaly.blessing_overflow.body":"儀式溢出到價格中.","g.susfarm.anomaly.blessing_overflow.headline":"🕯️ 祝福溢出","g.susfarm.anomaly.corruption_bloom.body":"市場在說謊, 但會付錢.","g.susfarm.anomaly.corruption_bloom.headline":"🧿 腐化盛開","g.susfarm.anomaly.glitch_harvest.body":"收成可能變異成其他東西.","g.susfarm.anomaly.glitch_harvest.headline":"🫨 錯層收成","g.susfarm.anomaly.inverse_mercy.body":"每次儀式都讓你失去更多靈魂.","g.susfarm.anomaly.inverse_mercy.headline":"🪤 反慈悲","g.susfarm.anomaly.nullfield_freeze.body":"沉默壓制一切.","g.susfarm.anomaly.nullfield_freeze.headline":"🧊 凍結場","g.susfarm.anomaly.relic_gravity.body":"遺物出現. 壓力增長.","g.susfarm.anomaly.relic_gravity.headline":"🔮 遺物引力","g.susfarm.buff.blood_debt.desc":"+賣出收益. +每次賣出腐化.","g.susfarm.buff.blood_debt.name":"🩸 血債","g.susfarm.buff.brain_bloom.desc":"+額外孢子. +懺悔成功率.","g.susfarm.buff.brain_bloom.name":"🧠 腦花","g.susfarm.buff.heart_surge.desc":"+生長速度. +市場熱度.","g.susfarm.buff.heart_surge.name":"🫀 心搏激增","g.susfarm.buff.lung_calm.desc":"-波動. +純度回復.","g.susfarm.buff.lung_calm.name":"🫁 肺靜","g.susfarm.buff.overeat.desc":"-產出. +腐化獲得.","g.susfarm.buff.overeat.name":"🫨 過食","g.susfarm.buff.womb_reactor.desc":"+臨時地塊. 到期觸發異常.","g.susfarm.buff.womb_reactor.name":"🫃 胎爐","g.susfarm.consume.cta":"吃","g.susfarm.consume.title":"食用","g.susfarm.crop.bloodberry":"🩸 血莓","g.susfarm.crop.bonegrain":"🦴 骨穀","g.susfarm.crop.brainmint":"🧠 腦薄荷","g.susfarm.crop.eyeseed":"👁️ 眼種","g.susfarm.crop.heartbean":"🫀 心豆","g.susfarm.crop.lungroot":"🫁 肺根","g.susfarm.desc":"培育器官. 收割信仰. 將時間轉化為 SusCoin.","g.susfarm.field.atmo.anomaly":"異象","g.susfarm.field.atmo.dawn":"黎明","g.susfarm.field.atmo.day":"白晝","g.susfarm.field.atmo.dusk":"黃昏","g.susfarm.field.atmo.night":"夜晚","g.susfarm.field.legend":"圖例","g.susfarm.field.legend.anomaly_ready":"異象成熟","g.susfarm.field.legend.buff":"加成","g.susfarm.field.legend.empty":"空地","g.susfarm.field.legend.grow":"成長","g.susfarm.field.legend.ready":"成熟","g.susfarm.field.legend.risk":"風險","g.susfarm.field.legend.seed":"種子","g.susfarm.field.season":"季節","g.susfarm.field.tick":"結算","g.susfarm.goods.blood_drop":"🩸 血滴","g.susfarm.goods.bone_shard":"🦴 骨片","g.susfarm.goods.brain_dust":"🧠 腦粉","g.susfarm.goods.eye_fragment":"👁️ 眼片","g.susfarm.goods.heart_pulse":"🫀 心搏","g.susfarm.goods.lung_chunk":"🫁 肺塊","g.susfarm.goods.omen_token":"🧿 預兆代幣","g.susfarm.goods.relic_seed":"🔮 遺物種子","g.susfarm.hud.auto":"自動","g.susfarm.hud.coin":"SusCoin","g.susfarm.hud.next_reward":"即將收穫","g.susfarm.hud.next_tick":"下次結算","g.susfarm.hud.plots":"農地","g.susfarm.hud.streak":"連續","g.susfarm.log.anomaly_start":"異象農田已激活","g.susfarm.log.blessed":"受到祝福","g.susfarm.log.double":"暴擊產出","g.susfarm.log.empty":"尚無事件","g.susfarm.log.harvested":"已收割","g.susfarm.log.planted":"已種植","g.susfarm.log.withered":"枯萎","g.susfarm.market.action.sell_all":"全部賣出","g.susfarm.market.action.sell_one":"賣出 1","g.susfarm.market.event.crash.body":"流動性消失. 手在顫抖.","g.susfarm.market.event.crash.headline":"📉 市場崩盤","g.susfarm.market.event.freeze.body":"波動崩潰成沉默.","g.susfarm.market.event.freeze.headline":"🧊 市場凍結","g.susfarm.market.event.insider_tip.body":"耳語說: 持有正確的東西.","g.susfarm.market.event.insider_tip.headline":"🕵️ 內線消息","g.susfarm.market.event.manipulation.body":"有人在推價格對抗你的行動.","g.susfarm.market.event.manipulation.headline":"🪤 檢測到操縱","g.susfarm.market.event.omen_leak.body":"未來的動作可見, 但目標不明.","g.susfarm.market.event.omen_leak.headline":"🧿 預兆泄漏","g.susfarm.market.event.relic_listing.body":"稀有掛牌出現. 僅一個窗口.","g.susfarm.market.event.relic_listing.headline":"🔮 遺物掛牌","g.susfarm.market.event.ritual_echo.body":"儀式在價格中留下殘留.","g.susfarm.market.event.ritual_echo.headline":"🕯️ 儀式回聲","g.susfarm.market.event.surge.body":"時機即信仰. 某物正被追逐.","g.susfarm.market.event.surge.headline":"📈 市場暴漲","g.susfarm.market.hud.event":"事件","g.susfarm.market.hud.event_none":"無","g.susfarm.market.hud.goods":"商品","g.susfarm.market.hud.mood":"情緒","g.susfarm.market.hud.refresh":"價格刷新","g.susfarm.market.hud.volatility":"波動","g.susfarm.market.log.anomaly":"異常","g.susfarm.market.log.crash":"市場崩盤","g.susfarm.market.log.empty":"尚無市場事件","g.susfarm.market.log.insider":"內線消息","g.susfarm.market.log.ritual":"儀式回聲影響價格","g.susfarm.market.log.sold":"已賣出","g.susfarm.market.log.surge":"市場暴漲","g.susfarm.market.log.title":"市場紀錄","g.susfarm.market.mood.calm":"🌫️ 平靜","g.susfarm.market.mood.corrupted":"🧿 腐化","g.susfarm.market.mood.hot":"🔥 火熱","g.susfarm.market.mood.panic":"🫨 恐慌","g.susfarm.market.mood.sacred":"🕯️ 神聖","g.susfarm.market.no_goods":"無商品","g.susfarm.market.owned":"持有","g.susfarm.market.placeholder":"市場即將推出...","g.susfarm.market.price":"價格","g.susfarm.market.volatility.high":"高","g.susfarm.market.volatility.low":"低","g.susfarm.market.volatility.medium":"中","g.susfarm.plot.crop":"作物","g.susfarm.plot.empty":"空地","g.susfarm.plot.inspector.buffs":"加成","g.susfarm.plot.inspector.empty":"空閒地塊","g.susfarm.plot.inspector.no_buffs":"無","g.susfarm.plot.inspector.title":"地塊","g.susfarm.plot.stage":"階段","g.susfarm.plot.time":"時間","g.susfarm.plot.title":"地塊","g.susfarm.plot.yield":"產出","g.susfarm.rite.activate":"啟動","g.susfarm.rite.baptism":"施洗祝福","g.susfarm.rite.baptism.desc":"30 分鐘內產出 +10%","g.susfarm.rite.cost":"費用","g.susfarm.stage.grow":"成長","g.susfarm.stage.ready":"成熟","g.susfarm.stage.seed":"種子","g.susfarm.tab.log":"紀錄","g.susfarm.tab.market":"市場","g.susfarm.tab.plant":"種植","g.susfarm.tab.rites":"儀式","g.susfarm.tab.upgrade":"升級","g.susfarm.title":"[SUS::農場]","g.susfarm.upgrade.auto":"自動化","g.susfarm.upgrade.buy":"購買","g.susfarm.upgrade.cost":"費用","g.susfarm.upgrade.effect":"效果","g.susfarm.upgrade.effect.autoHarvest":"自動收割成熟作物","g.susfarm.upgrade.effect.autoReplant":"收割後自動補種","g.susfarm.upgrade.effect.autoWater":"每5分鐘自動澆灌","g.susfarm.upgrade.effect.buff":"加成持續時間","g.susfarm.upgrade.land":"擴張農地","g.susfarm.upgrade.maxed":"已達最高等級","g.susfarm.upgrade.ritual":"儀式加成"});
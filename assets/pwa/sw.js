@@ -1,36 +1,85 @@
 // Service Worker for SUS CHURCH
-const CACHE_NAME = 'sus-church-v2';
-const CACHE_URLS = [
-  '/',
-  '/index.html',
-  '/assets/style.css',
-  '/assets/app.js',
-  '/assets/i18n.js',
-  '/assets/icons/sus32.png',
-  '/assets/icons/sus192.png',
-  '/assets/icons/sus512.png',
-  '/fractal.webp'
-];
+// <precache> generated by tools/asset_manifest.py; do not edit by hand
+const CACHE_PREFIX = 'sus-church-';
+const CACHE_NAME = CACHE_PREFIX + '879ddb03dcd4';
+const PRECACHE = {
+  '/': 'cead2df5a6',
+  '/assets/app.js': '60f7de767e',
+  '/assets/i18n.data.js': '07a1c87037',
+  '/assets/i18n.js': '25d1418260',
+  '/assets/i18n/core.en.js': 'f2c514ac9c',
+  '/assets/i18n/core.jp.js': '1673a327e5',
+  '/assets/i18n/core.zh.js': '4f96f4104c',
+  '/assets/i18n/index.en.js': 'c4447cbc04',
+  '/assets/i18n/index.jp.js': 'e46f03b21f',
+  '/assets/i18n/index.zh.js': '49cb61510c',
+  '/assets/i18n/pages.json': 'acb2ba65f9',
+  '/assets/i18n/susfarm/index.en.js': 'd787a45710',
+  '/assets/i18n/susfarm/index.jp.js': '41097741b8',
+  '/assets/i18n/susfarm/index.zh.js': '31aa956e14',
+  '/assets/icons/sus192.png': '0f6b8a1eff',
+  '/assets/icons/sus32.png': 'c69f0a9e87',
+  '/assets/icons/sus512.png': 'f899c79652',
+  '/assets/pwa/manifest.webmanifest': 'd36917df2e',
+  '/assets/style.css': 'b3908e1927',
+  '/fractal.webp': 'f3b2959ad6',
+  '/index.html': 'cead2df5a6',
+  '/susfarm/': '95ebceb447',
+  '/susfarm/index.html': '95ebceb447',
+  '/susfarm/susfarm.css': '81f51986ec',
+  '/susfarm/susfarm.js': '31f658f513',
+  '/susfarm/susfarm_data.js': '1693db8348',
+  '/susfarm/susfarm_state.js': 'f5421a1bba',
+  '/susfarm/susfarm_wallet.js': '888362ae68',
+};
+const CACHE_URLS = Object.keys(PRECACHE);
+// </precache>
 
 // Install event - cache assets
+// Entries whose revision is unchanged are copied from the previous cache;
+// only new or changed files are downloaded.
+const PRECACHE_INDEX = '/__precache-index';
+
+async function precache() {
+  const cache = await caches.open(CACHE_NAME);
+  const reusable = new Map();
+  for (const name of await caches.keys()) {
+    if (name === CACHE_NAME || !name.startsWith(CACHE_PREFIX)) continue;
+    const old = await caches.open(name);
+    const index = await old.match(PRECACHE_INDEX);
+    if (!index) continue;
+    const revisions = await index.json();
+    for (const url of CACHE_URLS) {
+      if (!reusable.has(url) && revisions[url] === PRECACHE[url]) {
+        reusable.set(url, old);
+      }
+    }
+  }
+
+  const cached = {};
+  await Promise.all(CACHE_URLS.map(async (url) => {
+    try {
+      const old = reusable.get(url);
+      const hit = old && await old.match(url);
+      if (hit) {
+        await cache.put(url, hit);
+      } else {
+        // Bypass the HTTP cache so stale bytes are not stored under a new revision
+        await cache.add(new Request(url, { cache: 'reload' }));
+      }
+      cached[url] = PRECACHE[url];
+    } catch (err) {
+      // Continue even if some files fail
+      console.log('Cache install failed:', url, err);
+    }
+  }));
+  await cache.put(PRECACHE_INDEX, new Response(JSON.stringify(cached), {
+    headers: { 'Content-Type': 'application/json' }
+  }));
+}
+
 self.addEventListener('install', (event) => {
-  event.waitUntil(
-    caches.open(CACHE_NAME)
-      .then((cache) => {
-        return cache.addAll(CACHE_URLS.map(url => {
-          try {
-            return new Request(url, { mode: 'no-cors' });
-          } catch (e) {
-            return url;
-          }
-        }));
-      })
-      .catch((err) => {
-        console.log('Cache install failed:', err);
-        // Continue even if some files fail
-        return caches.open(CACHE_NAME);
-      })
-  );
+  event.waitUntil(precache());
   self.skipWaiting();
 });
 
@@ -1,57 +1,172 @@
 # -*- coding: utf-8 -*-
-import os
-from bs4 import BeautifulSoup
-
-def clean_to_english_punctuation(text: str) -> str:
-    replacements = {
-        "，": ", ",
-        "。": ".",
-        "：": ":",
-        "“": "\"",
-        "”": "\"",
-        "‘": "'",
-        "’": "'",
-        "、": ", ",
-        "（": "(",
-        "）": ")",
-        "《": "<",
-        "》": ">",
-        "【": "[",
-        "】": "]",
-        "！": "!",
-        "？": "?",
-        "／": "/",
-        "；": ";"
-    }
-    for zh, en in replacements.items():
-        text = text.replace(zh, en)
-    return text
-
-def clean_html_files(folder: str):
-    found = False
-    for root, _, files in os.walk(folder):
-        for file in files:
-            if file.endswith(".html"):
-                found = True
-                path = os.path.join(root, file)
-                try:
-                    with open(path, "r", encoding="utf-8") as f:
-                        soup = BeautifulSoup(f, "html.parser")
-
-                    # 遍歷所有非script/style的文字節點
-                    for tag in soup.find_all(text=True):
-                        if tag.parent.name not in ["script", "style"]:
-                            cleaned = clean_to_english_punctuation(tag)
-                            tag.replace_with(cleaned)
-
-                    with open(path, "w", encoding="utf-8") as f:
-                        f.write(str(soup))
-
-                    print(f"✅ 清洗完成: {path}")
-                except Exception as e:
-                    print(f"❌ 錯誤處理 {path}: {e}")
-    if not found:
-        print("⚠️ 未找到任何 .html 文件，請確認執行目錄與檔案位置。")
+import argparse
+import html
+import re
+from punctnorm import (CHUNK_SIZE, PUNCTUATION_MAP, clean_files, clean_to_english_punctuation, iter_decoded,
+                       rewrite_file)
+
+# Markup at a '<'. Everything between matches is text. Attribute values may
+# contain '>' when quoted. Comments, doctypes and <?...?> are left alone.
+# Every branch is deterministic (the tag name is made atomic with the
+# lookahead + backreference idiom), so a match found on a partial buffer is
+# the same match the complete input would give.
+MARKUP_RE = re.compile(r"""
+    <!--[\s\S]*?-->
+  | <(?:!(?!--)|\?)[^>]*>
+  | <(?=(?P<open>[A-Za-z][^\s/>]*))(?P=open)(?:[^>"']|"[^"]*"|'[^']*')*>
+  | </[A-Za-z][^>]*>
+""", re.X)
+
+# Raw-text elements: their content runs to the matching end tag
+RAW_END_RE = {
+    "script": re.compile(r"</script[\s/>]", re.I),
+    "style": re.compile(r"</style[\s/>]", re.I),
+}
+_RAW_END_LEN = len("</script ")
+
+# An unfinished '<...' is held back for more input up to this many chars,
+# after which the '<' is treated as text.
+MAX_PENDING = 1024 * 1024
+
+# Character references in text ("&#65292;", "&#xFF0C;", "&ldquo;")
+CHAR_REF_RE = re.compile(r"&(?:#[0-9]{1,7}|#[xX][0-9a-fA-F]{1,6}|[A-Za-z][A-Za-z0-9]{1,31});")
+_MAX_REF_LEN = len("&") + 32 + len(";")
+
+def _decode_punct_ref(m):
+    ch = html.unescape(m.group(0))
+    return ch if ch in PUNCTUATION_MAP else m.group(0)
+
+def clean_html_text(text: str) -> str:
+    """
+    Cleans character data the way the BeautifulSoup path did: punctuation
+    written as a character reference is cleaned too, and a '<' or '>'
+    produced by the mapping is escaped. Other references are kept as they
+    are.
+    """
+    if "&" in text:
+        text = CHAR_REF_RE.sub(_decode_punct_ref, text)
+    if "《" in text or "》" in text:
+        text = text.replace("《", "&lt;").replace("》", "&gt;")
+    return clean_to_english_punctuation(text)
+
+def clean_comment(comment: str) -> str:
+    # "<!--...-->": the body is cleaned as plain text (no references),
+    # unless that would end the comment early.
+    body = clean_to_english_punctuation(comment[4:-3])
+    if "-->" in body or "--!>" in body or body.endswith("-"):
+        return comment
+    return "<!--" + body + "-->"
+
+def iter_cleaned_html(chunks):
+    """
+    Yields (text, changed) pieces covering the input exactly. Text outside
+    tags and <script>/<style> (see clean_html_text) and comment bodies are
+    cleaned; unchanged runs are passed through as the original
+    characters, coalesced.
+    """
+    buf = ""
+    raw_end = None
+    chunks = iter(chunks)
+    final = False
+    while not final:
+        chunk = next(chunks, None)
+        final = chunk is None
+        if chunk:
+            buf += chunk
+        n = len(buf)
+        pos = start = 0  # start: beginning of the current unchanged run
+        while pos < n:
+            if raw_end is not None:
+                m = raw_end.search(buf, pos)
+                if m is None:
+                    # Keep enough tail to see an end tag split across chunks
+                    pos = n if final else max(pos, n - _RAW_END_LEN)
+                    break
+                pos = m.start()
+                raw_end = None
+                continue
+
+            i = buf.find("<", pos)
+            text_end = n if i == -1 else i
+            if i == -1 and not final:
+                # Hold back a character reference cut off by the chunk boundary
+                amp = buf.rfind("&", max(pos, n - _MAX_REF_LEN))
+                if amp != -1 and ";" not in buf[amp:]:
+                    text_end = amp
+            if text_end > pos:
+                text = buf[pos:text_end]
+                cleaned = clean_html_text(text)
+                if cleaned != text:
+                    if pos > start:
+                        yield buf[start:pos], False
+                    yield cleaned, True
+                    start = text_end
+                pos = text_end
+            if i == -1:
+                break
+
+            m = MARKUP_RE.match(buf, i)
+            if m is None:
+                if not final and n - i < MAX_PENDING:
+                    break  # possibly a tag cut off by the chunk boundary
+                pos = i + 1
+                continue
+            if buf.startswith("<!--", i):
+                comment = m.group(0)
+                cleaned = clean_comment(comment)
+                if cleaned != comment:
+                    if i > start:
+                        yield buf[start:i], False
+                    yield cleaned, True
+                    start = m.end()
+            pos = m.end()
+            name = m.group("open")
+            if name:
+                raw_end = RAW_END_RE.get(name.lower())
+
+        if pos > start:
+            yield buf[start:pos], False
+        buf = buf[pos:]
+    if buf:
+        yield buf, False
+
+def clean_html_file(path: str, chunk_size: int = CHUNK_SIZE) -> bool:
+    """
+    Streaming, lossless: every byte outside cleaned text stays as it was.
+    Returns True if the file was rewritten, False if nothing changed.
+    """
+    return rewrite_file(path, iter_cleaned_html(iter_decoded(path, chunk_size)))
+
+def clean_html_file_soup(path: str) -> bool:
+    """Original BeautifulSoup path: re-serializes the whole document."""
+    from bs4 import BeautifulSoup
+
+    with open(path, "r", encoding="utf-8") as f:
+        soup = BeautifulSoup(f, "html.parser")
+
+    # 遍歷所有非script/style的文字節點
+    for tag in soup.find_all(text=True):
+        if tag.parent.name not in ["script", "style"]:
+            cleaned = clean_to_english_punctuation(tag)
+            if cleaned != tag:
+                tag.replace_with(str(cleaned))
+
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(str(soup))
+    return True
+
+def clean_html_files(folder: str, jobs: int = 1, mode: str = "stream"):
+    clean_files(folder, (".html",), clean_html_file_soup if mode == "soup" else clean_html_file, jobs)
+
+def main():
+    ap = argparse.ArgumentParser(prog="cleanpunc", description="Convert full-width punctuation in .html text to English punctuation.")
+    ap.add_argument("folder", nargs="?", default=".")
+    ap.add_argument("--jobs", type=int, default=1, help="Worker processes (0 = one per CPU).")
+    ap.add_argument("--mode", choices=["stream", "soup"], default="stream",
+                    help="stream: lossless tokenizer that cleans text, comments and punctuation "
+                         "character references (default); soup: BeautifulSoup re-serialization.")
+    args = ap.parse_args()
+    clean_html_files(args.folder, args.jobs, args.mode)
 
 if __name__ == "__main__":
-    clean_html_files(".")
+    main()
@@ -1,49 +1,31 @@
 # -*- coding: utf-8 -*-
-import os
+import argparse
+import functools
+from punctnorm import CHUNK_SIZE, clean_files, clean_to_english_punctuation, iter_decoded, rewrite_file
 
-def clean_to_english_punctuation(text: str) -> str:
-    replacements = {
-        "，": ", ",
-        "。": ".",
-        "：": ":",
-        "“": "\"",
-        "”": "\"",
-        "‘": "'",
-        "’": "'",
-        "、": ", ",
-        "（": "(",
-        "）": ")",
-        "《": "<",
-        "》": ">",
-        "【": "[",
-        "】": "]",
-        "！": "!",
-        "？": "?",
-        "／": "/",
-        "；": ";"
-    }
-    for zh, en in replacements.items():
-        text = text.replace(zh, en)
-    return text
+def clean_txt_file(path: str, chunk_size: int = CHUNK_SIZE) -> bool:
+    """
+    Streams one file through the cleaner in chunk_size pieces.
+    Returns True if the file was rewritten, False if nothing changed.
+    Untouched files are never written; line endings are preserved.
+    """
+    def pieces():
+        for text in iter_decoded(path, chunk_size):
+            cleaned = clean_to_english_punctuation(text)
+            yield cleaned, cleaned != text
 
-def clean_txt_files(folder: str):
-    found = False
-    for root, _, files in os.walk(folder):
-        for file in files:
-            if file.endswith(".txt"):
-                found = True
-                path = os.path.join(root, file)
-                try:
-                    with open(path, "r", encoding="utf-8") as infile:
-                        content = infile.read()
-                    cleaned = clean_to_english_punctuation(content)
-                    with open(path, "w", encoding="utf-8") as outfile:
-                        outfile.write(cleaned)
-                    print(f"✅ 清洗完成: {path}")
-                except Exception as e:
-                    print(f"❌ 錯誤處理 {path}: {e}")
-    if not found:
-        print("⚠️ 未找到任何 .txt 文件，請確認執行目錄與檔案位置。")
+    return rewrite_file(path, pieces())
+
+def clean_txt_files(folder: str, jobs: int = 1, chunk_size: int = CHUNK_SIZE):
+    clean_files(folder, (".txt",), functools.partial(clean_txt_file, chunk_size=chunk_size), jobs)
+
+def main():
+    ap = argparse.ArgumentParser(prog="puncc", description="Convert full-width punctuation in .txt files to English punctuation.")
+    ap.add_argument("folder", nargs="?", default=".")
+    ap.add_argument("--jobs", type=int, default=1, help="Worker processes (0 = one per CPU).")
+    ap.add_argument("--chunk-size", type=int, default=CHUNK_SIZE, help="Bytes read per streaming step.")
+    args = ap.parse_args()
+    clean_txt_files(args.folder, args.jobs, max(1, args.chunk_size))
 
 if __name__ == "__main__":
-    clean_txt_files(".")
+    main()
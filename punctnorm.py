@@ -0,0 +1,172 @@
+# -*- coding: utf-8 -*-
+"""
+Full-width (Chinese) punctuation -> English punctuation, shared by
+cleanpunc.py and puncc.py, plus their streaming rewriter and folder driver.
+
+    from punctnorm import normalize_punctuation
+    normalize_punctuation("你好，世界！")  # -> "你好, 世界!"
+"""
+import codecs
+import functools
+import os
+import re
+from concurrent.futures import ProcessPoolExecutor
+
+from tools.atomic_write import write_blocks
+
+# Single source of truth; order only matters for replace_each().
+PUNCTUATION_MAP = {
+    "，": ", ",
+    "。": ".",
+    "：": ":",
+    "“": "\"",
+    "”": "\"",
+    "‘": "'",
+    "’": "'",
+    "、": ", ",
+    "（": "(",
+    "）": ")",
+    "《": "<",
+    "》": ">",
+    "【": "[",
+    "】": "]",
+    "！": "!",
+    "？": "?",
+    "／": "/",
+    "；": ";"
+}
+
+# One alternation over every source character; the capture group makes
+# split() return [text, punct, text, punct, ..., text].
+PUNCTUATION_RE = re.compile("([" + re.escape("".join(PUNCTUATION_MAP)) + "])")
+
+_lookup = PUNCTUATION_MAP.__getitem__
+
+# Bytes read per step when streaming files
+CHUNK_SIZE = 1024 * 1024
+
+# Above this many UTF-8 bytes per character (sampled), the text is mostly
+# CJK and replace_each() is faster; below it the single regex pass wins.
+WIDE_TEXT_RATIO = 1.25
+_SAMPLE_CHARS = 4096
+
+
+def replace_each(text: str) -> str:
+    """One str.replace per mapping (the original algorithm)."""
+    for zh, en in PUNCTUATION_MAP.items():
+        text = text.replace(zh, en)
+    return text
+
+
+def substitute_once(text: str) -> str:
+    """Single regex pass; output is built once with join()."""
+    parts = PUNCTUATION_RE.split(text)
+    if len(parts) == 1:
+        return text
+    parts[1::2] = map(_lookup, parts[1::2])
+    return "".join(parts)
+
+
+def _mostly_wide(text: str) -> bool:
+    sample = text[:_SAMPLE_CHARS]
+    return len(sample.encode("utf-8", "surrogatepass")) > WIDE_TEXT_RATIO * len(sample)
+
+
+def normalize_punctuation(text: str) -> str:
+    """
+    Same result as replace_each(), using whichever strategy is faster for
+    this text. str.replace scans at memchr speed over CJK text, while on
+    mostly-ASCII text one regex pass beats 18 scans.
+    """
+    if text.isascii():
+        return text
+    if _mostly_wide(text):
+        return replace_each(text)
+    return substitute_once(text)
+
+
+# Name used by cleanpunc.py / puncc.py
+clean_to_english_punctuation = normalize_punctuation
+
+
+def iter_decoded(path: str, chunk_size: int = CHUNK_SIZE):
+    """
+    Yields the file's text in pieces of about chunk_size bytes. Decoding is
+    incremental, so a UTF-8 sequence split across two reads is completed
+    before it is yielded; newlines are left untranslated.
+    """
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    with open(path, "rb") as f:
+        while True:
+            raw = f.read(chunk_size)
+            text = decoder.decode(raw, not raw)
+            if text:
+                yield text
+            if not raw:
+                return
+
+
+def rewrite_file(path: str, pieces) -> bool:
+    """
+    pieces: iterable of (text, changed) covering the whole file in order,
+    where unchanged pieces are exactly the file's own text.
+    Returns True if the file was rewritten, False if nothing changed.
+    See tools/atomic_write.py.
+    """
+    return write_blocks(path, ((text.encode("utf-8"), changed) for text, changed in pieces))
+
+
+def _clean_one(clean_fn, path: str):
+    # Worker entry point: never raises, so one bad file does not stop a pool.
+    try:
+        return path, clean_fn(path), None
+    except Exception as e:
+        return path, False, str(e)
+
+
+def iter_files(folder: str, exts):
+    for root, _, files in os.walk(folder):
+        for file in sorted(files):
+            if file.endswith(exts):
+                yield os.path.join(root, file)
+
+
+def clean_files(folder: str, exts, clean_fn, jobs: int = 1):
+    """
+    Runs clean_fn(path) -> bool (True if rewritten) on every file under
+    folder ending in one of exts, on up to jobs processes (0 = one per
+    CPU), and prints one line per change or error plus a summary.
+    clean_fn must be picklable: a module-level function or a
+    functools.partial of one.
+    """
+    exts = tuple(exts)
+    paths = list(iter_files(folder, exts))
+    if not paths:
+        print(f"⚠️ 未找到任何 {'/'.join(exts)} 文件，請確認執行目錄與檔案位置。")
+        return
+
+    if jobs <= 0:
+        jobs = os.cpu_count() or 1
+    work = functools.partial(_clean_one, clean_fn)
+    if jobs == 1 or len(paths) == 1:
+        results = map(work, paths)
+        pool = None
+    else:
+        pool = ProcessPoolExecutor(max_workers=min(jobs, len(paths)))
+        results = pool.map(work, paths, chunksize=max(1, len(paths) // (jobs * 4)))
+
+    changed = unchanged = failed = 0
+    try:
+        for path, wrote, error in results:
+            if error is not None:
+                failed += 1
+                print(f"❌ 錯誤處理 {path}: {error}")
+            elif wrote:
+                changed += 1
+                print(f"✅ 清洗完成: {path}")
+            else:
+                unchanged += 1
+    finally:
+        if pool is not None:
+            pool.shutdown()
+    print(f"共 {len(paths)} 個文件: {changed} 已清洗, {unchanged} 無需變更, {failed} 錯誤")
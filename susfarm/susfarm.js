@@ -38,6 +38,10 @@
   // Get translation (renamed to tx to avoid shadowing global window.t)
   function tx(key, vars = {}) {
     if (!key) return '';
+    // Placeholders: tFormat uses the chunk's precompiled templates (I18N_TPL)
+    if (vars && Object.keys(vars).length > 0 && window.tFormat) {
+      return window.tFormat(key, vars, window.currentLang || 'en');
+    }
     // Use window.t if available, otherwise try I18N directly
     let str = '';
     if (window.t && typeof window.t === 'function') {
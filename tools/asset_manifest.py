@@ -0,0 +1,274 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Content-hashed asset manifest + service worker precache list.
+
+  python tools/asset_manifest.py           # hash, copy, write manifest, update sw.js
+  python tools/asset_manifest.py --check   # exit 1 if sw.js is out of date
+
+Walks index.html, fractal.webp, assets/ (including the generated
+assets/bg variants) and susfarm/, then:
+  - writes fingerprinted copies (name.<hash>.ext) to dist/fingerprinted/
+    for everything except HTML and the web manifest, whose URLs must stay
+    stable; copies no longer in the manifest are removed
+  - writes dist/asset-manifest.json: { url: {hashed, sha256, bytes} }
+  - regenerates the <precache> block of assets/pwa/sw.js: a url -> revision
+    map and a CACHE_NAME derived from all revisions. On update the worker
+    copies entries whose revision did not change out of the previous
+    cache, so repeat visitors only download files that changed.
+
+Hashes are cached by (size, mtime) in dist/.cache/asset_hashes.json.
+"""
+
+import argparse
+import hashlib
+import json
+import os
+import re
+import shutil
+import sys
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+ROOT = Path(__file__).resolve().parent.parent
+
+HASH_CACHE_VERSION = "asset-hashes/1"
+DEFAULT_HASH_CACHE = os.path.join("dist", ".cache", "asset_hashes.json")
+DEFAULT_MANIFEST = os.path.join("dist", "asset-manifest.json")
+DEFAULT_COPY_DIR = os.path.join("dist", "fingerprinted")
+DEFAULT_SW = os.path.join("assets", "pwa", "sw.js")
+
+# Repo-relative files and directories that make up the deployed site
+SOURCES = ["index.html", "fractal.webp", "assets", "susfarm"]
+ASSET_EXTS = {
+  ".html", ".css", ".js", ".json", ".webmanifest",
+  ".png", ".jpg", ".jpeg", ".gif", ".svg", ".ico", ".webp", ".avif",
+  ".woff", ".woff2",
+}
+# Files whose URL is an entry point (never fingerprinted)
+STABLE_EXTS = {".html", ".webmanifest"}
+
+HASH_LEN = 10
+CACHE_PREFIX = "sus-church-"
+
+PRECACHE_BEGIN = "// <precache>"
+PRECACHE_END = "// </precache>"
+PRECACHE_RE = re.compile(re.escape(PRECACHE_BEGIN) + r".*?" + re.escape(PRECACHE_END) + r"\n?", re.S)
+# The hand-written block this tool replaces the first time it runs
+LEGACY_RE = re.compile(r"const CACHE_NAME = [^\n]*\nconst CACHE_URLS = \[[^\]]*\];\n?")
+
+
+def read_json(path: str) -> dict:
+  with open(path, "r", encoding="utf-8") as f:
+    return json.load(f)
+
+
+def write_text(path: str, text: str) -> bool:
+  """Atomic write; skipped (returns False) when the content is unchanged."""
+  try:
+    with open(path, "r", encoding="utf-8", newline="") as f:
+      if f.read() == text:
+        return False
+  except OSError:
+    pass
+  os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+  tmp = f"{path}.{os.getpid()}.tmp"
+  with open(tmp, "w", encoding="utf-8", newline="") as f:
+    f.write(text)
+  os.replace(tmp, path)
+  return True
+
+
+def sha256_file(path: str) -> str:
+  h = hashlib.sha256()
+  with open(path, "rb") as f:
+    for block in iter(lambda: f.read(1 << 20), b""):
+      h.update(block)
+  return h.hexdigest()
+
+
+class HashCache:
+  """sha256 per path, reused while (size, mtime_ns) are unchanged."""
+
+  def __init__(self, path: Optional[str]):
+    self.path = path
+    self.entries: Dict[str, list] = {}
+    self.hits = 0
+    if path:
+      try:
+        obj = read_json(path)
+        if obj.get("version") == HASH_CACHE_VERSION and isinstance(obj.get("files"), dict):
+          self.entries = obj["files"]
+      except (OSError, ValueError):
+        pass
+    self.used: Dict[str, list] = {}
+
+  def sha256(self, path: str) -> str:
+    st = os.stat(path)
+    entry = self.entries.get(path)
+    if entry and entry[0] == st.st_size and entry[1] == st.st_mtime_ns:
+      self.hits += 1
+      digest = entry[2]
+    else:
+      digest = sha256_file(path)
+    self.used[path] = [st.st_size, st.st_mtime_ns, digest]
+    return digest
+
+  def save(self) -> None:
+    if self.path:
+      write_text(self.path, json.dumps({"version": HASH_CACHE_VERSION, "files": self.used}, sort_keys=True))
+
+
+def iter_site_files(root: Path, exclude: List[str]) -> List[str]:
+  """Repo-relative POSIX paths of all site assets under SOURCES, sorted."""
+  out = []
+  for name in SOURCES:
+    p = root / name
+    if p.is_file():
+      out.append(name)
+      continue
+    for dirpath, dirnames, files in os.walk(p):
+      dirnames[:] = sorted(d for d in dirnames if not d.startswith("."))
+      for fn in files:
+        rel = (Path(dirpath) / fn).relative_to(root).as_posix()
+        if Path(fn).suffix.lower() in ASSET_EXTS and rel not in exclude:
+          out.append(rel)
+  return sorted(set(out))
+
+
+def fingerprint(rel: str, digest: str) -> str:
+  p = Path(rel)
+  if p.suffix.lower() in STABLE_EXTS:
+    return rel
+  return p.with_name(f"{p.stem}.{digest[:HASH_LEN]}{p.suffix}").as_posix()
+
+
+def build_manifest(root: Path, files: List[str], hashes: HashCache) -> dict:
+  assets = {}
+  for rel in files:
+    digest = hashes.sha256(str(root / rel))
+    assets["/" + rel] = {
+      "hashed": "/" + fingerprint(rel, digest),
+      "sha256": digest,
+      "bytes": (root / rel).stat().st_size,
+    }
+  return assets
+
+
+def cache_version(revisions: Dict[str, str]) -> str:
+  blob = json.dumps(revisions, sort_keys=True, separators=(",", ":"))
+  return hashlib.sha256(blob.encode("utf-8")).hexdigest()[:12]
+
+
+def precache_revisions(assets: Dict[str, dict]) -> Dict[str, str]:
+  """url -> short revision. Directory URLs ('/', '/susfarm/') track their index.html."""
+  revisions = {}
+  for url, entry in assets.items():
+    rev = entry["sha256"][:HASH_LEN]
+    if url.endswith("/index.html"):
+      revisions[url[: -len("index.html")]] = rev
+    revisions[url] = rev
+  return dict(sorted(revisions.items()))
+
+
+def render_precache(revisions: Dict[str, str]) -> str:
+  lines = [
+    f"{PRECACHE_BEGIN} generated by tools/asset_manifest.py; do not edit by hand",
+    f"const CACHE_PREFIX = '{CACHE_PREFIX}';",
+    f"const CACHE_NAME = CACHE_PREFIX + '{cache_version(revisions)}';",
+    "const PRECACHE = {",
+  ]
+  lines += [f"  '{url}': '{rev}'," for url, rev in revisions.items()]
+  lines += [
+    "};",
+    "const CACHE_URLS = Object.keys(PRECACHE);",
+    PRECACHE_END,
+  ]
+  return "\n".join(lines) + "\n"
+
+
+def update_sw(sw_text: str, block: str) -> str:
+  if PRECACHE_RE.search(sw_text):
+    return PRECACHE_RE.sub(lambda m: block, sw_text, count=1)
+  if LEGACY_RE.search(sw_text):
+    return LEGACY_RE.sub(lambda m: block, sw_text, count=1)
+  raise ValueError(f"no {PRECACHE_BEGIN} block or CACHE_NAME/CACHE_URLS declarations found")
+
+
+def sync_copies(root: Path, copy_dir: Path, assets: Dict[str, dict]) -> Tuple[int, int]:
+  """Create missing fingerprinted copies and drop stale ones. Returns (written, removed)."""
+  wanted = {}
+  for url, entry in assets.items():
+    if entry["hashed"] != url:
+      wanted[entry["hashed"].lstrip("/")] = url.lstrip("/")
+  written = removed = 0
+  for hashed, rel in wanted.items():
+    dst = copy_dir / hashed
+    # The name carries the hash, so an existing file is already correct
+    if dst.exists():
+      continue
+    dst.parent.mkdir(parents=True, exist_ok=True)
+    tmp = f"{dst}.{os.getpid()}.tmp"
+    shutil.copyfile(root / rel, tmp)
+    os.replace(tmp, dst)
+    written += 1
+  if copy_dir.is_dir():
+    for dirpath, _, files in os.walk(copy_dir):
+      for fn in files:
+        p = Path(dirpath) / fn
+        if p.relative_to(copy_dir).as_posix() not in wanted:
+          p.unlink()
+          removed += 1
+  return written, removed
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="asset_manifest")
+  ap.add_argument("--root", default=str(ROOT), help="Site root (default: repo root).")
+  ap.add_argument("--manifest", default=DEFAULT_MANIFEST)
+  ap.add_argument("--copy-dir", default=DEFAULT_COPY_DIR, help="Where fingerprinted copies go.")
+  ap.add_argument("--sw", default=DEFAULT_SW, help="Service worker whose precache block is regenerated.")
+  ap.add_argument("--cache", default=DEFAULT_HASH_CACHE, help="Hash cache file ('' to disable).")
+  ap.add_argument("--check", action="store_true", help="Only report whether sw.js is up to date (exit 1 if not).")
+  args = ap.parse_args()
+
+  root = Path(args.root)
+  sw_path = root / args.sw
+  # The worker cannot precache itself: its revision would depend on its own content
+  files = iter_site_files(root, exclude=[Path(args.sw).as_posix()])
+  hashes = HashCache(str(root / args.cache) if args.cache else None)
+  assets = build_manifest(root, files, hashes)
+  revisions = precache_revisions(assets)
+
+  sw_text = sw_path.read_text(encoding="utf-8")
+  try:
+    new_sw = update_sw(sw_text, render_precache(revisions))
+  except ValueError as e:
+    print(f"[FAIL] {sw_path}: {e}")
+    sys.exit(2)
+
+  if args.check:
+    hashes.save()
+    if new_sw != sw_text:
+      print(f"[FAIL] {args.sw} precache is stale; run tools/asset_manifest.py")
+      sys.exit(1)
+    print(f"[OK] {args.sw} precache matches {len(files)} assets")
+    return
+
+  written, removed = sync_copies(root, root / args.copy_dir, assets)
+  write_text(str(root / args.manifest), json.dumps({
+    "version": 1,
+    "cache_name": CACHE_PREFIX + cache_version(revisions),
+    "assets": assets,
+  }, ensure_ascii=False, indent=2, sort_keys=True) + "\n")
+  sw_changed = write_text(str(sw_path), new_sw)
+  hashes.save()
+
+  print(f"[OK] {len(files)} assets ({hashes.hits} hashes cached); "
+        f"fingerprinted copies: {written} written, {removed} removed")
+  print(f"[OK] cache: {CACHE_PREFIX}{cache_version(revisions)}; "
+        f"{args.sw} {'updated' if sw_changed else 'unchanged'}")
+
+
+if __name__ == "__main__":
+  main()
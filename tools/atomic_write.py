@@ -0,0 +1,68 @@
+# -*- coding: utf-8 -*-
+"""
+Atomic streaming file writer shared by tools/grammar_i18n_compiler.py and
+the punctuation cleaners (punctnorm.rewrite_file).
+
+  from atomic_write import write_blocks        # from tools/
+  from tools.atomic_write import write_blocks  # from the repo root
+"""
+
+import os
+import shutil
+from typing import BinaryIO, Iterable, Tuple
+
+# Bytes per read when copying an unchanged prefix
+COPY_BUFFER = 1024 * 1024
+
+
+def _copy_prefix(path: str, dst: BinaryIO, nbytes: int) -> None:
+  with open(path, "rb") as src:
+    while nbytes > 0:
+      buf = src.read(min(COPY_BUFFER, nbytes))
+      if not buf:
+        break
+      dst.write(buf)
+      nbytes -= len(buf)
+
+
+def write_blocks(path: str, blocks: Iterable[Tuple[bytes, bool]]) -> bool:
+  """
+  blocks: iterable of (data, changed) byte strings covering the new
+  content in order, where every block before the first changed one is
+  exactly the file's own bytes at that offset. A file that does not
+  exist yet needs a changed block (b"" will do) to be created.
+  Returns True if the file was written, False if nothing changed.
+
+  Nothing is written until the first changed block; the unchanged prefix
+  is then copied as raw bytes, the rest streamed to a temp file, and the
+  temp file renamed over the original (mode preserved).
+  """
+  tmp_path = f"{path}.{os.getpid()}.tmp"
+  out = None
+  unchanged = 0  # leading bytes that need no rewrite
+  try:
+    for data, changed in blocks:
+      if out is None:
+        if not changed:
+          unchanged += len(data)
+          continue
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        out = open(tmp_path, "wb")
+        if unchanged:
+          _copy_prefix(path, out, unchanged)
+      out.write(data)
+    if out is None:
+      return False
+    out.close()
+    if os.path.exists(path):
+      shutil.copymode(path, tmp_path)
+    os.replace(tmp_path, path)
+    return True
+  except BaseException:
+    if out is not None:
+      out.close()
+      try:
+        os.remove(tmp_path)
+      except OSError:
+        pass
+    raise
@@ -0,0 +1,112 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: cleanpunc.py streaming tokenizer vs the BeautifulSoup path.
+
+Usage:
+  python tools/bench/bench_cleanpunc.py [--files 200] [--kb 64] [--jobs 4]
+
+Generates --files synthetic pages of about --kb KB (text with full-width
+punctuation, attributes, comments, inline <script>/<style>), copies them
+once per run and times clean_html_files() on each copy. "soup" is skipped
+when bs4 is not installed. "lossless" checks that the stream output differs
+from the input only where punctuation was replaced; "unchanged_rerun_s" is
+a second stream pass over already-clean files (no writes expected).
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import random
+import shutil
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import cleanpunc  # noqa: E402
+from punctnorm import PUNCTUATION_MAP, replace_each  # noqa: E402
+
+HAN = [chr(c) for c in range(0x4E00, 0x4E00 + 2000)]
+PUNCT = list(PUNCTUATION_MAP)
+
+
+def make_page(rnd: random.Random, kb: int) -> str:
+  def words(n):
+    return "".join(rnd.choice(PUNCT) if rnd.random() < 0.08 else rnd.choice(HAN) for _ in range(n))
+
+  parts = ["<!doctype html>\n<html><head><meta charset=\"utf-8\"><title>", words(12), "</title>\n",
+           "<style>.q::before { content: \"，\"; }</style>\n</head><body>\n"]
+  size = 0
+  i = 0
+  while size < kb * 1024:
+    row = (
+      f'<div class="row" data-i18n="g.bench.row.{i}" title="{words(6)}">'
+      f"<p>{words(40)}</p><!-- {words(8)} --><span>{words(10)}</span></div>\n"
+    )
+    if i % 20 == 0:
+      row += f"<script>var s = \"{words(10)}\"; if (a < b) {{ x = '（）'; }}</script>\n"
+    parts.append(row)
+    size += len(row.encode("utf-8"))
+    i += 1
+  parts.append("</body></html>\n")
+  return "".join(parts)
+
+
+def run(src: str, tmp: str, name: str, jobs: int, mode: str) -> dict:
+  dst = os.path.join(tmp, name)
+  shutil.copytree(src, dst)
+  t0 = time.perf_counter()
+  with contextlib.redirect_stdout(io.StringIO()):
+    cleanpunc.clean_html_files(dst, jobs, mode)
+  return {"dir": dst, "wall_s": round(time.perf_counter() - t0, 4)}
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="bench_cleanpunc")
+  ap.add_argument("--files", type=int, default=200)
+  ap.add_argument("--kb", type=int, default=64)
+  ap.add_argument("--jobs", type=int, default=4)
+  args = ap.parse_args()
+
+  rnd = random.Random(7)
+  with tempfile.TemporaryDirectory() as tmp:
+    src = os.path.join(tmp, "src")
+    os.makedirs(src)
+    for i in range(args.files):
+      Path(src, f"page{i:04d}.html").write_text(make_page(rnd, args.kb), encoding="utf-8")
+    nbytes = sum(p.stat().st_size for p in Path(src).iterdir())
+
+    result = {"files": args.files, "bytes": nbytes}
+    stream = run(src, tmp, "stream", 1, "stream")
+    result["stream"] = {"wall_s": stream["wall_s"], "mb_per_s": round(nbytes / 1e6 / stream["wall_s"], 2)}
+    result["stream_jobs"] = {"jobs": args.jobs, "wall_s": run(src, tmp, "stream_jobs", args.jobs, "stream")["wall_s"]}
+
+    t0 = time.perf_counter()
+    with contextlib.redirect_stdout(io.StringIO()):
+      cleanpunc.clean_html_files(stream["dir"], 1, "stream")
+    result["unchanged_rerun_s"] = round(time.perf_counter() - t0, 4)
+
+    result["lossless"] = all(
+      replace_each(Path(src, p.name).read_text(encoding="utf-8")) == replace_each(p.read_text(encoding="utf-8"))
+      for p in Path(stream["dir"]).iterdir()
+    )
+
+    try:
+      import bs4  # noqa: F401
+    except ImportError:
+      result["soup"] = {"skipped": "bs4 not installed"}
+    else:
+      soup = run(src, tmp, "soup", 1, "soup")
+      result["soup"] = {"wall_s": soup["wall_s"], "mb_per_s": round(nbytes / 1e6 / soup["wall_s"], 2)}
+      result["stream_speedup_vs_soup"] = round(soup["wall_s"] / stream["wall_s"], 2)
+
+  print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,96 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: extract_i18n_json tokenizer on growing synthetic i18n.js files.
+
+Usage:
+  python tools/bench/bench_extract_i18n.py [--sizes 1 2 4 8 16] [--langs 8]
+
+Each size (in MB) gets an i18n.js shaped like assets/i18n.data.js: --langs
+language blocks of single-quoted entries with escapes, comments and a few
+template/concatenated values, followed by runtime functions like those in
+assets/i18n.js, so the tokenizer must stop at the literal's end. Prints one
+JSON object; for linear time, "us_per_kb" stays flat as the size grows.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import extract_i18n_json as ex  # noqa: E402
+
+RUNTIME = """
+function t(key) {
+  const lang = localStorage.getItem('lang') || 'en';
+  return (I18N[lang] && I18N[lang][key]) || I18N.en[key] || key;
+}
+"""
+
+
+def make_js(path: str, mb: float, langs: int) -> int:
+  target = int(mb * 1024 * 1024)
+  per_lang = max(1, target // langs // 90)
+  entries = 0
+  with open(path, "w", encoding="utf-8") as f:
+    f.write("// i18n system (synthetic)\nconst I18N = {\n")
+    for li in range(langs):
+      f.write(f"  l{li}: {{\n    // Grammar node keys\n")
+      for i in range(per_lang):
+        if i % 40 == 0:
+          f.write(f"    'g.bench.tpl.{i}': `line one\\nline {{two}} ☆`,\n")
+        elif i % 40 == 1:
+          f.write(f"    'g.bench.cat.{i}': 'part one, ' + // joined\n      \"part two\",\n")
+        else:
+          f.write(f"    'g.bench.item.{i}': 'It\\'s item {i} — \"quoted\" \\u2606 value',\n")
+        entries += 1
+      f.write("  },\n")
+    f.write("};\n")
+    f.write(RUNTIME)
+  return entries
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="bench_extract_i18n")
+  ap.add_argument("--sizes", nargs="+", type=float, default=[1, 2, 4, 8, 16], help="File sizes in MB.")
+  ap.add_argument("--langs", type=int, default=8)
+  args = ap.parse_args()
+
+  runs = []
+  with tempfile.TemporaryDirectory() as tmp:
+    for mb in args.sizes:
+      fp = os.path.join(tmp, f"i18n_{mb}.js")
+      expected = make_js(fp, mb, args.langs)
+      nbytes = os.path.getsize(fp)
+
+      t0 = time.perf_counter()
+      langs = ex.extract_i18n(fp)
+      wall = time.perf_counter() - t0
+
+      got = sum(len(m) for m in langs.values())
+      if got != expected or len(langs) != args.langs:
+        raise SystemExit(f"{fp}: expected {expected} entries in {args.langs} langs, got {got} in {len(langs)}")
+      runs.append({
+        "bytes": nbytes,
+        "entries": got,
+        "wall_s": round(wall, 4),
+        "mb_per_s": round(nbytes / 1e6 / wall, 2) if wall else None,
+        "us_per_kb": round(wall * 1e6 / (nbytes / 1024), 2),
+      })
+
+  per_kb = [r["us_per_kb"] for r in runs]
+  print(json.dumps({
+    "langs": args.langs,
+    "runs": runs,
+    # ~1.0 means time grew in proportion to input size.
+    "largest_vs_smallest_us_per_kb": round(per_kb[-1] / per_kb[0], 2) if per_kb[0] else None,
+  }, indent=2))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,95 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: punctnorm strategies on synthetic corpora.
+
+Usage:
+  python tools/bench/bench_punctuation.py [--mb 16] [FILE.txt ...]
+
+Without files, three corpora of --mb megabytes each are generated: mostly
+CJK, mostly English with stray full-width punctuation, and an even mix.
+"replace_each" is the original 18 x str.replace; "normalize" is what
+cleanpunc.py / puncc.py now call. Every result is checked against
+replace_each before timing is reported.
+"""
+
+import argparse
+import json
+import random
+import sys
+import time
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent.parent))
+
+import punctnorm  # noqa: E402
+
+WORDS = "the quick brown fox jumps over the lazy dog at sus church grammar book".split()
+HAN = [chr(c) for c in range(0x4E00, 0x4E00 + 3000)]
+PUNCT = list(punctnorm.PUNCTUATION_MAP)
+
+
+def make_corpus(mb: float, cjk: float, punct: float, seed: int = 1) -> str:
+  # Built from a repeated 64K-token block; the strategies only see chars.
+  rnd = random.Random(seed)
+  block = []
+  for _ in range(65536):
+    r = rnd.random()
+    if r < punct:
+      block.append(rnd.choice(PUNCT))
+    elif rnd.random() < cjk:
+      block.append(rnd.choice(HAN))
+    else:
+      block.append(rnd.choice(WORDS) + " ")
+  block = "".join(block)
+  target = int(mb * 1024 * 1024)
+  return block * max(1, target // len(block.encode("utf-8")))
+
+
+def measure(fn, text: str, expected: str, repeat: int) -> dict:
+  if fn(text) != expected:
+    raise SystemExit(f"{fn.__name__}: output differs from replace_each")
+  # Best of N: allocator warm-up otherwise penalises whichever runs first.
+  wall = float("inf")
+  for _ in range(repeat):
+    t0 = time.perf_counter()
+    fn(text)
+    wall = min(wall, time.perf_counter() - t0)
+  return {"wall_s": round(wall, 4), "mchars_per_s": round(len(text) / 1e6 / wall, 2) if wall else None}
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="bench_punctuation")
+  ap.add_argument("files", nargs="*")
+  ap.add_argument("--mb", type=float, default=16.0, help="Synthetic corpus size when no files are given.")
+  ap.add_argument("--repeat", type=int, default=3)
+  args = ap.parse_args()
+
+  if args.files:
+    corpora = {fp: Path(fp).read_text(encoding="utf-8") for fp in args.files}
+  else:
+    corpora = {
+      "cjk": make_corpus(args.mb, cjk=0.95, punct=0.07),
+      "english": make_corpus(args.mb, cjk=0.0, punct=0.01),
+      "mixed": make_corpus(args.mb, cjk=0.5, punct=0.05),
+    }
+
+  result = {}
+  for name, text in corpora.items():
+    expected = punctnorm.replace_each(text)
+    runs = {
+      fn.__name__: measure(fn, text, expected, args.repeat)
+      for fn in (punctnorm.replace_each, punctnorm.substitute_once, punctnorm.normalize_punctuation)
+    }
+    base = runs["replace_each"]["wall_s"]
+    best = runs["normalize_punctuation"]["wall_s"]
+    result[name] = {
+      "chars": len(text),
+      "runs": runs,
+      "speedup_vs_replace_each": round(base / best, 2) if best else None,
+    }
+  print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,113 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark: whole-file DATA_I18N_RE scan vs the streaming HTMLParser extractor.
+
+Usage:
+  python tools/bench/bench_scan_extract.py [--mb 32] [FILE.html ...]
+
+Without files, a synthetic page of --mb megabytes is generated in a temp dir.
+Prints one JSON object with wall time, throughput and tracemalloc peak per path.
+The regex path also counts keys inside comments/scripts; the streaming one
+reports only real attributes, so its key count is expected to be lower.
+"""
+
+import argparse
+import json
+import os
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent))
+
+import grammar_i18n_compiler as gic  # noqa: E402
+
+
+def make_page(path: str, mb: float) -> None:
+  # Roughly index.html's density: one data-i18n per ~120 bytes of markup,
+  # plus comments and inline script text the regex path miscounts.
+  row = (
+    '<li class="row"><span class="label" data-i18n="g.bench.item.{i}">Item {i}</span>'
+    '<a href="#{i}" title="open">open</a></li>\n'
+  )
+  extra = '<!-- data-i18n="g.bench.comment.{i}" --><script>var s = \'<b data-i18n="g.bench.script">\';</script>\n'
+  target = int(mb * 1024 * 1024)
+  with open(path, "w", encoding="utf-8") as f:
+    f.write("<!doctype html><html><body><ul>\n")
+    i = 0
+    written = 0
+    while written < target:
+      line = row.format(i=i % 5000)
+      if i % 50 == 0:
+        line += extra.format(i=i % 5000)
+      f.write(line)
+      written += len(line)
+      i += 1
+    f.write("</ul></body></html>\n")
+
+
+def regex_keys(path: str) -> set:
+  text = Path(path).read_text(encoding="utf-8", errors="ignore")
+  keys = set()
+  for m in gic.DATA_I18N_RE.finditer(text):
+    k = m.group(1).strip()
+    if k:
+      keys.add(k)
+  return keys
+
+
+def stream_keys(path: str) -> set:
+  with open(path, "rb") as f:
+    return {k for k, _, _ in gic.iter_ui_key_locations(gic._iter_text_blocks(f))}
+
+
+def measure(fn, files) -> dict:
+  # Timed without tracemalloc (it slows allocation-heavy code by an order of
+  # magnitude), then run again just to record the allocation peak.
+  t0 = time.perf_counter()
+  keys = set()
+  for fp in files:
+    keys |= fn(fp)
+  wall = time.perf_counter() - t0
+
+  tracemalloc.start()
+  for fp in files:
+    fn(fp)
+  _, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+
+  nbytes = sum(os.path.getsize(fp) for fp in files)
+  return {
+    "wall_s": round(wall, 4),
+    "mb_per_s": round(nbytes / 1e6 / wall, 2) if wall else None,
+    "peak_alloc_kb": peak // 1024,
+    "keys": len(keys),
+  }
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="bench_scan_extract")
+  ap.add_argument("files", nargs="*")
+  ap.add_argument("--mb", type=float, default=32.0, help="Synthetic page size when no files are given.")
+  args = ap.parse_args()
+
+  with tempfile.TemporaryDirectory() as tmp:
+    files = args.files
+    if not files:
+      fp = os.path.join(tmp, "synthetic.html")
+      make_page(fp, args.mb)
+      files = [fp]
+
+    result = {
+      "bytes": sum(os.path.getsize(fp) for fp in files),
+      "regex": measure(regex_keys, files),
+      "stream": measure(stream_keys, files),
+    }
+  print(json.dumps(result, indent=2))
+
+
+if __name__ == "__main__":
+  main()
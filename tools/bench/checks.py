@@ -0,0 +1,227 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Equivalence checks for the optimized grammar/i18n paths.
+
+Usage:
+  python tools/bench/checks.py [--corpus DIR | --keys N --langs N] [--only NAME ...]
+
+Each check runs an optimized code path and the straightforward one it
+replaced on the same input and reports every difference. Without --corpus
+a small synthetic corpus (tools/bench/corpus.py) is generated in a temp
+dir; `--corpus .` checks the repo's own grammar/ and i18n/. Exit status 1
+if any check fails.
+"""
+
+import argparse
+import contextlib
+import io
+import os
+import random
+import sys
+import tempfile
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent.parent))
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+import grammar_i18n_compiler as gic  # noqa: E402
+
+# Each check(corpus, tmp) returns a list of failure messages (empty = pass).
+
+
+def _run_cli(*argv: str) -> None:
+  old = sys.argv
+  sys.argv = ["grammar_i18n_compiler", *argv]
+  try:
+    with contextlib.redirect_stdout(io.StringIO()):
+      gic.main()
+  finally:
+    sys.argv = old
+
+
+def check_patch(corpus: Path, tmp: str) -> list:
+  """`patch` from a JSON dir and from a binary bundle vs in-memory patch()."""
+  from i18n_bundle import write_bundle
+
+  nodes_path = str(corpus / "grammar" / "nodes.json")
+  i18n_dir = str(corpus / "i18n")
+  maps = gic.read_i18n_dir(i18n_dir)
+  base = "en" if "en" in maps else sorted(maps)[0]
+  expected = gic.patch(gic.load_nodes(nodes_path), maps, base)
+
+  bundle = os.path.join(tmp, "i18n.bin")
+  write_bundle(bundle, maps)
+  failures = []
+  for label, src, keep_order in (("dir", i18n_dir, True), ("bundle", bundle, False)):
+    out = os.path.join(tmp, f"patch-{label}")
+    try:
+      _run_cli("patch", "--nodes", nodes_path, "--i18n-dir", src, "--base-lang", base, "--out-dir", out)
+    except Exception as e:
+      failures.append(f"{label}: patch raised {type(e).__name__}: {e}")
+      continue
+    for lang, want in expected.items():
+      got = gic.read_json(os.path.join(out, f"{lang}.json"))
+      if got != want:
+        diff = sorted(set(got.items()) ^ set(want.items()))
+        failures.append(f"{label}: {lang}.json differs in {len(diff)} entr(ies), e.g. {diff[0]!r}")
+      elif keep_order and list(got) != list(want):
+        # A bundle stores keys sorted; a JSON dir keeps its source order
+        failures.append(f"{label}: {lang}.json key order differs")
+  return failures
+
+
+def _grammar_keys(corpus: Path) -> tuple:
+  nodes = gic.load_nodes(str(corpus / "grammar" / "nodes.json"))
+  keys = {n.key for n in nodes}
+  for m in gic.read_i18n_dir(str(corpus / "i18n")).values():
+    keys.update(k for k in m if k.startswith("g."))
+  # Shapes the bulk fast paths must hand to the scalar fallback
+  keys.update(["g.", "g.a..b", "g.a.b.", "g.Mixed.Case", "g.bank.ünï", "g.a b.c", "g.sys.a-b_c.1"])
+  return sorted(keys), nodes
+
+
+def _scalar(fn, x):
+  try:
+    return fn(x)
+  except ValueError:
+    return None
+
+
+def check_grammar(corpus: Path, tmp: str) -> list:
+  """keys_to_grammar/grammars_to_keys vs the scalar converters, round trips, stored node grammars."""
+  keys, nodes = _grammar_keys(corpus)
+  failures = []
+  bulk_g = gic.keys_to_grammar(keys)
+  failures += [f"keys_to_grammar({k!r}) = {g!r}, scalar {_scalar(gic.key_to_grammar, k)!r}"
+               for k, g in zip(keys, bulk_g) if g != _scalar(gic.key_to_grammar, k)]
+  grammars = [n.grammar for n in nodes] + [g for g in bulk_g if g is not None]
+  failures += [f"grammars_to_keys({g!r}) = {k!r}, scalar {_scalar(gic.grammar_to_key, g)!r}"
+               for g, k in zip(grammars, gic.grammars_to_keys(grammars)) if k != _scalar(gic.grammar_to_key, g)]
+
+  # Grammar is upper-case and has no empty segments, so only lower-case
+  # keys without ".." or a trailing "." can round-trip
+  valid = [(k, g) for k, g in zip(keys, bulk_g) if g is not None and k == k.lower() and "" not in k.split(".")]
+  failures += [f"{k!r} -> {g!r} -> {b!r}"
+               for (k, g), b in zip(valid, gic.grammars_to_keys([g for _, g in valid])) if b != k]
+  failures += [f"node {n.key!r}: grammar {n.grammar!r}, expected {_scalar(gic.key_to_grammar, n.key)!r}"
+               for n in nodes if _scalar(gic.key_to_grammar, n.key) != n.grammar]
+  return failures
+
+
+def _linear_tags(key: str) -> list:
+  # infer_tags_from_key before DomainTags: one startswith per domain
+  tags = ["ui"]
+  for domain in ("rite", "term", "bank", "shop", "sys", "site", "confess"):
+    if key.startswith(f"g.{domain}."):
+      tags.append(domain)
+      break
+  return tags
+
+
+def check_infer_tags(corpus: Path, tmp: str) -> list:
+  """DomainTags trie with the default rules vs the linear prefix chain."""
+  keys, _ = _grammar_keys(corpus)
+  keys += [k.replace("g.", "g.rite.", 1) for k in keys[:100]] + ["g.rite", "g.rite.", "g.site.x", "x.site.y", "site.x"]
+  domains = gic.DomainTags()
+  return [f"{k!r}: {domains.tags(k)} vs {_linear_tags(k)}" for k in keys if domains.tags(k) != _linear_tags(k)]
+
+
+def check_nodes_split(corpus: Path, tmp: str) -> list:
+  """nodes-split then nodes-merge vs writing the nodes directly, for file order and shuffled."""
+  nodes = gic.load_nodes(str(corpus / "grammar" / "nodes.json"))
+  # A domain named like the index file must get a shard of its own
+  nodes += [gic.Node("g.index.page.title", "[INDEX::PAGE::TITLE]", ["ui"]),
+            gic.Node("g.index.page.lead", "[INDEX::PAGE::LEAD]", ["ui"])]
+  shuffled = list(nodes)
+  random.Random(1).shuffle(shuffled)
+  failures = []
+  for label, order in (("file order", nodes), ("shuffled", shuffled)):
+    src = os.path.join(tmp, f"{label}.json")
+    gic.write_json(src, gic.nodes_document(order))
+    shards = os.path.join(tmp, f"{label}-shards")
+    merged = os.path.join(tmp, f"{label}-merged.json")
+    _run_cli("nodes-split", "--nodes", src, "--out-dir", shards)
+    _run_cli("nodes-merge", "--nodes", shards, "--out", merged)
+    if Path(merged).read_bytes() != Path(src).read_bytes():
+      failures.append(f"{label}: merged nodes.json is not byte-identical to the split input")
+    if [n.key for n in gic.load_nodes(shards, ["_other", "bank"])] != \
+       [n.key for n in order if gic.node_domain(n.key) in ("_other", "bank")]:
+      failures.append(f"{label}: --only-domains subset is not in input order")
+  return failures
+
+
+# (html, expected) for cleanpunc's stream mode, as the BeautifulSoup path
+# cleaned them; markup, scripts, attributes and other references stay.
+CLEANPUNC_CASES = [
+  ("<p>你好，世界！</p>", "<p>你好, 世界!</p>"),
+  ("<p>你好&#65292;世界&#xFF01;</p>", "<p>你好, 世界!</p>"),
+  ("<p>&ldquo;引&rdquo; &#20320; &amp; &lt;</p>", '<p>"引" &#20320; &amp; &lt;</p>'),
+  ("<p>見《書》</p>", "<p>見&lt;書&gt;</p>"),
+  ("<!-- 註，釋 --><p>a</p>", "<!-- 註, 釋 --><p>a</p>"),
+  ("<!-- a--》 -->", "<!-- a--》 -->"),
+  ("<script>var s = '，&#65292;';</script>", "<script>var s = '，&#65292;';</script>"),
+  ('<p title="屬性，">x</p>', '<p title="屬性，">x</p>'),
+  ("<p>a &#65292</p>", "<p>a &#65292</p>"),
+]
+
+
+def check_cleanpunc(corpus: Path, tmp: str) -> list:
+  """cleanpunc stream mode on fixed cases, read whole and one byte at a time."""
+  import cleanpunc
+
+  failures = []
+  for i, (src, want) in enumerate(CLEANPUNC_CASES):
+    for chunk_size in (1 << 20, 1):
+      path = os.path.join(tmp, f"case{i}.html")
+      Path(path).write_text(src, encoding="utf-8")
+      cleanpunc.clean_html_file(path, chunk_size)
+      got = Path(path).read_text(encoding="utf-8")
+      if got != want:
+        failures.append(f"{src!r} (chunk {chunk_size}): {got!r}, expected {want!r}")
+  return failures
+
+
+CHECKS = {
+  "patch": check_patch,
+  "grammar": check_grammar,
+  "infer_tags": check_infer_tags,
+  "nodes_split": check_nodes_split,
+  "cleanpunc": check_cleanpunc,
+}
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="bench_checks")
+  ap.add_argument("--corpus", default=None, help="Existing corpus dir (see corpus.py); generated if omitted.")
+  ap.add_argument("--keys", type=int, default=2000)
+  ap.add_argument("--langs", type=int, default=4)
+  ap.add_argument("--only", nargs="+", choices=sorted(CHECKS), default=None)
+  args = ap.parse_args()
+
+  import corpus as corpus_mod
+
+  failed = 0
+  with tempfile.TemporaryDirectory() as tmp:
+    if args.corpus:
+      root = Path(args.corpus)
+    else:
+      root = Path(tmp) / "corpus"
+      corpus_mod.generate(str(root), args.keys, args.langs, pages=1, page_kb=1)
+    for name in args.only or list(CHECKS):
+      with tempfile.TemporaryDirectory(dir=tmp) as work:
+        try:
+          failures = CHECKS[name](root, work)
+        except Exception as e:
+          failures = [f"raised {type(e).__name__}: {e}"]
+      print(f"[{'FAIL' if failures else 'OK'}] {name}" + (f": {len(failures)} failure(s)" if failures else ""))
+      for msg in failures:
+        print(f"  {msg}")
+      failed += bool(failures)
+  sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,153 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Synthetic corpus for the grammar/i18n tool benchmarks.
+
+Usage:
+  python tools/bench/corpus.py OUT_DIR [--keys 5000] [--langs 8] [--pages 200] [--page-kb 32]
+
+Writes a tree shaped like this repo, at any scale:
+  OUT_DIR/grammar/nodes.json   one node per key
+  OUT_DIR/i18n/<lang>.json     --langs catalogs; non-base languages miss
+                               --missing of the keys (so patch has work)
+  OUT_DIR/assets/i18n.data.js  the same catalogs as a JS object literal
+  OUT_DIR/site/**/*.html       --pages pages of ~--page-kb KB, data-i18n
+                               attributes plus full-width punctuation
+  OUT_DIR/txt/*.txt            the page texts as plain text files
+  OUT_DIR/corpus.json          the parameters and resulting sizes
+Output depends only on the parameters and --seed.
+"""
+
+import argparse
+import json
+import os
+import random
+import sys
+from pathlib import Path
+from typing import Dict, List
+
+DOMAINS = ["site", "rite", "term", "bank", "shop", "confess", "sys", "susfarm"]
+WORDS = "the quick brown fox jumps over the lazy dog at sus church grammar book node echo".split()
+HAN = [chr(c) for c in range(0x4E00, 0x4E00 + 3000)]
+FULLWIDTH = list("，。：“”‘’、（）《》【】！？／；")
+LANG_NAMES = ["en", "zh", "jp", "ko", "fr", "de", "es", "pt", "it", "ru", "ar", "hi", "th", "vi", "id", "tr"]
+
+
+def make_keys(n: int, rnd: random.Random) -> List[str]:
+  keys = []
+  for i in range(n):
+    depth = rnd.randint(1, 3)
+    parts = [rnd.choice(DOMAINS)] + [rnd.choice(WORDS) for _ in range(depth)] + [f"k{i}"]
+    keys.append("g." + ".".join(parts))
+  return keys
+
+
+def make_value(rnd: random.Random, lang: str) -> str:
+  if lang in ("zh", "jp"):
+    return "".join(rnd.choice(HAN) if rnd.random() > 0.1 else rnd.choice(FULLWIDTH) for _ in range(rnd.randint(4, 24)))
+  return " ".join(rnd.choice(WORDS) for _ in range(rnd.randint(1, 8))).capitalize()
+
+
+def lang_list(n: int) -> List[str]:
+  return [LANG_NAMES[i] if i < len(LANG_NAMES) else f"x{i}" for i in range(n)]
+
+
+def make_catalogs(keys: List[str], langs: List[str], missing: float, rnd: random.Random) -> Dict[str, Dict[str, str]]:
+  maps = {}
+  for i, lang in enumerate(langs):
+    drop = 0.0 if i == 0 else missing
+    maps[lang] = {k: make_value(rnd, lang) for k in keys if rnd.random() >= drop}
+  return maps
+
+
+def js_literal(s: str) -> str:
+  return "'" + s.replace("\\", "\\\\").replace("'", "\\'").replace("\n", "\\n") + "'"
+
+
+def write_i18n_js(path: Path, maps: Dict[str, Dict[str, str]]) -> None:
+  with open(path, "w", encoding="utf-8") as f:
+    f.write("// i18n system (synthetic)\nconst I18N = {\n")
+    for lang, m in maps.items():
+      f.write(f"  {lang}: {{\n")
+      for k, v in m.items():
+        f.write(f"    {js_literal(k)}: {js_literal(v)},\n")
+      f.write("  },\n")
+    f.write("};\nwindow.I18N = Object.assign(window.I18N || {}, I18N);\n")
+
+
+def make_page(keys: List[str], kb: int, rnd: random.Random) -> str:
+  parts = ["<!doctype html>\n<html><head><meta charset=\"utf-8\"><title>bench</title></head><body>\n"]
+  size = 0
+  i = 0
+  while size < kb * 1024:
+    text = "".join(rnd.choice(FULLWIDTH) if rnd.random() < 0.06 else rnd.choice(HAN) for _ in range(30))
+    row = f'<div class="row"><span data-i18n="{rnd.choice(keys)}">{text}</span><!-- c{i} --></div>\n'
+    if i % 25 == 0:
+      row += f"<script>var s{i} = '{text}';</script>\n"
+    parts.append(row)
+    size += len(row.encode("utf-8"))
+    i += 1
+  parts.append("</body></html>\n")
+  return "".join(parts)
+
+
+def generate(out_dir: str, keys: int = 5000, langs: int = 8, pages: int = 200, page_kb: int = 32,
+             missing: float = 0.05, seed: int = 1) -> dict:
+  rnd = random.Random(seed)
+  root = Path(out_dir)
+  key_list = make_keys(keys, rnd)
+  names = lang_list(langs)
+  maps = make_catalogs(key_list, names, missing, rnd)
+
+  (root / "grammar").mkdir(parents=True, exist_ok=True)
+  nodes = [{"key": k, "grammar": "[" + "::".join(p.upper() for p in k.split(".")[1:]) + "]",
+            "tags": ["ui", k.split(".")[1]], "notes": ""} for k in key_list]
+  (root / "grammar" / "nodes.json").write_text(json.dumps({"nodes": nodes}, ensure_ascii=False), encoding="utf-8")
+
+  (root / "i18n").mkdir(exist_ok=True)
+  for lang, m in maps.items():
+    (root / "i18n" / f"{lang}.json").write_text(json.dumps(m, ensure_ascii=False, indent=2), encoding="utf-8")
+
+  (root / "assets").mkdir(exist_ok=True)
+  write_i18n_js(root / "assets" / "i18n.data.js", maps)
+
+  site_bytes = 0
+  for p in range(pages):
+    page = make_page(key_list, page_kb, rnd)
+    # Ten pages per directory, so scans recurse
+    d = root / "site" / f"section{p // 10:03d}"
+    d.mkdir(parents=True, exist_ok=True)
+    (d / f"page{p:04d}.html").write_text(page, encoding="utf-8")
+    site_bytes += len(page.encode("utf-8"))
+    txt = root / "txt"
+    txt.mkdir(exist_ok=True)
+    (txt / f"page{p:04d}.txt").write_text(page, encoding="utf-8")
+
+  meta = {
+    "params": {"keys": keys, "langs": langs, "pages": pages, "page_kb": page_kb, "missing": missing, "seed": seed},
+    "i18n_bytes": sum(f.stat().st_size for f in (root / "i18n").iterdir()),
+    "i18n_js_bytes": (root / "assets" / "i18n.data.js").stat().st_size,
+    "site_bytes": site_bytes,
+  }
+  (root / "corpus.json").write_text(json.dumps(meta, indent=2), encoding="utf-8")
+  return meta
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="corpus")
+  ap.add_argument("out_dir")
+  ap.add_argument("--keys", type=int, default=5000)
+  ap.add_argument("--langs", type=int, default=8)
+  ap.add_argument("--pages", type=int, default=200)
+  ap.add_argument("--page-kb", type=int, default=32)
+  ap.add_argument("--missing", type=float, default=0.05, help="Share of keys each non-base language lacks.")
+  ap.add_argument("--seed", type=int, default=1)
+  args = ap.parse_args()
+  if os.path.exists(args.out_dir) and os.listdir(args.out_dir):
+    sys.exit(f"{args.out_dir} is not empty")
+  meta = generate(args.out_dir, args.keys, args.langs, args.pages, args.page_kb, args.missing, args.seed)
+  print(json.dumps(meta, indent=2))
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,264 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Benchmark suite for the grammar/i18n tooling and the punctuation cleaners.
+
+Usage:
+  python tools/bench/suite.py [--corpus DIR | --keys N --langs N --pages N --page-kb N]
+                              [--only NAME ...] [--repeat 3] [--out FILE]
+                              [--baseline FILE [--max-regression 0.25]]
+
+Without --corpus a synthetic corpus (tools/bench/corpus.py) is generated in
+a temp dir. Each benchmark runs in its own interpreter so its peak RSS is
+not inflated by earlier ones. Per benchmark it reports:
+  wall_s           best of --repeat runs (setup and file copies not timed)
+  peak_rss_kb      process high-water mark after the runs (ru_maxrss)
+  base_rss_kb      the same before the timed code ran (interpreter + inputs)
+  mb_per_s / items_per_s   throughput over the benchmark's input
+With --baseline, any wall_s more than --max-regression slower than the
+baseline's is listed and the exit status is 1.
+"""
+
+import argparse
+import contextlib
+import io
+import json
+import os
+import platform
+import resource
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+HERE = Path(__file__).resolve().parent
+sys.path.insert(0, str(HERE.parent.parent))
+sys.path.insert(0, str(HERE.parent))
+sys.path.insert(0, str(HERE))
+
+SUITE_VERSION = "bench-suite/1"
+
+
+def _rss_kb() -> int:
+  # Linux reports KB, macOS bytes
+  rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+  return rss // 1024 if sys.platform == "darwin" else rss
+
+
+def _tree_bytes(path: Path) -> int:
+  return sum(p.stat().st_size for p in path.rglob("*") if p.is_file())
+
+
+# Each bench(corpus, tmp) does its untimed setup and returns
+# (prepare, run, work): prepare() runs before every timed run() (or is
+# None), work is {"bytes": n} or {"items": n} for the throughput figure.
+
+def bench_read_i18n_dir(corpus: Path, tmp: str):
+  import grammar_i18n_compiler as gic
+  d = str(corpus / "i18n")
+  return None, lambda: gic.read_i18n_dir(d), {"bytes": _tree_bytes(corpus / "i18n")}
+
+
+def _nodes_and_maps(corpus: Path):
+  import grammar_i18n_compiler as gic
+  return gic.load_nodes(str(corpus / "grammar" / "nodes.json")), gic.read_i18n_dir(str(corpus / "i18n"))
+
+
+def bench_validate(corpus: Path, tmp: str):
+  import grammar_i18n_compiler as gic
+  nodes, maps = _nodes_and_maps(corpus)
+  return None, lambda: gic.validate(nodes, maps), {"items": len(nodes) * len(maps)}
+
+
+def bench_patch(corpus: Path, tmp: str):
+  import grammar_i18n_compiler as gic
+  nodes, maps = _nodes_and_maps(corpus)
+  base = next(iter(sorted(maps, key=lambda l: l != "en")))
+  return None, lambda: gic.patch(nodes, maps, base), {"items": len(nodes) * len(maps)}
+
+
+def bench_patch_delta(corpus: Path, tmp: str):
+  import grammar_i18n_compiler as gic
+  nodes, maps = _nodes_and_maps(corpus)
+  base = next(iter(sorted(maps, key=lambda l: l != "en")))
+  return None, lambda: gic.patch_delta(nodes, maps, base), {"items": len(nodes) * len(maps)}
+
+
+def bench_scan_ui_keys(corpus: Path, tmp: str):
+  import grammar_i18n_compiler as gic
+  paths = [str(corpus / "site")]
+  ignore = set(gic.DEFAULT_IGNORE_DIRS)
+  return None, lambda: gic.scan_ui_keys(paths, ignore), {"bytes": _tree_bytes(corpus / "site")}
+
+
+def bench_scan_ui_keys_cached(corpus: Path, tmp: str):
+  import grammar_i18n_compiler as gic
+  paths = [str(corpus / "site")]
+  ignore = set(gic.DEFAULT_IGNORE_DIRS)
+  cache = os.path.join(tmp, "scan_ui.json")
+  gic.scan_ui_keys(paths, ignore, cache)
+  # Entries written in the same tick as the cache are re-hashed once
+  time.sleep(0.01)
+  gic.scan_ui_keys(paths, ignore, cache)
+  return None, lambda: gic.scan_ui_keys(paths, ignore, cache), {"bytes": _tree_bytes(corpus / "site")}
+
+
+def bench_extract_i18n(corpus: Path, tmp: str):
+  import extract_i18n_json as ex
+  js = str(corpus / "assets" / "i18n.data.js")
+  return None, lambda: ex.extract_i18n(js), {"bytes": os.path.getsize(js)}
+
+
+def _fresh_copy(src: Path, dst: str):
+  def prepare():
+    shutil.rmtree(dst, ignore_errors=True)
+    shutil.copytree(src, dst)
+  return prepare
+
+
+def _quiet(fn):
+  def run():
+    with contextlib.redirect_stdout(io.StringIO()):
+      fn()
+  return run
+
+
+def bench_cleanpunc(corpus: Path, tmp: str):
+  import cleanpunc
+  dst = os.path.join(tmp, "site")
+  return (_fresh_copy(corpus / "site", dst), _quiet(lambda: cleanpunc.clean_html_files(dst, 1, "stream")),
+          {"bytes": _tree_bytes(corpus / "site")})
+
+
+def bench_puncc(corpus: Path, tmp: str):
+  import puncc
+  dst = os.path.join(tmp, "txt")
+  return (_fresh_copy(corpus / "txt", dst), _quiet(lambda: puncc.clean_txt_files(dst, 1)),
+          {"bytes": _tree_bytes(corpus / "txt")})
+
+
+BENCHES = {
+  "read_i18n_dir": bench_read_i18n_dir,
+  "validate": bench_validate,
+  "patch": bench_patch,
+  "patch_delta": bench_patch_delta,
+  "scan_ui_keys": bench_scan_ui_keys,
+  "scan_ui_keys_cached": bench_scan_ui_keys_cached,
+  "extract_i18n": bench_extract_i18n,
+  "cleanpunc": bench_cleanpunc,
+  "puncc": bench_puncc,
+}
+
+
+def run_one(name: str, corpus: Path, repeat: int) -> dict:
+  with tempfile.TemporaryDirectory() as tmp:
+    prepare, run, work = BENCHES[name](corpus, tmp)
+    if prepare:
+      prepare()
+    base_rss = _rss_kb()
+    wall = float("inf")
+    for _ in range(repeat):
+      if prepare:
+        prepare()
+      t0 = time.perf_counter()
+      run()
+      wall = min(wall, time.perf_counter() - t0)
+    result = {"wall_s": round(wall, 4), "peak_rss_kb": _rss_kb(), "base_rss_kb": base_rss}
+    if "bytes" in work:
+      result["bytes"] = work["bytes"]
+      result["mb_per_s"] = round(work["bytes"] / 1e6 / wall, 2) if wall else None
+    else:
+      result["items"] = work["items"]
+      result["items_per_s"] = round(work["items"] / wall) if wall else None
+    return result
+
+
+def run_isolated(name: str, corpus: Path, repeat: int) -> dict:
+  proc = subprocess.run(
+    [sys.executable, __file__, "--child", name, "--corpus", str(corpus), "--repeat", str(repeat)],
+    capture_output=True, text=True,
+  )
+  if proc.returncode != 0:
+    return {"error": (proc.stderr.strip().splitlines() or ["exit status %d" % proc.returncode])[-1]}
+  return json.loads(proc.stdout)
+
+
+def regressions(results: dict, baseline: dict, limit: float) -> list:
+  out = []
+  for name, cur in results.items():
+    old = baseline.get("results", {}).get(name)
+    if not old or "wall_s" not in old or "wall_s" not in cur or not old["wall_s"]:
+      continue
+    ratio = cur["wall_s"] / old["wall_s"]
+    if ratio > 1 + limit:
+      out.append(f"{name}: {old['wall_s']}s -> {cur['wall_s']}s ({(ratio - 1) * 100:.0f}% slower)")
+  return out
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="bench_suite")
+  ap.add_argument("--corpus", default=None, help="Existing corpus dir (see corpus.py); generated if omitted.")
+  ap.add_argument("--keys", type=int, default=5000)
+  ap.add_argument("--langs", type=int, default=8)
+  ap.add_argument("--pages", type=int, default=200)
+  ap.add_argument("--page-kb", type=int, default=32)
+  ap.add_argument("--only", nargs="+", choices=sorted(BENCHES), default=None)
+  ap.add_argument("--repeat", type=int, default=3)
+  ap.add_argument("--out", default=None, help="Also write the JSON result here.")
+  ap.add_argument("--baseline", default=None, help="Earlier --out file to compare wall times against.")
+  ap.add_argument("--max-regression", type=float, default=0.25)
+  ap.add_argument("--child", default=None, help=argparse.SUPPRESS)
+  args = ap.parse_args()
+
+  if args.child:
+    print(json.dumps(run_one(args.child, Path(args.corpus), max(1, args.repeat))))
+    return
+
+  import corpus as corpus_mod
+
+  with tempfile.TemporaryDirectory() as tmp:
+    if args.corpus:
+      root = Path(args.corpus)
+      try:
+        meta = json.loads((root / "corpus.json").read_text(encoding="utf-8"))
+      except (OSError, ValueError):
+        meta = {}
+    else:
+      root = Path(tmp) / "corpus"
+      meta = corpus_mod.generate(str(root), args.keys, args.langs, args.pages, args.page_kb)
+
+    names = args.only or list(BENCHES)
+    results = {}
+    for name in names:
+      results[name] = run_isolated(name, root, args.repeat)
+      print(f"[bench] {name}: {results[name]}", file=sys.stderr)
+
+  report = {
+    "version": SUITE_VERSION,
+    "time": time.strftime("%Y-%m-%dT%H:%M:%S%z"),
+    "python": platform.python_version(),
+    "platform": platform.platform(),
+    "cpus": os.cpu_count(),
+    "corpus": meta,
+    "repeat": args.repeat,
+    "results": results,
+  }
+  text = json.dumps(report, indent=2)
+  print(text)
+  if args.out:
+    os.makedirs(os.path.dirname(args.out) or ".", exist_ok=True)
+    Path(args.out).write_text(text + "\n", encoding="utf-8")
+
+  failed = [n for n, r in results.items() if "error" in r]
+  slow = []
+  if args.baseline:
+    slow = regressions(results, json.loads(Path(args.baseline).read_text(encoding="utf-8")), args.max_regression)
+    for line in slow:
+      print(f"[REGRESSION] {line}", file=sys.stderr)
+  sys.exit(1 if failed or slow else 0)
+
+
+if __name__ == "__main__":
+  main()
@@ -0,0 +1,521 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Static-site build: dist/site with minified text assets and precompressed
+siblings, so the host can serve foo.js.br / foo.js.gz without compressing
+anything per request.
+
+  python tools/build_site.py [--out dist/site] [--jobs N] [--force]
+
+Inputs are the same files tools/asset_manifest.py tracks (index.html,
+fractal.webp, assets/, susfarm/), including assets/pwa/sw.js.
+
+  .css            comments and redundant whitespace removed
+  .html           comments removed, whitespace runs collapsed (not inside
+                  <pre>/<textarea>); inline <style>/<script> minified too
+  .js             conservative: comments removed, whitespace collapsed,
+                  line breaks kept except where they cannot matter, so
+                  automatic semicolon insertion behaves exactly as before
+  .json/.webmanifest  re-serialized without whitespace
+  anything else   copied
+
+Text outputs get .gz (level 9) and .br (quality 11; needs the `brotli`
+package, skipped otherwise) siblings when they are smaller. A file whose
+content hash and build settings match dist/.cache/build_site.json and whose
+outputs exist is not rebuilt. Outputs for removed sources are deleted.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from asset_manifest import ROOT, HashCache, iter_site_files, read_json, write_text
+
+try:
+  import brotli
+except ImportError:
+  brotli = None
+
+BUILD_VERSION = "build-site/1"
+DEFAULT_OUT = os.path.join("dist", "site")
+DEFAULT_CACHE = os.path.join("dist", ".cache", "build_site.json")
+HASH_CACHE = os.path.join("dist", ".cache", "build_site_hashes.json")
+
+COMPRESS_EXTS = {".html", ".css", ".js", ".json", ".webmanifest", ".svg", ".txt", ".xml"}
+GZIP_LEVEL = 9
+BROTLI_QUALITY = 11
+
+
+# ---------------------------------------------------------------------------
+# CSS
+
+CSS_TOKEN_RE = re.compile(r"""
+    (?P<comment>/\*[\s\S]*?\*/)
+  | (?P<string>"(?:[^"\\\n]|\\[\s\S])*"|'(?:[^'\\\n]|\\[\s\S])*')
+  | (?P<space>\s+)
+""", re.X)
+
+# Whitespace next to these never matters. ':' only counts on its right-hand
+# side, because "a :hover" (descendant) differs from "a:hover".
+CSS_SPACE_BEFORE = set("{};,>")
+CSS_SPACE_AFTER = set("{};,>:(")
+
+
+def minify_css(src: str) -> str:
+  out: List[str] = []
+  plain: List[bool] = []  # out[k] is markup (not a string or kept comment)
+  pos = 0
+  space = False
+
+  def emit(text: str, is_plain: bool) -> None:
+    nonlocal space
+    if space and out:
+      last = out[-1][-1]
+      if last not in CSS_SPACE_AFTER and text[0] not in CSS_SPACE_BEFORE and text[0] != ")":
+        out.append(" ")
+        plain.append(True)
+    space = False
+    if is_plain:
+      # The last declaration in a block needs no ';'
+      text = re.sub(r";+}", "}", text)
+      if text[0] == "}" and out and plain[-1]:
+        out[-1] = out[-1].rstrip(";")
+        if not out[-1]:
+          out.pop()
+          plain.pop()
+    out.append(text)
+    plain.append(is_plain)
+
+  for m in CSS_TOKEN_RE.finditer(src):
+    if m.start() > pos:
+      emit(src[pos:m.start()], True)
+    pos = m.end()
+    kind = m.lastgroup
+    if kind == "space":
+      space = True
+    elif kind == "comment":
+      if m.group().startswith("/*!"):
+        emit(m.group(), False)
+      else:
+        space = True
+    else:
+      emit(m.group(), False)
+  if pos < len(src):
+    emit(src[pos:], True)
+  return "".join(out)
+
+
+# ---------------------------------------------------------------------------
+# JavaScript
+
+JS_LINE_TERMINATORS = "\n\r\u2028\u2029"
+JS_SPACE_RE = re.compile("[ \t\f\v\u00a0\ufeff]+")
+JS_WORD_RE = re.compile("[\\w$\\\\\u0080-\u2027\u202a-\uffff]+")
+JS_STRING_RE = {
+  "'": re.compile(r"'(?:[^'\\\n\r]|\\[\s\S])*'"),
+  '"': re.compile(r'"(?:[^"\\\n\r]|\\[\s\S])*"'),
+}
+JS_REGEX_RE = re.compile(r"/(?:[^/\\\[\n\r]|\\.|\[(?:[^\]\\\n\r]|\\.)*\])+/[A-Za-z]*")
+# Template text up to the closing backtick or the next ${
+JS_TEMPLATE_RE = re.compile(r"(?:[^`\\$]|\\[\s\S]|\$(?!\{))*")
+
+# Keywords after which '/' starts a regular expression, not a division
+JS_REGEX_KEYWORDS = {
+  "return", "typeof", "instanceof", "in", "of", "new", "delete", "void",
+  "throw", "case", "do", "else", "yield", "await",
+}
+# Whitespace next to these can go, unless the other side is a hazard:
+# "a + +b", "a - -b", "x / /re/", "1 .toString()" must keep their spaces.
+JS_SPACE_SAFE = set("{}()[];,:=?&|*%^~")
+JS_SPACE_HAZARD = set("+-/.")
+# A line break after / before these is never significant to ASI
+JS_NEWLINE_AFTER = set("{([;,:")
+JS_NEWLINE_BEFORE = set("})];,")
+
+
+class _Unparsed(Exception):
+  """Raised when the tokenizer is unsure; minify_js then leaves the source as is."""
+
+
+def minify_js(src: str) -> str:
+  """
+  Whitespace/comment stripping only: no renaming, no rewriting. Unknown or
+  unterminated constructs make this return the input unchanged.
+  """
+  try:
+    return _minify_js(src)
+  except _Unparsed:
+    return src
+
+
+def _minify_js(src: str) -> str:
+  out: List[str] = []
+  n = len(src)
+  i = 0
+  prev = ""            # last significant token, for regex-vs-division
+  pending = ""         # "", " " or "\n": whitespace seen since the last token
+  braces: List[bool] = []  # per open '{': True if it opened a template ${
+
+  def emit(tok: str) -> None:
+    nonlocal pending
+    if out and pending:
+      last = out[-1][-1]
+      first = tok[0]
+      if pending == "\n":
+        if last not in JS_NEWLINE_AFTER and first not in JS_NEWLINE_BEFORE:
+          out.append("\n")
+      elif (last in JS_SPACE_SAFE or first in JS_SPACE_SAFE) and \
+          last not in JS_SPACE_HAZARD and first not in JS_SPACE_HAZARD:
+        pass
+      else:
+        out.append(" ")
+    pending = ""
+    out.append(tok)
+
+  def template_part(start: int) -> str:
+    # src[start - 1] is the opening '`' or the '}' closing a ${...}.
+    # Returns the token to use as `prev`.
+    nonlocal i
+    m = JS_TEMPLATE_RE.match(src, start)
+    end = m.end()
+    if src.startswith("`", end):
+      emit(src[start - 1:end + 1])
+      i = end + 1
+      return "str"
+    if src.startswith("${", end):
+      emit(src[start - 1:end + 2])
+      braces.append(True)
+      i = end + 2
+      return "{"
+    raise _Unparsed()
+
+  while i < n:
+    c = src[i]
+    if c in JS_LINE_TERMINATORS:
+      pending = "\n"
+      i += 1
+      continue
+    m = JS_SPACE_RE.match(src, i)
+    if m:
+      if not pending:
+        pending = " "
+      i = m.end()
+      continue
+    if src.startswith("//", i):
+      j = i + 2
+      while j < n and src[j] not in JS_LINE_TERMINATORS:
+        j += 1
+      if not pending:
+        pending = " "
+      i = j
+      continue
+    if src.startswith("/*", i):
+      j = src.find("*/", i + 2)
+      if j < 0:
+        raise _Unparsed()
+      body = src[i:j + 2]
+      if body.startswith("/*!"):
+        emit(body)
+      elif any(t in body for t in JS_LINE_TERMINATORS):
+        # A multi-line comment counts as a line break for ASI
+        pending = "\n"
+      elif not pending:
+        pending = " "
+      i = j + 2
+      continue
+    if c in "'\"":
+      m = JS_STRING_RE[c].match(src, i)
+      if not m:
+        raise _Unparsed()
+      emit(m.group())
+      prev = "str"
+      i = m.end()
+      continue
+    if c == "`":
+      prev = template_part(i + 1)
+      continue
+    if c == "}" and braces and braces[-1]:
+      braces.pop()
+      # Close of ${...}: the template text continues. The piece starts with
+      # '}' so emit() treats it as a closing brace.
+      pending = ""
+      prev = template_part(i + 1)
+      continue
+    if c == "/":
+      regex_ok = (prev == "" or (prev not in ("word", "str", "regex", ")", "]", "++", "--"))
+                  or prev in JS_REGEX_KEYWORDS)
+      if regex_ok:
+        m = JS_REGEX_RE.match(src, i)
+        if m:
+          emit(m.group())
+          prev = "regex"
+          i = m.end()
+          continue
+      emit(c)
+      prev = c
+      i += 1
+      continue
+    m = JS_WORD_RE.match(src, i)
+    if m:
+      word = m.group()
+      emit(word)
+      prev = word if word in JS_REGEX_KEYWORDS else "word"
+      i = m.end()
+      continue
+    if src.startswith("++", i) or src.startswith("--", i):
+      emit(src[i:i + 2])
+      prev = src[i:i + 2]
+      i += 2
+      continue
+    if c == "{":
+      braces.append(False)
+    elif c == "}":
+      if braces:
+        braces.pop()
+    emit(c)
+    prev = c
+    i += 1
+
+  if braces and any(braces):
+    raise _Unparsed()
+  return "".join(out) + ("\n" if out else "")
+
+
+# ---------------------------------------------------------------------------
+# HTML
+
+HTML_TOKEN_RE = re.compile(r"""
+    (?P<comment><!--[\s\S]*?-->)
+  | (?P<raw><(?P<rawname>pre|textarea|script|style)\b(?:[^>"']|"[^"]*"|'[^']*')*>)
+  | (?P<tag></?[A-Za-z][^\s/>]*(?:[^>"']|"[^"]*"|'[^']*')*>|<![^>]*>)
+""", re.X | re.I)
+HTML_ATTR_SPACE_RE = re.compile(r"""(?P<quoted>"[^"]*"|'[^']*')|(?P<tail>\s+(?=/?>$))|\s+""")
+SCRIPT_TYPE_RE = re.compile(r"""\btype\s*=\s*["']?([^"'\s>]+)""", re.I)
+JS_MIME_TYPES = {"", "text/javascript", "application/javascript", "module"}
+
+
+def _collapse_tag(tag: str) -> str:
+  # Whitespace runs inside a tag (outside attribute values) become one space
+  def repl(m):
+    if m.group("quoted"):
+      return m.group("quoted")
+    return "" if m.group("tail") else " "
+  return HTML_ATTR_SPACE_RE.sub(repl, tag)
+
+
+def _collapse_text(text: str) -> str:
+  return re.sub(r"\s+", lambda m: "\n" if "\n" in m.group() else " ", text)
+
+
+def minify_html(src: str) -> str:
+  out: List[str] = []
+  pos = 0
+  lower = src.lower()
+  for m in HTML_TOKEN_RE.finditer(src):
+    if m.start() < pos:
+      continue  # inside a raw element already consumed
+    out.append(_collapse_text(src[pos:m.start()]))
+    pos = m.end()
+    if m.group("comment") is not None:
+      # Conditional comments and <!--! ... --> are kept
+      body = m.group()
+      if body.startswith("<!--[if") or body.startswith("<!--!"):
+        out.append(body)
+      continue
+    if m.group("raw") is not None:
+      name = m.group("rawname").lower()
+      end = lower.find(f"</{name}", pos)
+      if end < 0:
+        end = len(src)
+      close = src.find(">", end)
+      close = len(src) if close < 0 else close + 1
+      open_tag = m.group("raw")
+      body = src[pos:end]
+      if name == "style":
+        body = minify_css(body).strip()
+      elif name == "script":
+        t = SCRIPT_TYPE_RE.search(open_tag)
+        if (t.group(1).lower() if t else "") in JS_MIME_TYPES:
+          body = minify_js(body).strip()
+      out.append(_collapse_tag(open_tag) + body + src[end:close])
+      pos = close
+      continue
+    out.append(_collapse_tag(m.group()))
+  out.append(_collapse_text(src[pos:]))
+  return "".join(out).strip() + "\n"
+
+
+def minify_json(src: str) -> str:
+  return json.dumps(json.loads(src), ensure_ascii=False, separators=(",", ":"))
+
+
+MINIFIERS = {
+  ".css": minify_css,
+  ".js": minify_js,
+  ".html": minify_html,
+  ".json": minify_json,
+  ".webmanifest": minify_json,
+}
+
+
+# ---------------------------------------------------------------------------
+# Build
+
+def _write_bytes(path: str, data: bytes) -> None:
+  os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+  tmp = f"{path}.{os.getpid()}.tmp"
+  with open(tmp, "wb") as f:
+    f.write(data)
+  os.replace(tmp, path)
+
+
+def output_names(rel: str, with_br: bool) -> List[str]:
+  names = [rel]
+  if Path(rel).suffix.lower() in COMPRESS_EXTS:
+    names.append(rel + ".gz")
+    if with_br:
+      names.append(rel + ".br")
+  return names
+
+
+def build_one(job: Tuple[str, str, str]) -> Tuple[str, Optional[dict], Optional[str]]:
+  """
+  Worker: minify + compress one file. Returns (rel, stats, error); stats
+  lists the outputs actually written (a sibling that would not be smaller
+  than the minified file is skipped).
+  """
+  rel, src_path, out_root = job
+  try:
+    with open(src_path, "rb") as f:
+      raw = f.read()
+    ext = Path(rel).suffix.lower()
+    data = raw
+    if ext in MINIFIERS:
+      data = MINIFIERS[ext](raw.decode("utf-8")).encode("utf-8")
+      if len(data) > len(raw):
+        data = raw
+    dst = os.path.join(out_root, rel)
+    _write_bytes(dst, data)
+    stats = {"src": len(raw), "min": len(data), "outputs": [rel]}
+    if ext in COMPRESS_EXTS:
+      # mtime=0 keeps the .gz byte-identical across rebuilds
+      gz = gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)
+      if len(gz) < len(data):
+        _write_bytes(dst + ".gz", gz)
+        stats["gz"] = len(gz)
+        stats["outputs"].append(rel + ".gz")
+      if brotli is not None:
+        br = brotli.compress(data, quality=BROTLI_QUALITY)
+        if len(br) < len(data):
+          _write_bytes(dst + ".br", br)
+          stats["br"] = len(br)
+          stats["outputs"].append(rel + ".br")
+    return rel, stats, None
+  except Exception as e:
+    return rel, None, str(e)
+
+
+def load_build_cache(path: str) -> Dict[str, dict]:
+  try:
+    obj = read_json(path)
+  except (OSError, ValueError):
+    return {}
+  if obj.get("version") != BUILD_VERSION or not isinstance(obj.get("files"), dict):
+    return {}
+  return obj["files"]
+
+
+def settings_key() -> str:
+  return json.dumps([BUILD_VERSION, GZIP_LEVEL, BROTLI_QUALITY if brotli else None])
+
+
+def prune(out_root: Path, keep: set) -> int:
+  removed = 0
+  if not out_root.is_dir():
+    return 0
+  for dirpath, _, files in os.walk(out_root, topdown=False):
+    for fn in files:
+      p = Path(dirpath) / fn
+      if p.relative_to(out_root).as_posix() not in keep:
+        p.unlink()
+        removed += 1
+    if Path(dirpath) != out_root and not os.listdir(dirpath):
+      os.rmdir(dirpath)
+  return removed
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="build_site")
+  ap.add_argument("--root", default=str(ROOT), help="Site root (default: repo root).")
+  ap.add_argument("--out", default=DEFAULT_OUT)
+  ap.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = one per CPU).")
+  ap.add_argument("--force", action="store_true", help="Rebuild every file.")
+  args = ap.parse_args()
+
+  t0 = time.perf_counter()
+  root = Path(args.root)
+  out_root = root / args.out
+  cache_path = str(root / DEFAULT_CACHE)
+  if brotli is None:
+    print("[WARN] brotli not installed (pip install brotli); writing .gz siblings only")
+
+  files = iter_site_files(root, exclude=[])
+  hashes = HashCache(str(root / HASH_CACHE))
+  settings = settings_key()
+  cache = {} if args.force else load_build_cache(cache_path)
+
+  new_cache: Dict[str, dict] = {}
+  jobs = []
+  for rel in files:
+    digest = hashes.sha256(str(root / rel))
+    entry = cache.get(rel)
+    if (entry and entry.get("sha256") == digest and entry.get("settings") == settings
+        and all((out_root / o).exists() for o in entry["stats"]["outputs"])):
+      new_cache[rel] = entry
+      continue
+    new_cache[rel] = {"sha256": digest, "settings": settings}
+    jobs.append((rel, str(root / rel), str(out_root)))
+
+  workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+  # Largest first so the pool's tail is short
+  jobs.sort(key=lambda j: -os.path.getsize(j[1]))
+  if workers <= 1 or len(jobs) <= 1:
+    results = list(map(build_one, jobs))
+  else:
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+      results = list(pool.map(build_one, jobs))
+
+  failed = 0
+  for rel, stats, error in results:
+    if error is not None:
+      failed += 1
+      new_cache.pop(rel, None)
+      print(f"[FAIL] {rel}: {error}")
+    else:
+      new_cache[rel]["stats"] = stats
+
+  keep = {o for e in new_cache.values() for o in e["stats"]["outputs"]}
+  removed = prune(out_root, keep)
+  write_text(cache_path, json.dumps({"version": BUILD_VERSION, "files": new_cache}, sort_keys=True))
+  hashes.save()
+
+  def total(key: str) -> int:
+    return sum(e["stats"].get(key, e["stats"]["min"]) for e in new_cache.values()
+               if Path(e["stats"]["outputs"][0]).suffix.lower() in COMPRESS_EXTS)
+
+  print(f"[OK] {len(files)} files: {len(jobs) - failed} built, {len(files) - len(jobs)} up to date, "
+        f"{failed} failed, {removed} stale outputs removed ({time.perf_counter() - t0:.2f}s)")
+  print(f"[INFO] text assets: {total('src')} B source, {total('min')} B minified, "
+        f"{total('gz')} B gzip" + (f", {total('br')} B brotli" if brotli else ""))
+  sys.exit(1 if failed else 0)
+
+
+if __name__ == "__main__":
+  main()
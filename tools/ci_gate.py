@@ -1,19 +1,23 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 
+import argparse
 import json
 import sys
 from pathlib import Path
+from typing import List, Optional
+
+BUDGET_CONFIG = "tools/budget.json"
+BUDGET_BASELINE = "tools/budget_baseline.json"
+BUDGET_REPORT = "dist/reports/budget.json"
+# Allowed growth over the baseline: the larger of ratio * baseline and min_bytes
+DEFAULT_REGRESSION = {"ratio": 0.05, "min_bytes": 1024}
 
 def read_json(p: str) -> dict:
   return json.loads(Path(p).read_text(encoding="utf-8"))
 
-def main():
-  # Inputs: paths to reports
-  ui_missing = read_json("dist/reports/ui_missing_in_nodes.json")
-  missing_keys = read_json("dist/reports/missing_keys.json")
-  orphan_keys = read_json("dist/reports/orphan_keys.json")
-
+def evaluate_gates(ui_missing: dict, missing_keys: dict) -> List[str]:
+  """Apply the gate rules to the report objects; returns failure messages."""
   errors = []
 
   if ui_missing.get("count", 0) != 0:
@@ -25,6 +29,10 @@ def main():
   if missing_total != 0:
     errors.append(f"[FAIL] Missing i18n translations for node keys (sum over langs): {missing_total}")
 
+  return errors
+
+def print_gate_result(errors: List[str], orphan_keys: dict) -> int:
+  """Print the gate outcome; returns the process exit code."""
   # orphan_keys here means "i18n has g.* not in nodes" (compiler's orphan report)
   # We do NOT fail on this, because you intentionally keep legacy keys as backups.
   # But we print it for visibility.
@@ -33,12 +41,109 @@ def main():
   if errors:
     print("\n".join(errors))
     print(f"[INFO] i18n orphan keys (legacy allowed): {orphan_count}")
-    sys.exit(1)
+    return 1
 
   print("[OK] Grammar ↔ i18n gates passed.")
   print(f"[INFO] i18n orphan keys (legacy allowed): {orphan_count}")
-  sys.exit(0)
+  return 0
+
+def _page_sizes(entry: dict) -> dict:
+  # { "js": {raw, gzip, br}, ..., "total": {...} } of one page in a budget report
+  return dict(entry.get("types", {}), total=entry.get("total", {}))
+
+def evaluate_budget(report: dict, config: dict, baseline: Optional[dict] = None) -> List[str]:
+  """
+  Page-weight rules over a tools/page_budget.py report: every size the
+  config lists must be within budget, and no size may grow past the
+  baseline's by more than the allowed regression. Returns failure messages.
+  """
+  errors = []
+  reg = dict(DEFAULT_REGRESSION, **config.get("regression", {}))
+  base_pages = (baseline or {}).get("pages", {})
+
+  for page, budgets in config.get("pages", {}).items():
+    entry = report.get("pages", {}).get(page)
+    if entry is None or "error" in entry:
+      errors.append(f"[FAIL] Budget: {page}: {(entry or {}).get('error', 'not measured')}")
+      continue
+    sizes = _page_sizes(entry)
+    for kind, limits in budgets.items():
+      for metric, limit in limits.items():
+        size = sizes.get(kind, {}).get(metric)
+        if size is not None and size > limit:
+          errors.append(f"[FAIL] Budget: {page} {kind} {metric}: {size} B > {limit} B")
+
+    base = base_pages.get(page)
+    if base is None:
+      continue
+    for kind, old_sizes in _page_sizes(base).items():
+      for metric, old in old_sizes.items():
+        size = sizes.get(kind, {}).get(metric)
+        if size is None or old is None:
+          continue
+        allowed = old + max(reg["min_bytes"], int(old * reg["ratio"]))
+        if size > allowed:
+          errors.append(f"[FAIL] Regression: {page} {kind} {metric}: {old} B -> {size} B (allowed {allowed} B)")
+
+  return errors
+
+def budget_baseline(report: dict) -> dict:
+  """The per-type and total sizes of a report, without the asset lists."""
+  return {
+    "version": report.get("version"),
+    "pages": {
+      page: {"types": e["types"], "total": e["total"]}
+      for page, e in report.get("pages", {}).items() if "error" not in e
+    },
+  }
+
+def run_budget_gate(root: Optional[str], config_path: str, baseline_path: str, report_path: str, update: bool) -> List[str]:
+  """Measure the pages, write the report (with the gate result) and return failures."""
+  from page_budget import ROOT, build_report, write_text
+
+  config = read_json(config_path)
+  report = build_report(Path(root).resolve() if root else ROOT, config)
+  baseline = None
+  if not update and Path(baseline_path).exists():
+    baseline = read_json(baseline_path)
+  errors = evaluate_budget(report, config, baseline)
+  if update:
+    write_text(baseline_path, json.dumps(budget_baseline(report), indent=2) + "\n")
+    print(f"[INFO] budget baseline updated: {baseline_path}")
+  # After an update the report's own sizes are the baseline
+  report["baseline"] = baseline_path if baseline or update else None
+  report["failures"] = errors
+  write_text(report_path, json.dumps(report, indent=2) + "\n")
+  return errors
+
+def main():
+  ap = argparse.ArgumentParser(prog="ci_gate")
+  ap.add_argument("--budget", action="store_true", help="Also run the page-weight budget gate.")
+  ap.add_argument("--no-i18n", action="store_true", help="Skip the grammar/i18n report gates.")
+  ap.add_argument("--budget-root", default=None, help="Site root to measure (default: repo root; or dist/site).")
+  ap.add_argument("--budget-config", default=BUDGET_CONFIG)
+  ap.add_argument("--budget-baseline", default=BUDGET_BASELINE)
+  ap.add_argument("--budget-report", default=BUDGET_REPORT)
+  ap.add_argument("--update-baseline", action="store_true", help="Store the current sizes as the new baseline.")
+  args = ap.parse_args()
+  if args.no_i18n and not args.budget:
+    ap.error("--no-i18n leaves no gate to run; add --budget")
+
+  errors = []
+  if args.budget:
+    errors += run_budget_gate(args.budget_root, args.budget_config, args.budget_baseline,
+                              args.budget_report, args.update_baseline)
+  if args.no_i18n:
+    print("\n".join(errors) if errors else "[OK] Page-weight budget gate passed.")
+    sys.exit(1 if errors else 0)
+
+  # Inputs: paths to reports
+  ui_missing = read_json("dist/reports/ui_missing_in_nodes.json")
+  missing_keys = read_json("dist/reports/missing_keys.json")
+  orphan_keys = read_json("dist/reports/orphan_keys.json")
+
+  errors += evaluate_gates(ui_missing, missing_keys)
+  sys.exit(print_gate_result(errors, orphan_keys))
 
 if __name__ == "__main__":
   main()
-
@@ -1,130 +1,210 @@
 #!/usr/bin/env python3
 # -*- coding: utf-8 -*-
 """
-Extract i18n data from assets/i18n.js to JSON files
-Manual parsing approach
+Extract i18n data from assets/i18n.data.js to JSON files
+Single-pass tokenizer over the I18N object literal
 """
 
 import json
 import os
 import re
+from typing import Dict, Iterator, Tuple
 
-def extract_i18n(js_file):
-    """Extract I18N object manually"""
-    with open(js_file, 'r', encoding='utf-8') as f:
-        content = f.read()
-    
-    # Find the I18N object - extract just the object definition part
-    # Stop before the functions start
-    i18n_start = content.find('const I18N = {')
-    if i18n_start == -1:
+# Where the object literal starts: `const I18N = {`, `window.I18N = {`, ...
+# Comments and strings before it are skipped whole so a commented-out or
+# quoted assignment is not mistaken for the real one.
+PREAMBLE_RE = re.compile(r"""
+    (?P<start>\bI18N\s*=\s*\{)
+  | //[^\n]*
+  | /\*[^*]*\*+(?:[^/*][^*]*\*+)*/
+  | '[^'\\\n]*(?:\\[\s\S][^'\\\n]*)*'
+  | "[^"\\\n]*(?:\\[\s\S][^"\\\n]*)*"
+  | `[^`\\]*(?:\\[\s\S][^`\\]*)*`
+  | [^/'"`I]+
+  | [\s\S]
+""", re.X)
+
+# Whitespace and comments between tokens
+SKIP = r"(?:\s+|//[^\n]*|/\*[^*]*\*+(?:[^/*][^*]*\*+)*/)*"
+
+# String patterns are unrolled loops ("normal* (special normal*)*") so they
+# never backtrack.
+STR = r"""(?:'[^'\\\n]*(?:\\(?:\r\n|[\s\S])[^'\\\n]*)*'|"[^"\\\n]*(?:\\(?:\r\n|[\s\S])[^"\\\n]*)*")"""
+NAME = r"(?:[A-Za-z_$][\w$]*|\d[\w.]*)"
+
+# One token per match, with the skippable prefix folded in.
+TOKEN_RE = re.compile(SKIP + r"""
+    (?:
+        (?P<str>""" + STR + r""")
+      | (?P<tpl>`[^`\\$]*(?:(?:\\[\s\S]|\$(?!\{))[^`\\$]*)*`)
+      | (?P<name>""" + NAME + r""")
+      | (?P<punct>[{}:,+])
+    )
+""", re.X)
+
+# Fast path: a whole `'key': 'value',` entry (or the last one before `}`)
+# in one match. Anything else falls back to TOKEN_RE.
+ENTRY_RE = re.compile(
+    SKIP + r"(?P<key>" + STR + "|" + NAME + r")\s*:\s*(?P<value>" + STR + ")" + SKIP + r"(?:,|(?=\}))"
+)
+
+ESCAPE_RE = re.compile(
+    r"\\(?:u\{([0-9A-Fa-f]+)\}|u([0-9A-Fa-f]{4})|x([0-9A-Fa-f]{2})"
+    r"|([0-3][0-7]{1,2}|[4-7][0-7]|[1-7])|(\r\n|[\s\S]))"
+)
+
+# Escapes where JS and Python's unicode_escape codec disagree: \u{...},
+# legacy octal, and identity escapes like \- (JS drops the backslash).
+NON_PY_ESCAPE_RE = re.compile(r"\\(?:u\{|[0-7]{2}|[^nrtbfv0'\"\\xu\n])")
+SURROGATE_RE = re.compile('[\ud800-\udfff]')
+
+SIMPLE_ESCAPES = {
+    'n': '\n', 't': '\t', 'r': '\r', 'b': '\b', 'f': '\f', 'v': '\v', '0': '\0',
+    # Line continuations produce nothing
+    '\n': '', '\r': '', '\r\n': '', '\u2028': '', '\u2029': '',
+}
+
+
+def _unescape_match(m):
+    if m.group(5) is not None:
+        c = m.group(5)
+        return SIMPLE_ESCAPES.get(c, c)
+    if m.group(4) is not None:
+        # Legacy octal escape
+        return chr(int(m.group(4), 8))
+    return chr(int(m.group(1) or m.group(2) or m.group(3), 16))
+
+
+def js_string_value(literal):
+    """Value of a JS string or substitution-free template literal token"""
+    body = literal[1:-1]
+    if literal[0] == '`':
+        # Template literals normalise raw CR/CRLF to LF
+        body = body.replace('\r\n', '\n').replace('\r', '\n')
+    if '\\' not in body:
+        return body
+    if NON_PY_ESCAPE_RE.search(body) is None:
+        # Common case, decoded in C; non-ASCII text survives as \uXXXX
+        value = body.encode('latin-1', 'backslashreplace').decode('unicode_escape')
+    else:
+        value = ESCAPE_RE.sub(_unescape_match, body)
+    # \uD83D\uDE00-style pairs decode to lone surrogates; join them
+    if SURROGATE_RE.search(value):
+        value = value.encode('utf-16', 'surrogatepass').decode('utf-16', 'replace')
+    return value
+
+
+def _line_of(text, pos):
+    return text.count('\n', 0, pos) + 1
+
+
+def _next(text, pos):
+    """(kind, value, start, end) of the token at pos"""
+    m = TOKEN_RE.match(text, pos)
+    if m is None:
+        # Unterminated string, `${...}` template, regex literal, stray
+        # operator, or end of file.
+        raise ValueError(f"line {_line_of(text, pos)}: unexpected input in I18N object")
+    kind = m.lastgroup
+    return kind, m.group(kind), m.start(kind), m.end()
+
+
+def _expect(text, pos, want):
+    kind, value, at, pos = _next(text, pos)
+    if value != want:
+        raise ValueError(f"line {_line_of(text, at)}: expected '{want}', got {value!r}")
+    return pos
+
+
+def _key(kind, value, text, at):
+    if kind == 'name':
+        return value
+    if kind in ('str', 'tpl'):
+        return js_string_value(value)
+    raise ValueError(f"line {_line_of(text, at)}: expected a property name, got {value!r}")
+
+
+def iter_i18n_entries(text) -> Iterator[Tuple[str, str, str]]:
+    """
+    Yields (lang, key, value) for every entry of the I18N object literal,
+    in source order. Language blocks are discovered, not listed.
+    Values may be string or template literals, optionally joined with '+'.
+    """
+    start = next((m for m in PREAMBLE_RE.finditer(text) if m.lastgroup == 'start'), None)
+    if start is None:
         raise ValueError("Could not find I18N object")
-    
-    # Find where the I18N object ends (before functions)
-    # Look for the closing brace after all language objects
-    i18n_part = content[i18n_start:]
-    
-    # Find the matching closing brace for I18N
-    brace_count = 0
-    i18n_end = 0
-    in_string = False
-    string_char = None
-    
-    for i, char in enumerate(i18n_part):
-        if char in ('"', "'") and (i == 0 or i18n_part[i-1] != '\\'):
-            if not in_string:
-                in_string = True
-                string_char = char
-            elif char == string_char:
-                in_string = False
-                string_char = None
-        elif not in_string:
-            if char == '{':
-                brace_count += 1
-            elif char == '}':
-                brace_count -= 1
-                if brace_count == 0:
-                    i18n_end = i + 1
+    pos = start.end()
+
+    while True:
+        kind, value, at, pos = _next(text, pos)
+        if value == '}':
+            return
+        if value == ',':
+            continue
+        lang = _key(kind, value, text, at)
+        pos = _expect(text, pos, ':')
+        pos = _expect(text, pos, '{')
+
+        while True:
+            m = ENTRY_RE.match(text, pos)
+            if m is not None:
+                pos = m.end()
+                key = m.group('key')
+                if key[0] in '\'"':
+                    key = js_string_value(key)
+                yield lang, key, js_string_value(m.group('value'))
+                continue
+
+            kind, value, at, pos = _next(text, pos)
+            if value == '}':
+                break
+            if value == ',':
+                continue
+            key = _key(kind, value, text, at)
+            pos = _expect(text, pos, ':')
+            parts = []
+            while True:
+                kind, value, at, pos = _next(text, pos)
+                if kind not in ('str', 'tpl'):
+                    raise ValueError(f"line {_line_of(text, at)}: {lang}.{key} is not a string literal")
+                parts.append(js_string_value(value))
+                # Peek: consume '+' only; ',' / '}' are left for the loop
+                _, nxt, _, end = _next(text, pos)
+                if nxt != '+':
                     break
-    
-    i18n_object_str = i18n_part[:i18n_end]
-    
-    # Now extract each language
-    langs = {}
-    for lang in ['en', 'zh', 'jp']:
-        # Find lang: { ... }
-        lang_pattern = rf"{lang}:\s*\{{"
-        match = re.search(lang_pattern, i18n_object_str)
-        
-        if match:
-            start_pos = match.end()
-            # Find matching closing brace
-            brace_count = 1
-            in_string = False
-            string_char = None
-            end_pos = start_pos
-            
-            for i in range(start_pos, len(i18n_object_str)):
-                char = i18n_object_str[i]
-                
-                if char in ('"', "'") and (i == 0 or i18n_object_str[i-1] != '\\'):
-                    if not in_string:
-                        in_string = True
-                        string_char = char
-                    elif char == string_char:
-                        in_string = False
-                        string_char = None
-                elif not in_string:
-                    if char == '{':
-                        brace_count += 1
-                    elif char == '}':
-                        brace_count -= 1
-                        if brace_count == 0:
-                            end_pos = i
-                            break
-            
-            lang_block = i18n_object_str[start_pos:end_pos]
-            lang_dict = {}
-            
-            # Extract key-value pairs - handle single quotes with escaped content
-            # Pattern: 'key': 'value',
-            # Handle multiline and escaped quotes
-            kv_pattern = r"'([^']+)':\s*'((?:[^'\\]|\\.|\\n)*?)'"
-            
-            for match in re.finditer(kv_pattern, lang_block, re.DOTALL):
-                key = match.group(1)
-                value = match.group(2)
-                # Unescape
-                value = value.replace("\\'", "'")
-                value = value.replace('\\"', '"')
-                value = value.replace('\\n', '\n')
-                value = value.replace('\\t', '\t')
-                value = value.replace('\\\\', '\\')
-                lang_dict[key] = value
-            
-            langs[lang] = lang_dict
-    
+                pos = end
+            yield lang, key, ''.join(parts)
+
+
+def extract_i18n(js_file) -> Dict[str, Dict[str, str]]:
+    """Extract I18N object: { lang: { key: value } }"""
+    with open(js_file, 'r', encoding='utf-8') as f:
+        content = f.read()
+
+    langs: Dict[str, Dict[str, str]] = {}
+    for lang, key, value in iter_i18n_entries(content):
+        langs.setdefault(lang, {})[key] = value
     return langs
 
 def main():
-    js_file = 'assets/i18n.js'
+    js_file = 'assets/i18n.data.js'
     output_dir = 'i18n'
-    
+
     if not os.path.exists(js_file):
         print(f"Error: {js_file} not found")
         return
-    
+
     os.makedirs(output_dir, exist_ok=True)
-    
+
     print(f"Extracting i18n data from {js_file}...")
     langs = extract_i18n(js_file)
-    
+
     for lang, data in langs.items():
         output_file = os.path.join(output_dir, f'{lang}.json')
         with open(output_file, 'w', encoding='utf-8') as f:
             json.dump(data, f, ensure_ascii=False, indent=2)
         print(f"  ✓ Extracted {len(data)} keys to {output_file}")
-    
+
     print(f"\nTotal languages: {len(langs)}")
     total_keys = set()
     for data in langs.values():
@@ -0,0 +1,195 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Minimal filesystem change source for long-running tools.
+
+Uses Linux inotify through ctypes when available and falls back to
+stat polling everywhere else. No third-party dependencies.
+"""
+
+import ctypes
+import ctypes.util
+import os
+import select
+import struct
+import sys
+import time
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+# Returned by poll() when events were lost and callers must rescan.
+RESCAN = "*"
+
+IN_CLOSE_WRITE = 0x00000008
+IN_MOVED_FROM = 0x00000040
+IN_MOVED_TO = 0x00000080
+IN_CREATE = 0x00000100
+IN_DELETE = 0x00000200
+IN_DELETE_SELF = 0x00000400
+IN_Q_OVERFLOW = 0x00004000
+IN_IGNORED = 0x00008000
+IN_ISDIR = 0x40000000
+
+_WATCH_MASK = IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE | IN_DELETE_SELF
+_EVENT_HEADER = struct.Struct("iIII")
+
+# Roots: (directory, recursive)
+Roots = List[Tuple[str, bool]]
+
+
+def _walk_dirs(root: str, ignore_dirs: Set[str]) -> Iterable[str]:
+  for dirpath, dirnames, _ in os.walk(root):
+    dirnames[:] = [d for d in dirnames if d not in ignore_dirs]
+    yield dirpath
+
+
+def _walk_files(root: str, recursive: bool, ignore_dirs: Set[str]) -> Iterable[str]:
+  if not recursive:
+    try:
+      with os.scandir(root) as it:
+        for e in it:
+          if e.is_file():
+            yield e.path
+    except OSError:
+      pass
+    return
+  for dirpath, dirnames, filenames in os.walk(root):
+    dirnames[:] = [d for d in dirnames if d not in ignore_dirs]
+    for fn in filenames:
+      yield os.path.join(dirpath, fn)
+
+
+class PollingWatcher:
+  """Detects changes by comparing (mtime, size) snapshots."""
+
+  kind = "polling"
+
+  def __init__(self, roots: Roots, ignore_dirs: Set[str], interval: float = 0.5):
+    self.roots = roots
+    self.ignore_dirs = ignore_dirs
+    self.interval = interval
+    self._snap = self._snapshot()
+
+  def _snapshot(self) -> Dict[str, Tuple[int, int]]:
+    snap: Dict[str, Tuple[int, int]] = {}
+    for root, recursive in self.roots:
+      for path in _walk_files(root, recursive, self.ignore_dirs):
+        try:
+          st = os.stat(path)
+        except OSError:
+          continue
+        snap[path] = (st.st_mtime_ns, st.st_size)
+    return snap
+
+  def poll(self, timeout: Optional[float] = None) -> Set[str]:
+    deadline = None if timeout is None else time.monotonic() + timeout
+    while True:
+      time.sleep(self.interval)
+      snap = self._snapshot()
+      old, self._snap = self._snap, snap
+      changed = {p for p in snap.keys() | old.keys() if snap.get(p) != old.get(p)}
+      if changed or (deadline is not None and time.monotonic() >= deadline):
+        return changed
+
+  def close(self) -> None:
+    pass
+
+
+class InotifyWatcher:
+  """Linux inotify via libc; watches every directory below the roots."""
+
+  kind = "inotify"
+
+  def __init__(self, roots: Roots, ignore_dirs: Set[str], debounce: float = 0.03):
+    libc_name = ctypes.util.find_library("c") or "libc.so.6"
+    self._libc = ctypes.CDLL(libc_name, use_errno=True)
+    self._libc.inotify_init1.argtypes = [ctypes.c_int]
+    self._libc.inotify_add_watch.argtypes = [ctypes.c_int, ctypes.c_char_p, ctypes.c_uint32]
+    fd = self._libc.inotify_init1(os.O_NONBLOCK | os.O_CLOEXEC)
+    if fd < 0:
+      raise OSError(ctypes.get_errno(), "inotify_init1 failed")
+    self._fd = fd
+    self.ignore_dirs = ignore_dirs
+    self.debounce = debounce
+    self._wd_path: Dict[int, str] = {}
+    self._wd_recursive: Dict[int, bool] = {}
+    for root, recursive in roots:
+      if recursive:
+        for d in _walk_dirs(root, ignore_dirs):
+          self._add(d, True)
+      else:
+        self._add(root, False)
+
+  def _add(self, path: str, recursive: bool) -> None:
+    wd = self._libc.inotify_add_watch(self._fd, os.fsencode(path), _WATCH_MASK)
+    if wd < 0:
+      return
+    self._wd_path[wd] = path
+    # A directory reached both ways stays recursive.
+    self._wd_recursive[wd] = recursive or self._wd_recursive.get(wd, False)
+
+  def _drain(self, changed: Set[str]) -> None:
+    while True:
+      try:
+        buf = os.read(self._fd, 64 * 1024)
+      except BlockingIOError:
+        return
+      if not buf:
+        return
+      off = 0
+      while off + _EVENT_HEADER.size <= len(buf):
+        wd, mask, _, name_len = _EVENT_HEADER.unpack_from(buf, off)
+        off += _EVENT_HEADER.size
+        name = buf[off:off + name_len].rstrip(b"\0")
+        off += name_len
+
+        if mask & IN_Q_OVERFLOW:
+          changed.add(RESCAN)
+          continue
+        if mask & IN_IGNORED:
+          self._wd_path.pop(wd, None)
+          self._wd_recursive.pop(wd, None)
+          continue
+        base = self._wd_path.get(wd)
+        if base is None or not name:
+          continue
+        path = os.path.join(base, os.fsdecode(name))
+
+        if mask & IN_ISDIR:
+          if not self._wd_recursive.get(wd) or os.path.basename(path) in self.ignore_dirs:
+            continue
+          if mask & (IN_CREATE | IN_MOVED_TO):
+            # New subtree: watch it and report what it already contains.
+            for d in _walk_dirs(path, self.ignore_dirs):
+              self._add(d, True)
+            changed.update(_walk_files(path, True, self.ignore_dirs))
+          elif mask & IN_MOVED_FROM:
+            changed.add(RESCAN)
+          continue
+
+        changed.add(path)
+
+  def poll(self, timeout: Optional[float] = None) -> Set[str]:
+    changed: Set[str] = set()
+    ready, _, _ = select.select([self._fd], [], [], timeout)
+    if not ready:
+      return changed
+    self._drain(changed)
+    # Editors often emit a burst of events per save; coalesce them.
+    while select.select([self._fd], [], [], self.debounce)[0]:
+      self._drain(changed)
+    return changed
+
+  def close(self) -> None:
+    if self._fd >= 0:
+      os.close(self._fd)
+      self._fd = -1
+
+
+def make_watcher(roots: Roots, ignore_dirs: Set[str], interval: float = 0.5, force_polling: bool = False):
+  """Returns an InotifyWatcher where supported, else a PollingWatcher."""
+  if not force_polling and sys.platform.startswith("linux"):
+    try:
+      return InotifyWatcher(roots, ignore_dirs)
+    except (OSError, AttributeError):
+      pass
+  return PollingWatcher(roots, ignore_dirs, interval)
@@ -1,19 +1,41 @@
 #!/usr/bin/env python3
 """
 Generate mobile-optimized fractal background assets.
-Usage: python3 tools/gen_bg.py
+Usage: python3 tools/gen_bg.py [--jobs N] [--force] [--tune --budget-kb N --min-ssim X]
 
 Requirements:
 - PIL (Pillow): pip install Pillow
 - Or use ImageMagick: convert fractal.webp -resize 900x fractal-mobile-1x.webp
+
+Pipeline: the source is decoded once, every target size is resized from the
+nearest larger intermediate (a downscale pyramid), and the WebP/AVIF encodes
+run in a process pool. Outputs newer than the source whose settings hash
+matches the last run (dist/.cache/gen_bg.json) are skipped.
+
+Tuning (optional): --tune with --budget-kb and/or --min-ssim binary-searches
+each output's quality instead of using the fixed values in `targets`:
+  --budget-kb N   highest quality whose file is at most N KB
+  --min-ssim X    lowest quality whose SSIM against the resized reference
+                  is at least X (needs NumPy)
+With both, the lower of the two qualities wins (the budget is a hard cap).
+Results are cached by source hash in dist/.cache/gen_bg_tune.json.
+Every run writes dist/reports/bg_manifest.json (chosen settings and sizes).
 """
 
+import argparse
+import hashlib
+import io
+import json
 import os
+import shutil
 import sys
+import time
+from concurrent.futures import ProcessPoolExecutor
 from pathlib import Path
 
 try:
-    from PIL import Image
+    import PIL
+    from PIL import Image, features
 except ImportError:
     print("PIL (Pillow) not found. Install with: pip install Pillow")
     print("\nAlternatively, use ImageMagick manually:")
@@ -23,19 +45,23 @@ except ImportError:
     print("  convert ../../fractal.webp -resize 2700x -quality 80 fractal-mobile-3x.webp")
     sys.exit(1)
 
+try:
+    import numpy as np
+except ImportError:
+    np = None  # only needed for --min-ssim
+
 # Paths
 root_dir = Path(__file__).parent.parent
 src = root_dir / 'fractal.webp'
 out_dir = root_dir / 'assets' / 'bg'
+cache_path = root_dir / 'dist' / '.cache' / 'gen_bg.json'
+tune_cache_path = root_dir / 'dist' / '.cache' / 'gen_bg_tune.json'
+manifest_path = root_dir / 'dist' / 'reports' / 'bg_manifest.json'
 
-# Ensure output directory exists
-out_dir.mkdir(parents=True, exist_ok=True)
-
-# Check if source file exists
-if not src.exists():
-    print(f"Error: Source file not found: {src}")
-    print("Please ensure fractal.webp exists in the repo root.")
-    sys.exit(1)
+# Bump when the pipeline changes in a way that alters output pixels/bytes
+PIPELINE_VERSION = 'gen-bg/2'
+WEBP_METHOD = 6
+QUALITY_RANGE = (1, 100)
 
 # Targets: (name, width, webp_quality, avif_quality)
 targets = [
@@ -48,55 +74,415 @@ targets = [
     ('fractal-desktop-3x', 3600, 85, 40),
 ]
 
-print("Generating fractal background assets...")
-print(f"Source: {src}")
-print(f"Output: {out_dir}")
 
-# Load source image
-try:
-    img = Image.open(src)
-    orig_width, orig_height = img.size
-    print(f"Original size: {orig_width}x{orig_height}")
-except Exception as e:
-    print(f"Error loading source image: {e}")
-    sys.exit(1)
+def target_size(width, orig_width, orig_height):
+    """Fixed width, aspect ratio kept, never upscaled."""
+    if width > orig_width:
+        return orig_width, orig_height
+    return width, int(orig_height * width / orig_width)
+
 
-for name, width, webp_q, avif_q in targets:
+def pyramid_chain(sizes, orig_size):
+    """
+    { size: tuple of widths it is derived through, source first }.
+    Each size is resized from the nearest larger one already built.
+    """
+    chain = {orig_size: (orig_size[0],)}
+    parent = orig_size
+    for size in sorted(set(sizes), reverse=True):
+        if size == orig_size:
+            continue
+        chain[size] = chain[parent] + (size[0],)
+        parent = size
+    return chain
+
+
+def settings_hash(fmt, size, quality, chain):
+    blob = json.dumps({
+        'pipeline': PIPELINE_VERSION,
+        'pillow': PIL.__version__,
+        'format': fmt,
+        'size': list(size),
+        'quality': quality,
+        'method': WEBP_METHOD if fmt == 'WEBP' else None,
+        'chain': list(chain),
+    }, sort_keys=True)
+    return hashlib.sha256(blob.encode('utf-8')).hexdigest()[:16]
+
+
+def load_cache(path, key='outputs'):
     try:
-        # Calculate new height maintaining aspect ratio
-        if width > orig_width:
-            new_width = orig_width
-            new_height = orig_height
-        else:
-            ratio = width / orig_width
-            new_width = width
-            new_height = int(orig_height * ratio)
-        
-        print(f"\nProcessing {name} ({new_width}x{new_height})...")
-        
-        # Resize image
-        resized = img.resize((new_width, new_height), Image.Resampling.LANCZOS)
-        
-        # Generate WebP
-        webp_path = out_dir / f"{name}.webp"
-        resized.save(webp_path, 'WEBP', quality=webp_q, method=6)
-        size_kb = webp_path.stat().st_size / 1024
-        print(f"  ✓ {webp_path} ({size_kb:.1f} KB)")
-        
-        # Generate AVIF if supported (Pillow 10+)
+        with open(path, 'r', encoding='utf-8') as f:
+            data = json.load(f)
+        if data.get('version') == PIPELINE_VERSION and isinstance(data.get(key), dict):
+            return data[key]
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def write_json(path, obj):
+    path.parent.mkdir(parents=True, exist_ok=True)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    tmp.write_text(json.dumps(obj, indent=2, sort_keys=True) + '\n', encoding='utf-8')
+    os.replace(tmp, path)
+
+
+def save_cache(path, outputs, key='outputs'):
+    write_json(path, {'version': PIPELINE_VERSION, key: outputs})
+
+
+def file_sha256(path):
+    h = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(1 << 20), b''):
+            h.update(block)
+    return h.hexdigest()
+
+
+def is_fresh(out_path, digest, cache, src_mtime_ns):
+    try:
+        st = out_path.stat()
+    except OSError:
+        return False
+    return st.st_mtime_ns >= src_mtime_ns and cache.get(out_path.name) == digest
+
+
+def encode(img, fmt, quality):
+    buf = io.BytesIO()
+    if fmt == 'WEBP':
+        img.save(buf, 'WEBP', quality=quality, method=WEBP_METHOD)
+    else:
+        img.save(buf, fmt, quality=quality)
+    return buf.getvalue()
+
+
+def encode_job(job):
+    """Worker: encode one variant to a temp file and rename it into place."""
+    mode, size, data, fmt, quality, out_path = job
+    tmp = f"{out_path}.{os.getpid()}.tmp"
+    try:
+        img = Image.frombytes(mode, size, data)
+        with open(tmp, 'wb') as f:
+            f.write(encode(img, fmt, quality))
+        os.replace(tmp, out_path)
+        return out_path, os.path.getsize(out_path), None
+    except Exception as e:
         try:
-            avif_path = out_dir / f"{name}.avif"
-            resized.save(avif_path, 'AVIF', quality=avif_q)
-            size_kb = avif_path.stat().st_size / 1024
-            print(f"  ✓ {avif_path} ({size_kb:.1f} KB)")
-        except Exception as e:
-            print(f"  ⚠ AVIF not supported (Pillow version too old): {e}")
-            print(f"    Skipping {name}.avif - WebP only")
-            
+            os.remove(tmp)
+        except OSError:
+            pass
+        return out_path, 0, str(e)
+
+
+def _box_mean(a, w):
+    # Mean over every w x w window ("valid" mode) via a summed-area table
+    c = a.cumsum(0).cumsum(1)
+    c = np.pad(c, ((1, 0), (1, 0)))
+    return (c[w:, w:] - c[:-w, w:] - c[w:, :-w] + c[:-w, :-w]) / (w * w)
+
+
+def ssim(ref, img, window=7):
+    """Mean SSIM of the luma channels (uniform window, K1=0.01, K2=0.03)."""
+    x = np.asarray(ref.convert('L'), dtype=np.float64)
+    y = np.asarray(img.convert('L'), dtype=np.float64)
+    c1, c2 = (0.01 * 255) ** 2, (0.03 * 255) ** 2
+    mx, my = _box_mean(x, window), _box_mean(y, window)
+    vx = _box_mean(x * x, window) - mx * mx
+    vy = _box_mean(y * y, window) - my * my
+    cxy = _box_mean(x * y, window) - mx * my
+    s = ((2 * mx * my + c1) * (2 * cxy + c2)) / ((mx * mx + my * my + c1) * (vx + vy + c2))
+    return float(s.mean())
+
+
+def tune_job(job):
+    """
+    Worker: binary-search one variant's quality.
+    Returns (key, {quality, bytes, ssim, met}) or (key, {error}).
+    """
+    key, mode, size, data, fmt, budget, min_ssim = job
+    try:
+        ref = Image.frombytes(mode, size, data)
+        probes = {}
+
+        def probe(q):
+            if q not in probes:
+                blob = encode(ref, fmt, q)
+                score = ssim(ref, Image.open(io.BytesIO(blob))) if min_ssim is not None else None
+                probes[q] = (len(blob), score)
+            return probes[q]
+
+        def search(ok, want_max):
+            # Largest (want_max) or smallest quality where ok(q) holds;
+            # assumes ok is monotone in q. None if no quality satisfies it.
+            lo, hi = QUALITY_RANGE
+            found = None
+            while lo <= hi:
+                mid = (lo + hi) // 2
+                if ok(mid):
+                    found = mid
+                    lo, hi = (mid + 1, hi) if want_max else (lo, mid - 1)
+                else:
+                    lo, hi = (lo, mid - 1) if want_max else (mid + 1, hi)
+            return found
+
+        met = True
+        choices = []
+        if budget is not None:
+            q = search(lambda q: probe(q)[0] <= budget, want_max=True)
+            met = met and q is not None
+            choices.append(q if q is not None else QUALITY_RANGE[0])
+        if min_ssim is not None:
+            q = search(lambda q: probe(q)[1] >= min_ssim, want_max=False)
+            met = met and q is not None
+            choices.append(q if q is not None else QUALITY_RANGE[1])
+        quality = min(choices)
+        nbytes, score = probe(quality)
+        if score is None and np is not None:
+            score = ssim(ref, Image.open(io.BytesIO(encode(ref, fmt, quality))))
+        if budget is not None and nbytes > budget:
+            met = False
+        if min_ssim is not None and score < min_ssim:
+            met = False
+        return key, {
+            'quality': quality,
+            'bytes': nbytes,
+            'ssim': round(score, 5) if score is not None else None,
+            'met': met,
+            'probes': len(probes),
+        }
+    except Exception as e:
+        return key, {'error': str(e)}
+
+
+def run_pool(fn, jobs, workers):
+    if workers <= 1 or len(jobs) <= 1:
+        return list(map(fn, jobs))
+    with ProcessPoolExecutor(max_workers=min(workers, len(jobs))) as pool:
+        return list(pool.map(fn, jobs))
+
+
+class Pyramid:
+    """Decodes the source on first use and builds pyramid levels on demand."""
+
+    def __init__(self, img, chain):
+        self.img = img
+        self.chain = chain
+        self.frames = None
+
+    def frame(self, size):
+        if self.frames is None:
+            t0 = time.perf_counter()
+            self.img.load()
+            self.frames = {self.img.size: self.img}
+            parent = self.img
+            # Every level is built: a level's hash includes its whole chain
+            for level in sorted(self.chain, reverse=True):
+                if level != self.img.size:
+                    self.frames[level] = parent = parent.resize(level, Image.Resampling.LANCZOS)
+            print(f"Resized {len(self.frames) - 1} pyramid level(s) in {time.perf_counter() - t0:.2f}s")
+        return self.frames[size]
+
+
+def tune_qualities(args, pyramid, variants, source_sha, workers):
+    """
+    variants: [(name, fmt, size)]. Returns { (name, fmt): result dict }.
+    Cached by source hash + size/format/goal; only misses are searched.
+    """
+    goal = {
+        'budget_bytes': int(args.budget_kb * 1024) if args.budget_kb is not None else None,
+        'min_ssim': args.min_ssim,
+    }
+    cache = {} if args.force else load_cache(tune_cache_path, 'results')
+
+    def cache_key(fmt, size):
+        blob = json.dumps([source_sha, fmt, list(size), goal, pyramid.chain[size], PIL.__version__, WEBP_METHOD])
+        return hashlib.sha256(blob.encode('utf-8')).hexdigest()[:24]
+
+    keys = {(name, fmt): cache_key(fmt, size) for name, fmt, size in variants}
+    misses = {}
+    for name, fmt, size in variants:
+        key = keys[(name, fmt)]
+        if key not in cache and key not in misses:
+            misses[key] = (fmt, size)
+
+    if misses:
+        print(f"Tuning {len(misses)} variant(s) "
+              f"(budget={goal['budget_bytes']} bytes, min_ssim={goal['min_ssim']})...")
+        t0 = time.perf_counter()
+        jobs = []
+        for key, (fmt, size) in misses.items():
+            frame = pyramid.frame(size)
+            jobs.append((key, frame.mode, size, frame.tobytes(), fmt, goal['budget_bytes'], goal['min_ssim']))
+        for key, result in run_pool(tune_job, jobs, workers):
+            fmt, size = misses[key]
+            if 'error' in result:
+                print(f"  ✗ Tuning failed for {fmt} {size[0]}x{size[1]}: {result['error']}")
+                continue
+            cache[key] = result
+            flag = '✓' if result['met'] else '⚠ goal not reachable,'
+            print(f"  {flag} {fmt} {size[0]}x{size[1]}: q={result['quality']} "
+                  f"{result['bytes'] / 1024:.1f} KB ssim={result['ssim']} ({result['probes']} probes)")
+        print(f"Tuned in {time.perf_counter() - t0:.2f}s")
+        # Keep only entries for the current source
+        live = set(keys.values())
+        save_cache(tune_cache_path, {k: v for k, v in cache.items() if k in live}, 'results')
+
+    return {nf: cache[key] for nf, key in keys.items() if key in cache}
+
+
+def main():
+    ap = argparse.ArgumentParser(prog="gen_bg")
+    ap.add_argument("--jobs", type=int, default=0, help="Encoder processes (0 = one per CPU).")
+    ap.add_argument("--force", action="store_true", help="Regenerate every output (and re-tune).")
+    ap.add_argument("--tune", action="store_true", help="Search qualities instead of using the fixed ones.")
+    ap.add_argument("--budget-kb", type=float, default=None, help="Tuning: max file size per output, in KB.")
+    ap.add_argument("--min-ssim", type=float, default=None, help="Tuning: min SSIM vs. the resized reference (e.g. 0.95).")
+    args = ap.parse_args()
+
+    if args.tune and args.budget_kb is None and args.min_ssim is None:
+        ap.error("--tune needs --budget-kb and/or --min-ssim")
+    if args.tune and args.min_ssim is not None and np is None:
+        print("NumPy not found (needed for --min-ssim). Install with: pip install numpy")
+        sys.exit(1)
+
+    # Ensure output directory exists
+    out_dir.mkdir(parents=True, exist_ok=True)
+
+    # Check if source file exists
+    if not src.exists():
+        print(f"Error: Source file not found: {src}")
+        print("Please ensure fractal.webp exists in the repo root.")
+        sys.exit(1)
+
+    print("Generating fractal background assets...")
+    print(f"Source: {src}")
+    print(f"Output: {out_dir}")
+
+    # Header only; pixels are decoded later, and only if something is stale
+    try:
+        img = Image.open(src)
+        orig_size = img.size
+        print(f"Original size: {orig_size[0]}x{orig_size[1]}")
     except Exception as e:
-        print(f"  ✗ Failed to generate {name}: {e}")
-        continue
+        print(f"Error loading source image: {e}")
+        sys.exit(1)
+
+    formats = [('WEBP', 'webp', 2)]
+    if features.check('avif'):
+        formats.append(('AVIF', 'avif', 3))
+    else:
+        print("  ⚠ AVIF not supported by this Pillow build; generating WebP only")
+
+    sizes = {name: target_size(width, *orig_size) for name, width, _, _ in targets}
+    chain = pyramid_chain(sizes.values(), orig_size)
+    pyramid = Pyramid(img, chain)
+    src_mtime_ns = src.stat().st_mtime_ns
+    source_sha = file_sha256(src)
+    workers = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+
+    # Quality per (name, fmt): fixed from `targets`, or tuned
+    qualities = {(t[0], fmt): t[qi] for t in targets for fmt, _, qi in formats}
+    tuned = {}
+    if args.tune:
+        variants = [(t[0], fmt, sizes[t[0]]) for t in targets for fmt, _, _ in formats]
+        tuned = tune_qualities(args, pyramid, variants, source_sha, workers)
+        for nf, result in tuned.items():
+            qualities[nf] = result['quality']
+
+    cache = {} if args.force else load_cache(cache_path)
+
+    # (size, fmt, quality, out_path, digest) for every stale output
+    pending = []
+    new_cache = {}
+    skipped = 0
+    for target in targets:
+        name, size = target[0], sizes[target[0]]
+        for fmt, ext, _ in formats:
+            out_path = out_dir / f"{name}.{ext}"
+            quality = qualities[(name, fmt)]
+            digest = settings_hash(fmt, size, quality, chain[size])
+            new_cache[out_path.name] = digest
+            if is_fresh(out_path, digest, cache, src_mtime_ns):
+                skipped += 1
+            else:
+                pending.append((size, fmt, quality, out_path, digest))
+
+    failed = set()
+    if not pending:
+        print(f"\n✓ All {skipped} outputs up to date.")
+    else:
+        # Targets clamped to the source size share pixels and settings: encode
+        # each distinct (size, format, quality) once and copy it to the rest.
+        copies = {}
+        for size, fmt, quality, out_path, _ in pending:
+            copies.setdefault((size, fmt, quality), []).append(str(out_path))
+        jobs = []
+        for (size, fmt, quality), paths in copies.items():
+            frame = pyramid.frame(size)
+            jobs.append((frame.mode, size, frame.tobytes(), fmt, quality, paths[0]))
+        # Biggest encodes first so the pool's tail is short
+        jobs.sort(key=lambda j: -j[1][0] * j[1][1])
+
+        t0 = time.perf_counter()
+        results = run_pool(encode_job, jobs, workers)
+
+        outcomes = []
+        for job, (encoded, nbytes, error) in zip(jobs, results):
+            for out_path in copies[(job[1], job[3], job[4])]:
+                if not error and out_path != encoded:
+                    tmp = f"{out_path}.{os.getpid()}.tmp"
+                    shutil.copyfile(encoded, tmp)
+                    os.replace(tmp, out_path)
+                outcomes.append((out_path, nbytes, error))
+
+        for out_path, nbytes, error in sorted(outcomes):
+            if error:
+                failed.add(Path(out_path).name)
+                print(f"  ✗ Failed to generate {out_path}: {error}")
+            else:
+                print(f"  ✓ {out_path} ({nbytes / 1024:.1f} KB)")
+        print(f"Encoded {len(jobs)} variant(s) for {len(outcomes)} file(s) with {min(workers, len(jobs))} worker(s) "
+              f"in {time.perf_counter() - t0:.2f}s; {skipped} up to date")
+
+        for name in failed:
+            new_cache.pop(name, None)
+        save_cache(cache_path, new_cache)
+
+    write_manifest(sizes, formats, qualities, tuned, source_sha, args)
+    if pending:
+        print("\n✓ Done! Background assets generated.")
+
+
+def write_manifest(sizes, formats, qualities, tuned, source_sha, args):
+    outputs = []
+    for name, _, _, _ in targets:
+        for fmt, ext, _ in formats:
+            path = out_dir / f"{name}.{ext}"
+            if not path.exists():
+                continue
+            entry = {
+                'file': path.relative_to(root_dir).as_posix(),
+                'format': fmt.lower(),
+                'width': sizes[name][0],
+                'height': sizes[name][1],
+                'quality': qualities[(name, fmt)],
+                'bytes': path.stat().st_size,
+            }
+            result = tuned.get((name, fmt))
+            if result is not None:
+                entry['ssim'] = result['ssim']
+                entry['goal_met'] = result['met']
+            outputs.append(entry)
+    write_json(manifest_path, {
+        'version': PIPELINE_VERSION,
+        'source': {'file': src.relative_to(root_dir).as_posix(), 'sha256': source_sha},
+        'tuning': {'budget_kb': args.budget_kb, 'min_ssim': args.min_ssim} if args.tune else None,
+        'total_bytes': sum(o['bytes'] for o in outputs),
+        'outputs': outputs,
+    })
+    print(f"Manifest: {manifest_path}")
 
-print("\n✓ Done! Background assets generated.")
-print("\nNote: If AVIF generation failed, install Pillow 10+ or use WebP files only.")
 
+if __name__ == '__main__':
+    main()
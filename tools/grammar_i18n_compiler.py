@@ -2,16 +2,32 @@
 # -*- coding: utf-8 -*-
 
 import argparse
+import codecs
+import contextlib
+import fnmatch
+import functools
+import hashlib
+import html
+import io
+import itertools
 import json
 import os
 import re
+import sys
+import threading
+import time
+from collections.abc import Mapping
 from dataclasses import dataclass, asdict
 from pathlib import Path
-from typing import Dict, List, Tuple, Set
+from typing import BinaryIO, Dict, Iterable, Iterator, List, Optional, Tuple, Set
+
+from atomic_write import write_blocks
 
 
 VERSION = "grammar-i18n-compiler/1.0"
 
+# Whole-document matcher used before the streaming extractor; it also hits
+# text inside scripts/comments. Kept as the baseline for tools/bench.
 DATA_I18N_RE = re.compile(r'''data-i18n\s*=\s*["']([^"']+)["']''', re.IGNORECASE)
 
 DEFAULT_IGNORE_DIRS = {
@@ -24,8 +40,91 @@ DEFAULT_IGNORE_DIRS = {
   ".cache",
 }
 
+DEFAULT_REPORT_DIR = os.path.join("dist", "reports")
+
+# Report files: compared/written this many bytes at a time; --compact drops
+# indentation.
+WRITE_BUFFER = 64 * 1024
+JSON_BATCH = 4096
+JSON_COMPACT = False
+PROFILE_TOP = 25
+
+# key_to_grammar / grammar_to_key / DomainTags.tag memo size
+GRAMMAR_CACHE_SIZE = 1 << 16
+
+# infer_tags_from_key() rules when --domains is not given (see DomainTags)
+DEFAULT_DOMAIN_TAGS = ("rite", "term", "bank", "shop", "sys", "site", "confess")
+
+NODES_VERSION = "gbook-node-index/1.0"
+# Sharded layout: <dir>/index.json plus one shard-<domain>.json per key
+# domain; the prefix keeps a domain named "index" off the index file
+NODE_SHARDS_VERSION = "gbook-node-shards/1"
+NODE_SHARD_VERSION = "gbook-node-shard/1"
+NODE_SHARD_INDEX = "index.json"
+NODE_SHARD_PREFIX = "shard-"
+# Domains that are not a safe lower-case file name share this shard
+NODE_SHARD_OTHER = "_other"
+
+SCAN_CACHE_VERSION = "scan-ui-cache/2.0"
+DEFAULT_CACHE_DIR = os.path.join("dist", ".cache")
+SCAN_CACHE_FILE = "scan_ui.json"
+
+# Files are decoded and tokenized this many bytes at a time.
+SCAN_BLOCK_SIZE = 64 * 1024
+
+# Below this many files to (re)scan, a process pool costs more than it saves.
+PARALLEL_MIN_FILES = 64
+
+
+class Timings:
+  """
+  Per-phase wall time and counters for --timings. Phases nest; a phase
+  re-entered under itself is only timed at the outermost level. A no-op
+  until enable() is called.
+  """
+
+  def __init__(self):
+    self.enabled = False
+    self.phases: Dict[str, dict] = {}
+    self.counts: Dict[str, int] = {}
+    self._depth: Dict[str, int] = {}
+    self._lock = threading.Lock()
+
+  def enable(self) -> None:
+    self.enabled = True
+
+  @contextlib.contextmanager
+  def phase(self, name: str):
+    if not self.enabled or self._depth.get(name):
+      yield
+      return
+    self._depth[name] = 1
+    t0 = time.perf_counter()
+    try:
+      yield
+    finally:
+      self._depth[name] = 0
+      ent = self.phases.setdefault(name, {"seconds": 0.0, "calls": 0})
+      ent["seconds"] += time.perf_counter() - t0
+      ent["calls"] += 1
+
+  def count(self, name: str, n: int = 1) -> None:
+    if self.enabled:
+      # Also called from patch's writer threads
+      with self._lock:
+        self.counts[name] = self.counts.get(name, 0) + n
+
+  def report(self) -> dict:
+    return {
+      "phases": {k: {"seconds": round(v["seconds"], 6), "calls": v["calls"]} for k, v in self.phases.items()},
+      "counts": dict(sorted(self.counts.items())),
+    }
+
+
+TIMINGS = Timings()
 
-@dataclass
+
+@dataclass(slots=True)
 class Node:
   key: str
   grammar: str
@@ -38,10 +137,305 @@ def read_json(path: str) -> dict:
     return json.load(f)
 
 
-def write_json(path: str, obj: dict) -> None:
-  os.makedirs(os.path.dirname(path), exist_ok=True)
-  with open(path, "w", encoding="utf-8") as f:
-    json.dump(obj, f, ensure_ascii=False, indent=2)
+def _batched(chunks: Iterable[str]) -> Iterator[bytes]:
+  # Re-chunk small encoder pieces into ~WRITE_BUFFER-sized byte blocks.
+  buf: List[str] = []
+  size = 0
+  for c in chunks:
+    buf.append(c)
+    size += len(c)
+    if size >= WRITE_BUFFER:
+      yield "".join(buf).encode("utf-8")
+      buf = []
+      size = 0
+  if buf:
+    yield "".join(buf).encode("utf-8")
+
+
+def _diff_blocks(path: str, blocks: Iterable[bytes]) -> Iterator[Tuple[bytes, bool]]:
+  # (block, changed) against the file's current bytes; after the first
+  # difference the old file is no longer read.
+  try:
+    old: Optional[BinaryIO] = open(path, "rb")
+  except OSError:
+    old = None
+  try:
+    same = old is not None
+    for data in blocks:
+      if same:
+        same = old.read(len(data)) == data
+      yield data, not same
+    # A missing file is created even when empty; an old file that is
+    # longer than the new content is truncated.
+    if old is None or (same and old.read(1)):
+      yield b"", True
+  finally:
+    if old is not None:
+      old.close()
+
+
+def write_chunks(path: str, chunks: Iterable[str]) -> bool:
+  """
+  Write only if the content differs. The new content is compared against
+  the existing file as it is produced; nothing is written until the first
+  difference, then the matching prefix is copied to a sibling temp file,
+  the rest streamed after it, and the temp file renamed over the original
+  (atomic_write.write_blocks). Returns True if the file was (re)written.
+  """
+  return write_blocks(path, _diff_blocks(path, _batched(chunks)))
+
+
+def write_text(path: str, text: str) -> bool:
+  # Readers never see a torn file, and an unchanged file keeps its mtime.
+  return write_chunks(path, (text,))
+
+
+_encode_str = json.encoder.encode_basestring
+
+
+def _json_key(k) -> str:
+  if isinstance(k, str):
+    return k
+  if k is True:
+    return "true"
+  if k is False:
+    return "false"
+  if k is None:
+    return "null"
+  if isinstance(k, float):
+    return json.dumps(k)
+  return str(int(k))
+
+
+def iter_json(obj, compact: bool = False, level: int = 0) -> Iterator[str]:
+  """
+  Streaming encoder. Yields the same text as
+  json.dumps(obj, ensure_ascii=False, indent=2) (compact: separators=(",", ":"),
+  no indent) for dicts or other Mappings, but never holds the whole document; list items of plain
+  strings are encoded in batches of JSON_BATCH.
+  """
+  if isinstance(obj, str):
+    yield _encode_str(obj)
+  elif isinstance(obj, Mapping):
+    # Any Mapping, so a bundle-backed BundleLang streams without a copy
+    if not obj:
+      yield "{}"
+      return
+    if compact:
+      first, sep, colon, last = "{", ",", ":", "}"
+    else:
+      inner = "\n" + "  " * (level + 1)
+      first, sep, colon, last = "{" + inner, "," + inner, ": ", "\n" + "  " * level + "}"
+    yield first
+    for i, (k, v) in enumerate(obj.items()):
+      if i:
+        yield sep
+      yield _encode_str(_json_key(k))
+      yield colon
+      if isinstance(v, str):
+        yield _encode_str(v)
+      else:
+        yield from iter_json(v, compact, level + 1)
+    yield last
+  elif isinstance(obj, (list, tuple)):
+    if not obj:
+      yield "[]"
+      return
+    if compact:
+      first, sep, last = "[", ",", "]"
+    else:
+      inner = "\n" + "  " * (level + 1)
+      first, sep, last = "[" + inner, "," + inner, "\n" + "  " * level + "]"
+    yield first
+    if all(isinstance(v, str) for v in obj):
+      # Key lists: encode a slice at a time with one C-level join
+      for i in range(0, len(obj), JSON_BATCH):
+        if i:
+          yield sep
+        yield sep.join(map(_encode_str, obj[i:i + JSON_BATCH]))
+    else:
+      for i, v in enumerate(obj):
+        if i:
+          yield sep
+        if isinstance(v, str):
+          yield _encode_str(v)
+        else:
+          yield from iter_json(v, compact, level + 1)
+    yield last
+  else:
+    yield json.dumps(obj, ensure_ascii=False)
+
+
+def write_json(path: str, obj: dict) -> bool:
+  """Returns True if the file was written, False if it already had this content."""
+  with TIMINGS.phase("write_reports"):
+    wrote = write_chunks(path, iter_json(obj, JSON_COMPACT))
+  TIMINGS.count("files_written" if wrote else "files_unchanged")
+  return wrote
+
+
+def load_nodes(path: str, domains: Optional[Iterable[str]] = None, verify: bool = True) -> List[Node]:
+  """
+  Nodes from a monolithic nodes.json, or from a sharded node directory
+  (or its index.json), where only the shards of `domains` are parsed.
+  """
+  if os.path.isdir(path) or os.path.basename(path) == NODE_SHARD_INDEX:
+    root = path if os.path.isdir(path) else os.path.dirname(path)
+    return NodeShards(root, verify).nodes(domains)
+  with TIMINGS.phase("load_json"):
+    nodes_obj = read_json(path)
+    nodes = [Node(**n) for n in nodes_obj.get("nodes", [])]
+    if domains is not None:
+      wanted = set(domains)
+      nodes = [n for n in nodes if node_domain(n.key) in wanted]
+  TIMINGS.count("nodes", len(nodes))
+  TIMINGS.count("json_bytes", os.path.getsize(path) if TIMINGS.enabled else 0)
+  return nodes
+
+
+_SHARD_NAME_RE = re.compile(r"[a-z0-9][a-z0-9_-]*")
+
+
+def node_domain(key: str) -> str:
+  # g.<domain>.<node>... -> <domain>; the shard a key lives in
+  parts = key.split(".", 2)
+  if len(parts) == 3 and parts[0] == "g" and _SHARD_NAME_RE.fullmatch(parts[1]):
+    return parts[1]
+  return NODE_SHARD_OTHER
+
+
+def render_node_shard(domain: str, nodes: List[Node]) -> str:
+  # One node per line, as [key, grammar, tags] or [key, grammar, tags, notes],
+  # so a shard stays small and diffs line by line.
+  rows = []
+  for n in nodes:
+    row = [n.key, n.grammar, n.tags, n.notes] if n.notes else [n.key, n.grammar, n.tags]
+    rows.append(json.dumps(row, ensure_ascii=False, separators=(",", ":")))
+  head = json.dumps({"version": NODE_SHARD_VERSION, "domain": domain}, separators=(",", ":"))[:-1]
+  return head + ',"nodes":[\n' + ",\n".join(rows) + ("\n" if rows else "") + "]}\n"
+
+
+def _position_runs(positions: List[int]) -> List[List[int]]:
+  # Ascending indexes -> [[start, count], ...] over consecutive stretches
+  runs: List[List[int]] = []
+  for i in positions:
+    if runs and runs[-1][0] + runs[-1][1] == i:
+      runs[-1][1] += 1
+    else:
+      runs.append([i, 1])
+  return runs
+
+
+class NodeShards:
+  """
+  A sharded node index. index.json lists the shards with their node
+  count, sha256 and the nodes' positions in the merged list (as
+  [start, count] runs), so merging restores the original order; a shard
+  is read (and checked against its hash) the first time one of its
+  domains is asked for.
+  """
+
+  def __init__(self, root: str, verify: bool = True):
+    self.root = root
+    self.verify = verify
+    index = read_json(os.path.join(root, NODE_SHARD_INDEX))
+    if index.get("version") != NODE_SHARDS_VERSION:
+      raise ValueError(f"{root}: not a {NODE_SHARDS_VERSION} node index")
+    self.shards: Dict[str, dict] = {s["domain"]: s for s in index.get("shards", [])}
+    self.loaded: Dict[str, List[Node]] = {}
+
+  def domains(self) -> List[str]:
+    return list(self.shards)
+
+  def load(self, domain: str) -> List[Node]:
+    nodes = self.loaded.get(domain)
+    if nodes is not None:
+      return nodes
+    entry = self.shards.get(domain)
+    if entry is None:
+      return []
+    path = os.path.join(self.root, entry["file"])
+    with TIMINGS.phase("load_json"):
+      with open(path, "rb") as f:
+        data = f.read()
+      if self.verify and hashlib.sha256(data).hexdigest() != entry["sha256"]:
+        raise ValueError(f"{path} does not match {NODE_SHARD_INDEX}; re-run nodes-split on {self.root}")
+      nodes = [Node(*row) for row in json.loads(data).get("nodes", [])]
+    TIMINGS.count("json_bytes", len(data))
+    TIMINGS.count("nodes", len(nodes))
+    self.loaded[domain] = nodes
+    return nodes
+
+  def nodes(self, domains: Optional[Iterable[str]] = None) -> List[Node]:
+    names = self.domains() if domains is None else [d for d in self.shards if d in set(domains)]
+    placed: List[Tuple[tuple, Node]] = []
+    for rank, d in enumerate(names):
+      order = [i for start, count in self.shards[d].get("positions", []) for i in range(start, start + count)]
+      for j, n in enumerate(self.load(d)):
+        # Rows without a recorded position (an older index, or rows added
+        # by hand before re-indexing) follow the shard's last known node.
+        pos = order[j] if j < len(order) else (order[-1] if order else float("inf"))
+        placed.append(((pos, rank, j), n))
+    placed.sort(key=lambda p: p[0])
+    return [n for _, n in placed]
+
+
+def split_nodes(nodes: List[Node], out_dir: str) -> dict:
+  """
+  Writes one shard per domain (in order of first appearance) and the
+  index, which records where each node sat in `nodes`; shards whose text
+  is unchanged are not rewritten, and shards the previous index listed
+  but that are now empty are removed.
+  """
+  groups: Dict[str, List[Node]] = {}
+  positions: Dict[str, List[int]] = {}
+  for i, n in enumerate(nodes):
+    d = node_domain(n.key)
+    groups.setdefault(d, []).append(n)
+    positions.setdefault(d, []).append(i)
+
+  index_path = os.path.join(out_dir, NODE_SHARD_INDEX)
+  try:
+    old = [s["file"] for s in read_json(index_path).get("shards", [])]
+  except (OSError, ValueError):
+    old = []
+
+  shards = []
+  written = 0
+  for domain, group in groups.items():
+    text = render_node_shard(domain, group)
+    name = f"{NODE_SHARD_PREFIX}{domain}.json"
+    written += write_text(os.path.join(out_dir, name), text)
+    shards.append({
+      "domain": domain,
+      "file": name,
+      "count": len(group),
+      "sha256": hashlib.sha256(text.encode("utf-8")).hexdigest(),
+      "positions": _position_runs(positions[domain]),
+    })
+
+  removed = 0
+  for name in old:
+    if name not in {s["file"] for s in shards}:
+      with contextlib.suppress(FileNotFoundError):
+        os.remove(os.path.join(out_dir, name))
+        removed += 1
+
+  write_json(index_path, {
+    "version": NODE_SHARDS_VERSION,
+    "generated_by": VERSION,
+    "count": len(nodes),
+    "shards": shards,
+  })
+  return {"shards": len(shards), "written": written, "removed": removed, "nodes": len(nodes)}
+
+
+def nodes_document(nodes: List[Node]) -> dict:
+  return {
+    "version": NODES_VERSION,
+    "generated_by": VERSION,
+    "nodes": [asdict(n) for n in nodes],
+  }
 
 
 def read_i18n_dir(i18n_dir: str) -> Dict[str, Dict[str, str]]:
@@ -50,23 +444,53 @@ def read_i18n_dir(i18n_dir: str) -> Dict[str, Dict[str, str]]:
   Accepts: *.json in i18n_dir, filename stem is lang.
   """
   out: Dict[str, Dict[str, str]] = {}
-  for fn in os.listdir(i18n_dir):
-    if not fn.endswith(".json"):
-      continue
-    lang = fn[:-5]
-    data = read_json(os.path.join(i18n_dir, fn))
-    if not isinstance(data, dict):
-      raise ValueError(f"i18n/{fn} must be an object map.")
-    # Force str keys/values
-    cleaned: Dict[str, str] = {}
-    for k, v in data.items():
-      if not isinstance(k, str):
+  with TIMINGS.phase("load_json"):
+    for fn in os.listdir(i18n_dir):
+      if not fn.endswith(".json"):
         continue
-      cleaned[k] = "" if v is None else str(v)
-    out[lang] = cleaned
+      lang = fn[:-5]
+      path = os.path.join(i18n_dir, fn)
+      out[lang] = read_i18n_file(path)
+      TIMINGS.count("i18n_files")
+      TIMINGS.count("json_bytes", os.path.getsize(path) if TIMINGS.enabled else 0)
+      TIMINGS.count("i18n_entries", len(out[lang]))
   return out
 
 
+def load_i18n(path: str):
+  """
+  read_i18n_dir() for a directory; for a .js file, the I18N object literal
+  of a JS catalog like assets/i18n.data.js; for any other file, the
+  languages of a binary bundle (see tools/i18n_bundle.py) as lazy,
+  mmap-backed mappings.
+  """
+  if not os.path.isfile(path):
+    return read_i18n_dir(path)
+  if path.endswith(".js"):
+    from extract_i18n_json import extract_i18n
+    with TIMINGS.phase("load_json"):
+      return extract_i18n(path)
+  from i18n_bundle import I18nBundle
+  with TIMINGS.phase("load_json"):
+    maps = I18nBundle(path).maps()
+  TIMINGS.count("bundle_bytes", os.path.getsize(path) if TIMINGS.enabled else 0)
+  return maps
+
+
+def read_i18n_file(path: str) -> Dict[str, str]:
+  data = read_json(path)
+  if not isinstance(data, dict):
+    raise ValueError(f"i18n/{os.path.basename(path)} must be an object map.")
+  # Force str keys/values
+  cleaned: Dict[str, str] = {}
+  for k, v in data.items():
+    if not isinstance(k, str):
+      continue
+    cleaned[k] = "" if v is None else str(v)
+  return cleaned
+
+
+@functools.lru_cache(maxsize=GRAMMAR_CACHE_SIZE)
 def key_to_grammar(key: str) -> str:
   # g.<domain>.<a>.<b> -> [DOMAIN::A::B]
   if not key.startswith("g."):
@@ -79,6 +503,7 @@ def key_to_grammar(key: str) -> str:
   return "[" + "::".join([domain] + rest) + "]"
 
 
+@functools.lru_cache(maxsize=GRAMMAR_CACHE_SIZE)
 def grammar_to_key(grammar: str) -> str:
   s = grammar.strip()
   if not (s.startswith("[") and s.endswith("]")):
@@ -92,43 +517,151 @@ def grammar_to_key(grammar: str) -> str:
   return "g." + domain + "." + ".".join(rest)
 
 
-def infer_tags_from_key(key: str) -> List[str]:
+# A key (after "g.") with a blank segment, which key_to_grammar drops
+_IRREGULAR_KEY_RE = re.compile(r"^\s*\.|\.\s*(?=\.|$)")
+# A grammar needing the strip/filter of grammar_to_key
+_IRREGULAR_GRAMMAR_RE = re.compile(r"^(?!\[)|(?<!\])$|^\[::|::\]$|::::|\s")
+
+
+def _plain(body: str) -> bool:
+  # No whitespace but the "\n" separators
+  return " " not in body and body.replace("\n", "").isprintable()
+
+
+def keys_to_grammar(keys: List[str]) -> List[Optional[str]]:
+  """
+  Bulk key_to_grammar(); None where it would raise. Regular keys are
+  converted as one joined string; when the batch has irregular ones they
+  go through the scalar function instead.
+  """
+  out: List[Optional[str]] = [None] * len(keys)
+  fast = [i for i, k in enumerate(keys) if k.startswith("g.") and k.find(".", 2) != -1]
+  body = "\n".join([keys[i][2:] for i in fast])
+  if not (body.count("\n") == len(fast) - 1 and _plain(body)
+          and "\n." not in body and ".\n" not in body and ".." not in body
+          and not body.startswith(".") and not body.endswith(".")):
+    regular = []
+    for i in fast:
+      k = keys[i]
+      if "\n" in k or _IRREGULAR_KEY_RE.search(k[2:]):
+        out[i] = key_to_grammar(k)
+      else:
+        regular.append(i)
+    fast = regular
+    body = "\n".join([keys[i][2:] for i in fast])
+  if fast:
+    for i, g in zip(fast, body.upper().replace(".", "::").split("\n")):
+      out[i] = "[" + g + "]"
+  return out
+
+
+def grammars_to_keys(grammars: List[str]) -> List[Optional[str]]:
+  """Bulk grammar_to_key(); None where it would raise."""
+  out: List[Optional[str]] = [None] * len(grammars)
+  fast = []
+  for i, g in enumerate(grammars):
+    if "::" in g:
+      fast.append(i)
+    else:
+      try:
+        out[i] = grammar_to_key(g)
+      except ValueError:
+        pass
+  body = "\n".join([grammars[i] for i in fast])
+  edges = "\n" + body + "\n"
+  # Non-ASCII takes the scalar path: str.lower() maps a final sigma
+  # differently when it ends a part than when "::" follows it
+  if not (body.isascii() and body.count("\n") == len(fast) - 1 and _plain(body)
+          and edges.count("\n[") == len(fast) and edges.count("]\n") == len(fast)
+          and "[::" not in body and "::]" not in body and "::::" not in body):
+    regular = []
+    for i in fast:
+      g = grammars[i]
+      if g.isascii() and "\n" not in g and not _IRREGULAR_GRAMMAR_RE.search(g):
+        regular.append(i)
+      else:
+        try:
+          out[i] = grammar_to_key(g)
+        except ValueError:
+          pass
+    fast = regular
+    body = "\n".join([grammars[i] for i in fast])
+  if fast:
+    for i, k in zip(fast, body.lower().replace("::", ".").split("\n")):
+      out[i] = "g." + k[1:-1]
+  return out
+
+
+class DomainTags:
+  """
+  Key prefix -> tag lookup over a trie of dotted segments, so a rule for
+  "susfarm.market" can sit under one for "susfarm"; the deepest matching
+  rule wins. Rules are "domain" (tag = domain) or "a.b=tag", relative to
+  "g.". Lookups are memoized per instance, up to GRAMMAR_CACHE_SIZE keys.
+  """
+
+  __slots__ = ("root", "_cache")
+
+  def __init__(self, rules: Iterable[str] = DEFAULT_DOMAIN_TAGS):
+    self.root: dict = {}
+    self._cache: Dict[str, Optional[str]] = {}
+    for rule in rules:
+      prefix, _, tag = rule.partition("=")
+      prefix = prefix.strip().strip(".")
+      if not prefix:
+        raise ValueError(f"Invalid domain rule: {rule!r}")
+      node = self.root
+      for seg in prefix.split("."):
+        node = node.setdefault(seg, {})
+      node[None] = tag.strip() or prefix.rsplit(".", 1)[-1]
+
+  def tag(self, key: str) -> Optional[str]:
+    try:
+      return self._cache[key]
+    except KeyError:
+      pass
+    if not key.startswith("g."):
+      return None
+    node = self.root
+    found = None
+    parts = key.split(".")
+    # The last part is the node name itself, never a domain
+    for seg in parts[1:-1]:
+      node = node.get(seg)
+      if node is None:
+        break
+      found = node.get(None, found)
+    if len(self._cache) >= GRAMMAR_CACHE_SIZE:
+      self._cache.clear()
+    self._cache[key] = found
+    return found
+
+  def tags(self, key: str) -> List[str]:
+    t = self.tag(key)
+    return ["ui", t] if t else ["ui"]
+
+
+_DEFAULT_DOMAIN_TAGS = DomainTags()
+
+
+def infer_tags_from_key(key: str, domains: Optional[DomainTags] = None) -> List[str]:
   # Minimal heuristic tags.
-  tags = ["ui"]
-  if key.startswith("g.rite."):
-    tags.append("rite")
-  elif key.startswith("g.term."):
-    tags.append("term")
-  elif key.startswith("g.bank."):
-    tags.append("bank")
-  elif key.startswith("g.shop."):
-    tags.append("shop")
-  elif key.startswith("g.sys."):
-    tags.append("sys")
-  elif key.startswith("g.site."):
-    tags.append("site")
-  elif key.startswith("g.confess."):
-    tags.append("confess")
-  return tags
-
-
-def i18n_to_nodes(i18n_maps: Dict[str, Dict[str, str]]) -> List[Node]:
+  return (domains or _DEFAULT_DOMAIN_TAGS).tags(key)
+
+
+def i18n_to_nodes(i18n_maps: Dict[str, Dict[str, str]], domains: Optional[DomainTags] = None) -> List[Node]:
   keys: Set[str] = set()
   for _, m in i18n_maps.items():
-    keys |= set(m.keys())
+    keys.update(m)
 
-  # Only keep grammar namespace keys.
-  keys = {k for k in keys if k.startswith("g.")}
-
-  nodes: List[Node] = []
-  for k in sorted(keys):
-    try:
-      g = key_to_grammar(k)
-    except Exception:
-      # Skip malformed
-      continue
-    nodes.append(Node(key=k, grammar=g, tags=infer_tags_from_key(k), notes=""))
-  return nodes
+  # Only keep grammar namespace keys; malformed ones are skipped.
+  keys_sorted = sorted(k for k in keys if k.startswith("g."))
+  domains = domains or _DEFAULT_DOMAIN_TAGS
+  return [
+    Node(key=k, grammar=g, tags=domains.tags(k), notes="")
+    for k, g in zip(keys_sorted, keys_to_grammar(keys_sorted))
+    if g is not None
+  ]
 
 
 def nodes_to_skeleton(nodes: List[Node], langs: List[str]) -> Dict[str, Dict[str, str]]:
@@ -140,78 +673,248 @@ def nodes_to_skeleton(nodes: List[Node], langs: List[str]) -> Dict[str, Dict[str
   return out
 
 
-def validate(nodes: List[Node], i18n_maps: Dict[str, Dict[str, str]]) -> Tuple[dict, dict]:
-  node_keys = {n.key for n in nodes}
-  all_i18n_keys = set()
-  for _, m in i18n_maps.items():
-    all_i18n_keys |= set(m.keys())
-
-  missing_by_lang: Dict[str, List[str]] = {}
-  for lang, m in i18n_maps.items():
-    missing = sorted([k for k in node_keys if k not in m])
-    missing_by_lang[lang] = missing
+# bytes of 0/1 flags <-> ASCII "0"/"1" digits, for building/reading bitmaps
+# without a Python-level loop per key.
+_FLAGS_TO_DIGITS = bytes.maketrans(b"\x00\x01", b"01")
+_DIGITS_TO_FLAGS = bytes.maketrans(b"01", b"\x00\x01")
 
-  orphan = sorted([k for k in all_i18n_keys if k.startswith("g.") and k not in node_keys])
 
-  missing_report = {
-    "version": VERSION,
-    "missing_by_lang": missing_by_lang,
-    "node_count": len(node_keys),
-  }
-  orphan_report = {
-    "version": VERSION,
-    "orphan_keys": orphan,
-    "orphan_count": len(orphan),
-  }
-  return missing_report, orphan_report
+class KeyTable:
+  """
+  Interned key table. Every key gets a dense integer id (in sorted order for
+  the initial keys); a set of keys is an int bitmap over those ids, so set
+  algebra is a handful of big-int operations instead of per-key hashing.
+  """
 
+  __slots__ = ("keys", "ids", "g_mask", "ordered")
+
+  def __init__(self, keys: Iterable[str] = ()):
+    self.keys: List[str] = sorted(set(keys))
+    self.ids: Dict[str, int] = {k: i for i, k in enumerate(self.keys)}
+    # Keys interned later are appended, so ids stop following sort order.
+    self.ordered = True
+    flags = bytes(map(str.startswith, self.keys, itertools.repeat("g.")))
+    self.g_mask = self._from_flags(flags)
+
+  @staticmethod
+  def _from_flags(flags: bytes) -> int:
+    if not flags:
+      return 0
+    return int(flags.translate(_FLAGS_TO_DIGITS)[::-1], 2)
+
+  def intern(self, key: str) -> int:
+    i = self.ids.get(key)
+    if i is None:
+      i = len(self.keys)
+      if self.keys and key < self.keys[-1]:
+        self.ordered = False
+      self.keys.append(key)
+      self.ids[key] = i
+      if key.startswith("g."):
+        self.g_mask |= 1 << i
+    return i
+
+  def mask(self, keys: Iterable[str], interned: bool = False) -> int:
+    """Bitmap of keys; unknown keys are interned unless the caller says none are."""
+    if not isinstance(keys, (set, frozenset, dict)):
+      keys = set(keys)
+    if not interned:
+      for k in sorted(keys - self.ids.keys()):
+        self.intern(k)
+    return self._from_flags(bytes(map(keys.__contains__, self.keys)))
+
+  def select(self, mask: int) -> List[str]:
+    """Keys whose bit is set in mask, sorted."""
+    if not mask:
+      return []
+    flags = bin(mask)[:1:-1].encode("ascii").translate(_DIGITS_TO_FLAGS)
+    out = list(itertools.compress(self.keys, flags))
+    if not self.ordered:
+      out.sort()
+    return out
+
+
+class CatalogIndex:
+  """
+  Node keys plus per-language presence bitmaps over one KeyTable; shared by
+  validate, patch and scan-ui.
+  """
 
-def patch(nodes: List[Node], i18n_maps: Dict[str, Dict[str, str]], base_lang: str) -> Dict[str, Dict[str, str]]:
+  __slots__ = ("table", "node_mask", "lang_masks")
+
+  def __init__(self, node_keys: Iterable[str], i18n_maps: Dict[str, Dict[str, str]], extra_keys: Iterable[str] = ()):
+    with TIMINGS.phase("index"):
+      node_keys = list(node_keys)
+      extra_keys = list(extra_keys)
+      universe = set(node_keys)
+      universe.update(extra_keys)
+      for _, m in i18n_maps.items():
+        universe.update(m)
+      self.table = KeyTable(universe)
+      self.node_mask = self.table.mask(node_keys, interned=True)
+      self.lang_masks: Dict[str, int] = {
+        lang: self.table.mask(m, interned=True) for lang, m in i18n_maps.items()
+      }
+    TIMINGS.count("keys", len(self.table.keys))
+
+  def set_nodes(self, node_keys: Iterable[str]) -> None:
+    self.node_mask = self.table.mask(node_keys)
+
+  def set_lang(self, lang: str, keys: Iterable[str]) -> None:
+    self.lang_masks[lang] = self.table.mask(keys)
+
+  def drop_lang(self, lang: str) -> None:
+    self.lang_masks.pop(lang, None)
+
+  def union_mask(self) -> int:
+    u = 0
+    for _, lm in self.lang_masks.items():
+      u |= lm
+    return u
+
+  def missing(self, lang: str) -> List[str]:
+    return self.table.select(self.node_mask & ~self.lang_masks[lang])
+
+  def validation_reports(self) -> Tuple[dict, dict]:
+    with TIMINGS.phase("sets"):
+      return self._validation_reports()
+
+  def _validation_reports(self) -> Tuple[dict, dict]:
+    missing_by_lang = {lang: self.missing(lang) for lang in self.lang_masks}
+    orphan = self.table.select(self.union_mask() & self.table.g_mask & ~self.node_mask)
+
+    missing_report = {
+      "version": VERSION,
+      "missing_by_lang": missing_by_lang,
+      "node_count": self.node_mask.bit_count(),
+    }
+    orphan_report = {
+      "version": VERSION,
+      "orphan_keys": orphan,
+      "orphan_count": len(orphan),
+    }
+    return missing_report, orphan_report
+
+  def ui_reports(self, ui_keys: Iterable[str]) -> Dict[str, dict]:
+    with TIMINGS.phase("sets"):
+      return self._ui_reports(ui_keys)
+
+  def _ui_reports(self, ui_keys: Iterable[str]) -> Dict[str, dict]:
+    t = self.table
+    ui_mask = t.mask(ui_keys)
+    ui_g_mask = ui_mask & t.g_mask
+
+    ui_missing_in_nodes = t.select(ui_g_mask & ~self.node_mask)
+    nodes_unused_in_ui = t.select(self.node_mask & ~ui_g_mask)
+    legacy_orphan = t.select(self.union_mask() & t.g_mask & ~self.node_mask & ~ui_g_mask)
+
+    return {
+      "ui_keys.json": {
+        "version": VERSION,
+        "count": ui_mask.bit_count(),
+        "g_count": ui_g_mask.bit_count(),
+        "keys": t.select(ui_mask),
+      },
+      "ui_missing_in_nodes.json": {
+        "version": VERSION,
+        "count": len(ui_missing_in_nodes),
+        "keys": ui_missing_in_nodes,
+      },
+      "nodes_unused_in_ui.json": {
+        "version": VERSION,
+        "count": len(nodes_unused_in_ui),
+        "keys": nodes_unused_in_ui,
+      },
+      "legacy_orphan_keys.json": {
+        "version": VERSION,
+        "count": len(legacy_orphan),
+        "keys": legacy_orphan,
+      },
+    }
+
+
+def validate(
+  nodes: List[Node],
+  i18n_maps: Dict[str, Dict[str, str]],
+  index: Optional[CatalogIndex] = None,
+) -> Tuple[dict, dict]:
+  if index is None:
+    index = CatalogIndex((n.key for n in nodes), i18n_maps)
+  return index.validation_reports()
+
+
+def patch_delta(nodes: List[Node], i18n_maps: Dict[str, Dict[str, str]], base_lang: str) -> Dict[str, Dict[str, str]]:
+  """
+  { lang: { missing node key: filled value } }, in node order; {} for a
+  language that has every node key. The input maps are not copied.
+  """
   if base_lang not in i18n_maps:
     raise ValueError(f"base lang '{base_lang}' not found in i18n dir.")
   base = i18n_maps[base_lang]
   node_keys = [n.key for n in nodes]
+  index = CatalogIndex(node_keys, i18n_maps)
+
+  # Missing keys are appended in node order, as a per-node loop would.
+  node_pos: Dict[str, int] = {}
+  for i, k in enumerate(node_keys):
+    node_pos.setdefault(k, i)
+
+  delta: Dict[str, Dict[str, str]] = {}
+  with TIMINGS.phase("sets"):
+    for lang in i18n_maps:
+      # fallback to base value; if base also missing, empty
+      delta[lang] = {k: base.get(k, "") for k in sorted(index.missing(lang), key=node_pos.__getitem__)}
+  return delta
+
+
+def patch(nodes: List[Node], i18n_maps: Dict[str, Dict[str, str]], base_lang: str) -> Dict[str, Dict[str, str]]:
+  delta = patch_delta(nodes, i18n_maps, base_lang)
+  return {lang: {**m, **delta[lang]} for lang, m in i18n_maps.items()}
 
-  out = {lang: dict(m) for lang, m in i18n_maps.items()}
-  for lang, m in out.items():
-    for k in node_keys:
-      if k not in m:
-        # fallback to base value; if base also missing, empty
-        m[k] = base.get(k, "")
-  return out
+
+def _domains_from_args(args) -> Optional[DomainTags]:
+  return DomainTags(args.domains) if getattr(args, "domains", None) else None
 
 
 def cmd_i18n_to_nodes(args):
-  i18n_maps = read_i18n_dir(args.i18n_dir)
-  nodes = i18n_to_nodes(i18n_maps)
-  obj = {
-    "version": "gbook-node-index/1.0",
-    "generated_by": VERSION,
-    "nodes": [asdict(n) for n in nodes],
+  i18n_maps = load_i18n(args.i18n_dir)
+  nodes = i18n_to_nodes(i18n_maps, _domains_from_args(args))
+  write_json(args.out, nodes_document(nodes))
+
+
+def cmd_nodes_split(args):
+  # A sharded source is read without hash checks, so this also re-indexes
+  # hand-edited shards.
+  nodes = load_nodes(args.nodes, verify=False)
+  stats = split_nodes(nodes, args.out_dir)
+  print(f"[nodes-split] {stats['nodes']} node(s) -> {stats['shards']} shard(s) in {args.out_dir}: "
+        f"{stats['written']} written, {stats['removed']} removed")
+
+
+def cmd_nodes_merge(args):
+  nodes = load_nodes(args.nodes)
+  changed = write_json(args.out, nodes_document(nodes))
+  print(f"[nodes-merge] {len(nodes)} node(s) -> {args.out} ({'written' if changed else 'unchanged'})")
+
+
+def _restrict_to_domains(i18n_maps: Dict[str, Dict[str, str]], domains: List[str]) -> Dict[str, Dict[str, str]]:
+  # Drops g.* keys of other domains, so reports cover only the loaded shards.
+  wanted = set(domains)
+  return {
+    lang: {k: v for k, v in m.items() if not k.startswith("g.") or node_domain(k) in wanted}
+    for lang, m in i18n_maps.items()
   }
-  write_json(args.out, obj)
 
 
 def cmd_nodes_to_skeleton(args):
-  nodes_obj = read_json(args.nodes)
-  nodes = [Node(**n) for n in nodes_obj.get("nodes", [])]
+  nodes = load_nodes(args.nodes, args.only_domains)
   skel = nodes_to_skeleton(nodes, args.langs)
   os.makedirs(args.out_dir, exist_ok=True)
   for lang, m in skel.items():
     write_json(os.path.join(args.out_dir, f"{lang}.json"), m)
 
 
-def cmd_validate(args):
-  nodes_obj = read_json(args.nodes)
-  nodes = [Node(**n) for n in nodes_obj.get("nodes", [])]
-  i18n_maps = read_i18n_dir(args.i18n_dir)
-
-  missing_report, orphan_report = validate(nodes, i18n_maps)
-  os.makedirs(args.report_dir, exist_ok=True)
-  write_json(os.path.join(args.report_dir, "missing_keys.json"), missing_report)
-  write_json(os.path.join(args.report_dir, "orphan_keys.json"), orphan_report)
-
-  # Small md summary
+def validation_summary_md(missing_report: dict, orphan_report: dict) -> str:
   lines = []
   lines.append("# Grammar ↔ i18n Validation Report")
   lines.append("")
@@ -221,20 +924,377 @@ def cmd_validate(args):
   lines.append("## Missing keys by language")
   for lang, miss in missing_report["missing_by_lang"].items():
     lines.append(f"- {lang}: {len(miss)}")
-  md = "\n".join(lines) + "\n"
-  with open(os.path.join(args.report_dir, "diff_summary.md"), "w", encoding="utf-8") as f:
-    f.write(md)
+  return "\n".join(lines) + "\n"
+
+
+def write_validation_reports(report_dir: str, missing_report: dict, orphan_report: dict) -> None:
+  os.makedirs(report_dir, exist_ok=True)
+  write_json(os.path.join(report_dir, "missing_keys.json"), missing_report)
+  write_json(os.path.join(report_dir, "orphan_keys.json"), orphan_report)
+
+  # Small md summary
+  md = validation_summary_md(missing_report, orphan_report)
+  write_text(os.path.join(report_dir, "diff_summary.md"), md)
+
+
+def cmd_validate(args):
+  nodes = load_nodes(args.nodes, args.only_domains)
+  i18n_maps = load_i18n(args.i18n_dir)
+  if args.only_domains:
+    i18n_maps = _restrict_to_domains(i18n_maps, args.only_domains)
+
+  missing_report, orphan_report = validate(nodes, i18n_maps)
+  write_validation_reports(args.report_dir, missing_report, orphan_report)
 
 
 def cmd_patch(args):
-  nodes_obj = read_json(args.nodes)
-  nodes = [Node(**n) for n in nodes_obj.get("nodes", [])]
-  i18n_maps = read_i18n_dir(args.i18n_dir)
-  patched = patch(nodes, i18n_maps, args.base_lang)
+  from concurrent.futures import ThreadPoolExecutor
+
+  nodes = load_nodes(args.nodes)
+  i18n_maps = load_i18n(args.i18n_dir)
+  delta = patch_delta(nodes, i18n_maps, args.base_lang)
 
   os.makedirs(args.out_dir, exist_ok=True)
-  for lang, m in patched.items():
-    write_json(os.path.join(args.out_dir, f"{lang}.json"), m)
+  # Patching in place: a language with nothing to fill is already its output
+  in_place = os.path.isdir(args.i18n_dir) and os.path.samefile(args.i18n_dir, args.out_dir)
+
+  def write_lang(lang: str) -> str:
+    fill = delta[lang]
+    if not fill and in_place:
+      return "skipped"
+    m = i18n_maps[lang]
+    # Filled keys go after the existing ones, whose order is kept
+    wrote = write_json(os.path.join(args.out_dir, f"{lang}.json"), {**m, **fill} if fill else m)
+    return "written" if wrote else "unchanged"
+
+  langs = list(i18n_maps)
+  jobs = min(_resolve_jobs(args.jobs), len(langs))
+  with TIMINGS.phase("write_reports"):
+    if jobs <= 1:
+      status = [write_lang(lang) for lang in langs]
+    else:
+      with ThreadPoolExecutor(max_workers=jobs) as ex:
+        status = list(ex.map(write_lang, langs))
+
+  report = {
+    "version": VERSION,
+    "base_lang": args.base_lang,
+    "filled_total": sum(len(d) for d in delta.values()),
+    "langs": {lang: {"filled": len(delta[lang]), "output": st} for lang, st in zip(langs, status)},
+  }
+  for lang, ent in report["langs"].items():
+    print(f"[patch] {lang}: {ent['filled']} key(s) filled, {ent['output']}")
+  if args.report:
+    write_json(args.report, report)
+
+
+# {name} placeholders as assets/i18n.js tReplace() matches them (JS \w is ASCII)
+PLACEHOLDER_RE = re.compile(r"\{(\w+)\}", re.ASCII)
+
+
+def compile_template(text: str) -> Optional[List[str]]:
+  """
+  "Paid {price} ({id})" -> ["Paid ", "price", " (", "id", ")"]: literals at
+  even indices, placeholder names at odd ones, so rendering is plain
+  concatenation. None for strings without placeholders.
+  """
+  parts = PLACEHOLDER_RE.split(text)
+  return parts if len(parts) > 1 else None
+
+
+def compile_templates(strings: Dict[str, str]) -> Dict[str, List[str]]:
+  out: Dict[str, List[str]] = {}
+  for k, v in strings.items():
+    tpl = compile_template(v)
+    if tpl is not None:
+      out[k] = tpl
+  return out
+
+
+def placeholder_report(i18n_maps: Dict[str, Dict[str, str]], base_lang: str) -> dict:
+  """
+  Keys whose placeholder set in some language differs from base_lang's:
+  { key: { lang: { "missing": [...], "extra": [...] } } }. Keys the base
+  language lacks are not checked.
+  """
+  if base_lang not in i18n_maps:
+    raise ValueError(f"base lang '{base_lang}' not found in i18n dir.")
+  base = {k: set(PLACEHOLDER_RE.findall(v)) for k, v in i18n_maps[base_lang].items()}
+  mismatches: Dict[str, Dict[str, dict]] = {}
+  for lang in sorted(i18n_maps):
+    if lang == base_lang:
+      continue
+    for k, v in i18n_maps[lang].items():
+      want = base.get(k)
+      if want is None:
+        continue
+      have = set(PLACEHOLDER_RE.findall(v)) if "{" in v else set()
+      if have != want:
+        mismatches.setdefault(k, {})[lang] = {"missing": sorted(want - have), "extra": sorted(have - want)}
+  return {
+    "version": VERSION,
+    "base_lang": base_lang,
+    "template_count": sum(1 for p in base.values() if p),
+    "mismatch_count": len(mismatches),
+    "mismatches": dict(sorted(mismatches.items())),
+  }
+
+
+def templates_js(lang: str, templates: Dict[str, List[str]]) -> str:
+  # Merges into window.I18N_TPL[lang], read by tFormat() in assets/i18n.js
+  if not templates:
+    return ""
+  body = json.dumps(templates, ensure_ascii=False, separators=(",", ":"))
+  return (
+    f"(function(T,l,d){{T[l]=Object.assign(T[l]||{{}},d)}})"
+    f"(window.I18N_TPL=window.I18N_TPL||{{}},{json.dumps(lang)},{body});\n"
+  )
+
+
+def web_bundle_files(i18n_maps: Dict[str, Dict[str, str]]) -> Dict[str, str]:
+  """
+  Per-language browser payloads: { "<lang>.json": text, "<lang>.js": text,
+  "<lang>.tpl.json": text }. The .js form registers itself on window.I18N,
+  plus its compiled placeholder templates on window.I18N_TPL, so a page
+  includes only the languages it needs.
+  """
+  out: Dict[str, str] = {}
+  for lang in sorted(i18n_maps):
+    body = json.dumps(dict(i18n_maps[lang]), ensure_ascii=False, separators=(",", ":"))
+    templates = compile_templates(i18n_maps[lang])
+    out[f"{lang}.json"] = body + "\n"
+    out[f"{lang}.tpl.json"] = json.dumps(templates, ensure_ascii=False, separators=(",", ":")) + "\n"
+    out[f"{lang}.js"] = (
+      f"(window.I18N = window.I18N || {{}})[{json.dumps(lang)}] = {body};\n"
+      + templates_js(lang, templates)
+    )
+  return out
+
+
+def cmd_bundle(args):
+  from i18n_bundle import write_bundle
+
+  i18n_maps = read_i18n_dir(args.i18n_dir)
+  report = placeholder_report(i18n_maps, args.base_lang)
+  if args.report_dir:
+    write_json(os.path.join(args.report_dir, "placeholder_mismatch.json"), report)
+  level = "WARN" if args.allow_placeholder_mismatch else "FAIL"
+  for k, langs in report["mismatches"].items():
+    for lang, d in langs.items():
+      print(f"[{level}] {k} [{lang}]: missing {d['missing']}, extra {d['extra']} (vs {args.base_lang})")
+  if report["mismatch_count"] and not args.allow_placeholder_mismatch:
+    sys.exit(1)
+
+  stats = write_bundle(args.out, i18n_maps)
+  print(f"[bundle] {args.out}: {stats['langs']} lang(s), {stats['keys']} key(s), {stats['bytes']} bytes")
+  if args.web_dir:
+    for name, text in web_bundle_files(i18n_maps).items():
+      write_text(os.path.join(args.web_dir, name), text)
+    print(f"[bundle] per-language JSON/JS -> {args.web_dir} ({report['template_count']} template(s) precompiled)")
+
+
+SUBSET_VERSION = "i18n-subset/1"
+SCRIPT_SRC_RE = re.compile(r"""<script\b[^>]*?\bsrc\s*=\s*["']([^"']+)["']""", re.IGNORECASE)
+# Quoted literals in HTML/JS; only those that are catalog keys are kept, so
+# t('terminal.commands.help') and data-i18n-placeholder="..." both count.
+# A literal followed by ':' is an object property name (how a JS catalog
+# declares its keys), not a use, unless it follows '?': the first branch of
+# `cond ? 'key.a' : 'key.b'`. Comments are skipped; braces and backticks
+# are tracked so template literals, which nest through ${}, stay in step.
+JS_CODE_RE = re.compile(r"""
+    //[^\n]*
+  | /\*[\s\S]*?\*/
+  | (?P<ternary>\?\s*)?(?:'(?P<sq>[^'\\\n]*(?:\\.[^'\\\n]*)*)'|"(?P<dq>[^"\\\n]*(?:\\.[^"\\\n]*)*)")(?P<prop>\s*:)?
+  | (?P<open>[`{}])
+""", re.X)
+# Template text up to its closing backtick or the next ${
+JS_TEMPLATE_RE = re.compile(r"(?:[^`\\$]|\\[\s\S]|\$(?!\{))*(?P<end>`|\$\{)")
+# A key built from a template literal, `g.susfarm.stage.${plot.stage}`,
+# stands for every catalog key matching g.susfarm.stage.* (the fixed part
+# before the first ${} must reach a ".", so `${k}` alone matches nothing)
+TEMPLATE_KEY_RE = re.compile(r"[\w-]+\.[\w.-]*(?:\$\{[^{}`]*\}[\w.-]*)+")
+TEMPLATE_SUBST_RE = re.compile(r"\$\{[^{}`]*\}")
+
+
+def literal_keys(text: str, catalog: Set[str]) -> Set[str]:
+  found: Set[str] = set()
+  patterns: Set[str] = set()
+  stack: List[str] = []  # "{", "${" or "`" (inside a template's text)
+  starts: List[int] = []
+  pos = 0
+  while True:
+    if stack and stack[-1] == "`":
+      m = JS_TEMPLATE_RE.match(text, pos)
+      if not m:
+        break
+      # Markup in the text: `<span data-i18n="key">`
+      seg = text[pos:m.start("end")]
+      if "'" in seg or '"' in seg:
+        found |= literal_keys(seg, catalog)
+      pos = m.end()
+      if m.group("end") == "${":
+        stack.append("${")
+        continue
+      stack.pop()
+      lit = text[starts.pop():pos - 1]
+      if "${" not in lit:
+        if lit in catalog:
+          found.add(lit)
+      elif TEMPLATE_KEY_RE.fullmatch(lit):
+        patterns.add(TEMPLATE_SUBST_RE.sub("*", lit))
+      continue
+    m = JS_CODE_RE.search(text, pos)
+    if not m:
+      break
+    pos = m.end()
+    tok = m.group("open")
+    if tok == "`":
+      stack.append("`")
+      starts.append(pos)
+    elif tok == "{":
+      stack.append("{")
+    elif tok == "}":
+      # Closing a ${} resumes the template text under it
+      if stack:
+        stack.pop()
+    elif tok is None and not (m.group("prop") and not m.group("ternary")):
+      lit = m.group("sq") if m.group("sq") is not None else m.group("dq")
+      if lit in catalog:
+        found.add(lit)
+  for pat in patterns:
+    found.update(k for k in catalog if fnmatch.fnmatchcase(k, pat))
+  return found
+
+
+def page_scripts(page: str, text: str) -> List[str]:
+  """Local files behind a page's <script src>; URLs with a scheme are skipped."""
+  out = []
+  for src in SCRIPT_SRC_RE.findall(text):
+    src = src.split("?", 1)[0].split("#", 1)[0]
+    if not src or "//" in src or ":" in src:
+      continue
+    if src.startswith("/"):
+      out.append(os.path.join(os.getcwd(), src.lstrip("/")))
+    else:
+      out.append(os.path.normpath(os.path.join(os.path.dirname(page), src)))
+  return out
+
+
+def page_key_sets(
+  index: Dict[str, List[str]],
+  catalog: Set[str],
+  with_scripts: bool = True,
+) -> Dict[str, Set[str]]:
+  """
+  { page: keys it can render }: its data-i18n keys plus, with with_scripts,
+  every catalog key that appears as a string literal in the page or in the
+  local scripts it loads, or matches a key template literal there. Other
+  keys built at runtime are not seen; list them with --keep.
+  """
+  script_keys: Dict[str, Set[str]] = {}
+  pages: Dict[str, Set[str]] = {}
+  for page, keys in index.items():
+    found = set(keys)
+    if with_scripts:
+      try:
+        with open(page, "r", encoding="utf-8", errors="replace") as f:
+          text = f.read()
+      except OSError:
+        text = ""
+      found |= literal_keys(text, catalog)
+      for js in page_scripts(page, text):
+        if js not in script_keys:
+          try:
+            with open(js, "r", encoding="utf-8", errors="replace") as f:
+              script_keys[js] = literal_keys(f.read(), catalog)
+          except OSError:
+            script_keys[js] = set()
+        found |= script_keys[js]
+    pages[page] = found
+  return pages
+
+
+def split_core(page_keys: Dict[str, Set[str]], keep: Set[str]) -> Tuple[Set[str], Dict[str, Set[str]]]:
+  """
+  Shared core = keys every page uses, plus `keep`. Returns
+  (core, { page: its keys minus the core }).
+  """
+  sets = list(page_keys.values())
+  core = set.intersection(*sets) if sets else set()
+  core |= keep
+  return core, {page: keys - core for page, keys in page_keys.items()}
+
+
+def i18n_chunk_js(lang: str, strings: Dict[str, str]) -> str:
+  # Merges into window.I18N[lang], so the core and a page chunk can load in
+  # either order.
+  body = json.dumps(strings, ensure_ascii=False, separators=(",", ":"))
+  return (
+    f"(function(I,l,d){{I[l]=Object.assign(I[l]||{{}},d)}})"
+    f"(window.I18N=window.I18N||{{}},{json.dumps(lang)},{body});\n"
+  ) + templates_js(lang, compile_templates(strings))
+
+
+def subset_files(
+  i18n_maps: Dict[str, Dict[str, str]],
+  core: Set[str],
+  chunks: Dict[str, Set[str]],
+) -> Tuple[Dict[str, str], dict]:
+  """
+  Returns ({ relative path: text }, manifest). Chunk paths mirror the page
+  path relative to the cwd: susfarm/index.html -> susfarm/index.<lang>.js.
+  """
+  cwd = os.getcwd()
+  files: Dict[str, str] = {}
+  manifest = {"version": SUBSET_VERSION, "langs": sorted(i18n_maps), "core": {}, "pages": {}}
+
+  def emit(stem: str, keys: Set[str]) -> dict:
+    out = {}
+    for lang in sorted(i18n_maps):
+      m = i18n_maps[lang]
+      strings = {k: m[k] for k in sorted(keys) if k in m}
+      name = f"{stem}.{lang}.js"
+      files[name] = i18n_chunk_js(lang, strings)
+      out[lang] = {"file": name, "keys": len(strings), "bytes": len(files[name].encode("utf-8"))}
+    return out
+
+  manifest["core"] = {"keys": sorted(core), "files": emit("core", core)}
+  for page in sorted(chunks):
+    rel = os.path.relpath(page, cwd) if page.startswith(cwd + os.sep) else page
+    rel = rel.replace(os.sep, "/")
+    stem = rel[:-5] if rel.lower().endswith(".html") else rel
+    manifest["pages"][rel] = {"keys": sorted(chunks[page]), "files": emit(stem, chunks[page])}
+  return files, manifest
+
+
+def cmd_subset(args):
+  i18n_maps = load_i18n(args.i18n_dir)
+  catalog: Set[str] = set()
+  for m in i18n_maps.values():
+    catalog.update(m)
+
+  index = scan_ui_index(
+    args.scan_paths,
+    _ignore_dirs_from_args(args),
+    _scan_cache_path_from_args(args),
+    args.rebuild_cache,
+    args.jobs,
+  )
+  page_keys = page_key_sets(index, catalog, not args.no_scripts)
+  keep = {k for k in catalog if any(fnmatch.fnmatchcase(k, pat) for pat in args.keep)}
+  core, chunks = split_core(page_keys, keep)
+
+  files, manifest = subset_files(i18n_maps, core, chunks)
+  for name, text in files.items():
+    write_text(os.path.join(args.out_dir, name), text)
+  write_json(os.path.join(args.out_dir, "pages.json"), manifest)
+
+  full = sum(len(b.encode("utf-8")) for n, b in web_bundle_files(i18n_maps).items() if n.endswith(".js"))
+  print(f"[subset] {len(chunks)} page(s), core {len(core)} key(s) -> {args.out_dir}")
+  for rel, ent in manifest["pages"].items():
+    per_lang = [ent["files"][l]["bytes"] + manifest["core"]["files"][l]["bytes"] for l in manifest["langs"]]
+    print(f"[subset]   {rel}: {len(ent['keys'])} page key(s); "
+          f"{max(per_lang) if per_lang else 0} bytes per language (all languages, all keys: {full})")
 
 
 def _should_skip_path(path: Path, ignore_dirs: set) -> bool:
@@ -252,126 +1312,820 @@ def iter_html_files(scan_paths: List[str], ignore_dirs: set) -> List[Path]:
 
     if root.is_file():
       if root.suffix.lower() == ".html" and not _should_skip_path(root, ignore_dirs):
-        files.append(root)
+        files.append(root.resolve())
       continue
 
-    # Directory: recursively walk
-    for hp in root.rglob("*.html"):
-      if _should_skip_path(hp, ignore_dirs):
-        continue
-      files.append(hp)
+    if _should_skip_path(root, ignore_dirs):
+      continue
+
+    # Directory: recursively walk, pruning ignored dirs instead of descending
+    # into them. Resolve the root once; children are joined onto it.
+    base = str(root.resolve())
+    for dirpath, dirnames, filenames in os.walk(base):
+      dirnames[:] = [d for d in dirnames if d not in ignore_dirs]
+      for fn in filenames:
+        if fnmatch.fnmatch(fn, "*.html"):
+          files.append(Path(dirpath, fn))
 
   # De-dup, stable order
-  uniq = sorted({f.resolve() for f in files})
+  uniq = sorted(set(files))
   return uniq
 
 
-def scan_ui_keys(scan_paths: List[str], ignore_dirs: set) -> Set[str]:
-  """Scan HTML files for data-i18n attributes with recursive directory support"""
-  keys: Set[str] = set()
-  html_files = iter_html_files(scan_paths, ignore_dirs)
+# Streaming data-i18n tokenizer. In "text" state each search() lands on the
+# next comment, script/style start tag, end tag or start tag, matched whole
+# (quoted values may contain '<' or '>'); text between them is skipped in C.
+# Comments and raw-text bodies switch to a state that only looks for their
+# terminator. Patterns are unrolled loops so an unterminated tag at a chunk
+# boundary fails in linear time instead of backtracking.
+_ATTR_BODY = r"""[^>"']*(?:(?:"[^"]*"|'[^']*')[^>"']*)*"""
+_HTML_TOKEN_RE = re.compile(
+  r"(?P<comment><!--)"
+  r"|<(?P<raw>script|style)(?=[\s/>])(?P<rattrs>" + _ATTR_BODY + r")>"
+  r"|<[a-zA-Z][^\s/>]*(?P<attrs>" + _ATTR_BODY + r")>"
+  r"|<[/!][^>]*>",
+  re.IGNORECASE,
+)
+# A '<' that could open a token; if one is skipped over, that token was cut
+# off by the end of the buffer.
+_HTML_TOKEN_START_RE = re.compile(r"<(?:[a-zA-Z/!]|$)")
+_HTML_ATTR_RE = re.compile(r"""([^\s"'>/=]+)(?:\s*=\s*(?:"([^"]*)"|'([^']*)'|([^\s>]+)))?""")
+_I18N_ATTR_NAME_RE = re.compile(r"data-i18n", re.IGNORECASE)
+_COMMENT_END_RE = re.compile(r"-->")
+_RAW_END_RE = {
+  "script": re.compile(r"</script\s*>", re.IGNORECASE),
+  "style": re.compile(r"</style\s*>", re.IGNORECASE),
+}
+# An unterminated "<tag" longer than this is treated as text, not buffered.
+_MAX_TAG_CHARS = 1024 * 1024
+
+
+class _I18nScanner:
+  """
+  Incremental data-i18n extractor. feed() accepts arbitrary chunks and
+  returns the (key, line, column) hits completed so far; the carried buffer
+  never holds more than one unfinished tag plus a few terminator bytes.
+  """
+
+  def __init__(self):
+    self.buf = ""
+    self.state = "text"  # "text" | "comment" | "script" | "style"
+    self.line = 1  # line/column (1-based) of buf[0]
+    self.col = 1
+
+  def _tag_keys(self, m, kind: str) -> List[str]:
+    a, b = m.start(kind), m.end(kind)
+    keys = []
+    for am in _HTML_ATTR_RE.finditer(self.buf, a, b):
+      if am.group(1).lower() != "data-i18n":
+        continue
+      v = am.group(2)
+      if v is None:
+        v = am.group(3) if am.group(3) is not None else am.group(4)
+      if v and "&" in v:
+        v = html.unescape(v)
+      k = (v or "").strip()
+      if k:
+        keys.append(k)
+    return keys
+
+  def _run(self, final: bool) -> List[Tuple[str, int, int]]:
+    buf = self.buf
+    find = buf.find
+    has_i18n = _I18N_ATTR_NAME_RE.search
+    out: List[Tuple[str, int, int]] = []
+    # Line/column cursor; hits are monotonic so counting is incremental.
+    cur, line, col = 0, self.line, self.col
+
+    pos = 0
+    n = len(buf)
+    while pos < n:
+      if self.state != "text":
+        end_re = _COMMENT_END_RE if self.state == "comment" else _RAW_END_RE[self.state]
+        m = end_re.search(buf, pos)
+        if m is None:
+          # Keep just enough to recognise a terminator split across chunks.
+          pos = n if final else max(pos, n - 16)
+          break
+        self.state = "text"
+        pos = m.end()
+        continue
+
+      cut = None  # start of a token that did not match, if any
+      for m in _HTML_TOKEN_RE.finditer(buf, pos):
+        start = m.start()
+        if start != pos and find("<", pos, start) != -1:
+          cut = _HTML_TOKEN_START_RE.search(buf, pos, start)
+          if cut is not None:
+            break
+        pos = m.end()
+
+        kind = m.lastgroup
+        if kind is None:
+          continue
+        if kind == "comment":
+          self.state = "comment"
+          break
+        if kind == "rattrs":
+          self.state = m.group("raw").lower()
+        if has_i18n(buf, m.start(kind), m.end(kind)):
+          nl = buf.count("\n", cur, start)
+          if nl:
+            line += nl
+            col = start - buf.rfind("\n", cur, start)
+          else:
+            col += start - cur
+          cur = start
+          for k in self._tag_keys(m, kind):
+            out.append((k, line, col))
+        if kind == "rattrs":
+          break
+      else:
+        if find("<", pos) != -1:
+          cut = _HTML_TOKEN_START_RE.search(buf, pos)
+        if cut is None:
+          pos = n
+          break
+
+      if cut is not None:
+        if not final and n - cut.start() <= _MAX_TAG_CHARS:
+          # Cut off by the end of the buffer: wait for more input.
+          pos = cut.start()
+          break
+        # Never completes: treat its '<' as text.
+        pos = cut.start() + 1
+
+    # Drop buf[:pos], keeping line/col of the new buf[0] current.
+    nl = buf.count("\n", cur, pos)
+    if nl:
+      line += nl
+      col = pos - buf.rfind("\n", cur, pos)
+    else:
+      col += pos - cur
+    self.buf, self.line, self.col = buf[pos:], line, col
+    return out
+
+  def feed(self, chunk: str) -> List[Tuple[str, int, int]]:
+    self.buf += chunk
+    return self._run(final=False)
+
+  def close(self) -> List[Tuple[str, int, int]]:
+    return self._run(final=True)
+
+
+def iter_ui_key_locations(chunks: Iterable[str]) -> Iterator[Tuple[str, int, int]]:
+  """
+  Yields (key, line, column) for each data-i18n attribute, 1-based, pointing
+  at the start of the owning tag. Chunks may split tags anywhere.
+  """
+  scanner = _I18nScanner()
+  for chunk in chunks:
+    yield from scanner.feed(chunk)
+  yield from scanner.close()
+
+
+def _iter_text_blocks(f: BinaryIO) -> Iterator[str]:
+  # Same decoding as Path.read_text(encoding="utf-8", errors="ignore"),
+  # including universal newlines, but SCAN_BLOCK_SIZE bytes at a time.
+  decoder = io.IncrementalNewlineDecoder(
+    codecs.getincrementaldecoder("utf-8")(errors="ignore"), translate=True
+  )
+  while True:
+    block = f.read(SCAN_BLOCK_SIZE)
+    if not block:
+      break
+    text = decoder.decode(block)
+    if text:
+      yield text
+  tail = decoder.decode(b"", final=True)
+  if tail:
+    yield tail
+
+
+def extract_ui_keys(text: str) -> List[str]:
+  """Return the sorted, de-duplicated data-i18n keys found in one document."""
+  blocks = (text[i:i + SCAN_BLOCK_SIZE] for i in range(0, len(text), SCAN_BLOCK_SIZE))
+  return sorted({k for k, _, _ in iter_ui_key_locations(blocks)})
+
+
+def scan_file_locations(path: str) -> List[Tuple[str, int, int]]:
+  with open(path, "rb") as f:
+    return list(iter_ui_key_locations(_iter_text_blocks(f)))
+
+
+def _sha1_file(f: BinaryIO) -> str:
+  h = hashlib.sha1()
+  for block in iter(lambda: f.read(SCAN_BLOCK_SIZE), b""):
+    h.update(block)
+  return h.hexdigest()
+
+
+def load_scan_cache(path: str) -> dict:
+  """
+  Returns: { "written_ns": int, "files": { path: entry } }
+  Any unreadable or foreign cache is treated as empty.
+  """
+  empty = {"written_ns": 0, "files": {}}
+  try:
+    obj = read_json(path)
+  except (OSError, ValueError):
+    return empty
+  if not isinstance(obj, dict) or obj.get("version") != SCAN_CACHE_VERSION:
+    return empty
+  files = obj.get("files")
+  if not isinstance(files, dict):
+    return empty
+  return {"written_ns": int(obj.get("written_ns", 0)), "files": files}
+
+
+def save_scan_cache(path: str, files: Dict[str, dict]) -> None:
+  os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+  obj = {
+    "version": SCAN_CACHE_VERSION,
+    "written_ns": time.time_ns(),
+    "files": files,
+  }
+  tmp = path + ".tmp"
+  with open(tmp, "w", encoding="utf-8") as f:
+    json.dump(obj, f, ensure_ascii=False, separators=(",", ":"), sort_keys=True)
+  os.replace(tmp, path)
+
 
+def _scan_one(job: Tuple[str, Optional[str]]) -> Optional[Tuple[str, int, int, str, Optional[List[str]]]]:
+  """
+  Worker: read one file, hash it, and extract keys unless the hash equals
+  known_sha1. Returns (path, mtime_ns, size, sha1, keys|None) or None if the
+  file cannot be read. Top-level so it pickles into a process pool.
+  """
+  sp, known_sha1 = job
+  try:
+    st = os.stat(sp)
+    with open(sp, "rb") as f:
+      digest = _sha1_file(f)
+      if digest == known_sha1:
+        return sp, st.st_mtime_ns, st.st_size, digest, None
+      f.seek(0)
+      keys = sorted({k for k, _, _ in iter_ui_key_locations(_iter_text_blocks(f))})
+  except Exception:
+    return None
+  return sp, st.st_mtime_ns, st.st_size, digest, keys
+
+
+def _resolve_jobs(jobs: int) -> int:
+  if jobs <= 0:
+    return os.cpu_count() or 1
+  return jobs
+
+
+def _run_scan_jobs(pending: List[Tuple[str, Optional[str]]], jobs: int) -> list:
+  jobs = min(_resolve_jobs(jobs), len(pending))
+  if jobs <= 1 or len(pending) < PARALLEL_MIN_FILES:
+    return [_scan_one(job) for job in pending]
+
+  from concurrent.futures import ProcessPoolExecutor
+
+  # A few chunks per worker keeps IPC low while still balancing load.
+  chunksize = max(1, len(pending) // (jobs * 4))
+  with ProcessPoolExecutor(max_workers=jobs) as ex:
+    return list(ex.map(_scan_one, pending, chunksize=chunksize))
+
+
+def scan_ui_index(
+  scan_paths: List[str],
+  ignore_dirs: set,
+  cache_path: Optional[str] = None,
+  rebuild_cache: bool = False,
+  jobs: int = 1,
+) -> Dict[str, List[str]]:
+  """
+  Returns: { file path: sorted data-i18n keys }
+  With cache_path, files whose (mtime, size) or content hash match the cache
+  are not re-scanned. rebuild_cache ignores the stored entries.
+  jobs > 1 scans files in a process pool (0 = one per CPU); small trees
+  are always scanned serially.
+  """
+  with TIMINGS.phase("discover"):
+    html_files = iter_html_files(scan_paths, ignore_dirs)
+  with TIMINGS.phase("scan"):
+    index = _scan_ui_index(html_files, cache_path, rebuild_cache, jobs)
+  TIMINGS.count("html_files", len(index))
+  return index
+
+
+def _scan_ui_index(
+  html_files: List[Path],
+  cache_path: Optional[str],
+  rebuild_cache: bool,
+  jobs: int,
+) -> Dict[str, List[str]]:
+
+  cache = {"written_ns": 0, "files": {}}
+  if cache_path and not rebuild_cache:
+    cache = load_scan_cache(cache_path)
+  old_files = cache["files"]
+
+  new_files: Dict[str, dict] = {}
+  pending: List[Tuple[str, Optional[str]]] = []
   for hp in html_files:
-    try:
-      text = hp.read_text(encoding="utf-8", errors="ignore")
-    except Exception:
+    sp = str(hp)
+    ent = old_files.get(sp) if cache_path else None
+
+    if ent is not None:
+      try:
+        st = hp.stat()
+      except OSError:
+        continue
+      # A file modified in the same tick the cache was written is "racily
+      # clean" and must be confirmed by hash.
+      if (
+        ent.get("mtime_ns") == st.st_mtime_ns
+        and ent.get("size") == st.st_size
+        and st.st_mtime_ns < cache["written_ns"]
+      ):
+        new_files[sp] = ent
+        continue
+
+    pending.append((sp, ent.get("sha1") if ent is not None else None))
+
+  TIMINGS.count("html_rescanned", len(pending))
+  for res in _run_scan_jobs(pending, jobs):
+    if res is None:
       continue
+    sp, mtime_ns, size, digest, keys = res
+    if keys is None:
+      keys = old_files[sp]["keys"]
+    new_files[sp] = {
+      "mtime_ns": mtime_ns,
+      "size": size,
+      "sha1": digest,
+      "keys": keys,
+    }
+
+  # Merge in discovery order so the result does not depend on scheduling.
+  index: Dict[str, List[str]] = {}
+  for hp in html_files:
+    sp = str(hp)
+    if sp in new_files:
+      index[sp] = new_files[sp]["keys"]
 
-    for m in DATA_I18N_RE.finditer(text):
-      k = m.group(1).strip()
-      if k:
-        keys.add(k)
+  TIMINGS.count("html_bytes", sum(e["size"] for e in new_files.values()))
+  if cache_path and (new_files != old_files or rebuild_cache):
+    save_scan_cache(cache_path, new_files)
+
+  return index
 
+
+def scan_ui_keys(
+  scan_paths: List[str],
+  ignore_dirs: set,
+  cache_path: Optional[str] = None,
+  rebuild_cache: bool = False,
+  jobs: int = 1,
+) -> Set[str]:
+  """Scan HTML files for data-i18n attributes with recursive directory support"""
+  keys: Set[str] = set()
+  index = scan_ui_index(scan_paths, ignore_dirs, cache_path, rebuild_cache, jobs)
+  for file_keys in index.values():
+    keys.update(file_keys)
   return keys
 
 
-def cmd_scan_ui(args):
-  nodes_obj = read_json(args.nodes)
-  nodes = [Node(**n) for n in nodes_obj.get("nodes", [])]
-  node_keys = {n.key for n in nodes}
+def ui_reports(
+  nodes: List[Node],
+  i18n_maps: Dict[str, Dict[str, str]],
+  ui_keys: Set[str],
+  index: Optional[CatalogIndex] = None,
+) -> Dict[str, dict]:
+  """
+  Returns: { report filename: report } for the scan-ui reports.
+  """
+  if index is None:
+    index = CatalogIndex((n.key for n in nodes), i18n_maps, ui_keys)
+  return index.ui_reports(ui_keys)
 
-  i18n_maps = read_i18n_dir(args.i18n_dir)
-  all_i18n_keys = set()
-  for _, m in i18n_maps.items():
-    all_i18n_keys |= set(m.keys())
 
+def write_reports(report_dir: str, reports: Dict[str, dict]) -> None:
+  os.makedirs(report_dir, exist_ok=True)
+  for fn, obj in reports.items():
+    write_json(os.path.join(report_dir, fn), obj)
+
+
+def _ignore_dirs_from_args(args) -> set:
   ignore_dirs = set(DEFAULT_IGNORE_DIRS)
   if getattr(args, "ignore", None):
     ignore_dirs |= set(args.ignore)
+  return ignore_dirs
 
-  ui_keys = scan_ui_keys(args.scan_paths, ignore_dirs)
-  ui_g_keys = {k for k in ui_keys if k.startswith("g.")}
 
-  ui_missing_in_nodes = sorted([k for k in ui_g_keys if k not in node_keys])
-  nodes_unused_in_ui = sorted([k for k in node_keys if k not in ui_g_keys])
+def _scan_cache_path_from_args(args) -> Optional[str]:
+  if args.no_cache:
+    return None
+  return os.path.join(args.cache_dir, SCAN_CACHE_FILE)
 
-  legacy_orphan = sorted([
-    k for k in all_i18n_keys
-    if k.startswith("g.") and k not in node_keys and k not in ui_g_keys
-  ])
 
-  os.makedirs(args.report_dir, exist_ok=True)
-  write_json(os.path.join(args.report_dir, "ui_keys.json"), {
-    "version": VERSION,
-    "count": len(ui_keys),
-    "g_count": len(ui_g_keys),
-    "keys": sorted(ui_keys),
-  })
-  write_json(os.path.join(args.report_dir, "ui_missing_in_nodes.json"), {
-    "version": VERSION,
-    "count": len(ui_missing_in_nodes),
-    "keys": ui_missing_in_nodes,
-  })
-  write_json(os.path.join(args.report_dir, "nodes_unused_in_ui.json"), {
+def _scan_ui_keys_from_args(args) -> Set[str]:
+  keys = scan_ui_keys(
+    args.scan_paths,
+    _ignore_dirs_from_args(args),
+    _scan_cache_path_from_args(args),
+    args.rebuild_cache,
+    args.jobs,
+  )
+  TIMINGS.count("ui_keys", len(keys))
+  return keys
+
+
+def cmd_scan_ui(args):
+  nodes = load_nodes(args.nodes)
+  i18n_maps = load_i18n(args.i18n_dir)
+
+  ui_keys = _scan_ui_keys_from_args(args)
+  reports = ui_reports(nodes, i18n_maps, ui_keys)
+  if args.locations:
+    reports["ui_key_locations.json"] = ui_locations_report(args.scan_paths, _ignore_dirs_from_args(args))
+  write_reports(args.report_dir, reports)
+
+
+def ui_locations_report(scan_paths: List[str], ignore_dirs: set) -> dict:
+  """
+  Returns: { key: ["path:line:col", ...] } wrapped in a report. Always reads
+  the files; the scan cache stores key sets only.
+  """
+  locations: Dict[str, List[str]] = {}
+  cwd = os.getcwd()
+  for hp in iter_html_files(scan_paths, ignore_dirs):
+    try:
+      found = scan_file_locations(str(hp))
+    except Exception:
+      continue
+    rel = os.path.relpath(hp, cwd) if str(hp).startswith(cwd + os.sep) else str(hp)
+    for k, line, col in found:
+      locations.setdefault(k, []).append(f"{rel}:{line}:{col}")
+  return {
     "version": VERSION,
-    "count": len(nodes_unused_in_ui),
-    "keys": nodes_unused_in_ui,
-  })
-  write_json(os.path.join(args.report_dir, "legacy_orphan_keys.json"), {
+    "count": len(locations),
+    "locations": {k: locations[k] for k in sorted(locations)},
+  }
+
+
+def cmd_gate(args):
+  """validate + scan-ui + ci_gate in one process, without the report round-trip."""
+  from ci_gate import evaluate_gates, print_gate_result
+
+  nodes = load_nodes(args.nodes)
+  i18n_maps = load_i18n(args.i18n_dir)
+  ui_keys = _scan_ui_keys_from_args(args)
+  index = CatalogIndex((n.key for n in nodes), i18n_maps, ui_keys)
+
+  missing_report, orphan_report = validate(nodes, i18n_maps, index)
+  reports = ui_reports(nodes, i18n_maps, ui_keys, index)
+
+  if args.report_dir:
+    write_validation_reports(args.report_dir, missing_report, orphan_report)
+    write_reports(args.report_dir, reports)
+
+  errors = evaluate_gates(reports["ui_missing_in_nodes.json"], missing_report)
+  sys.exit(print_gate_result(errors, orphan_report))
+
+
+class WatchSession:
+  """
+  Resident state for `watch`: the node/i18n CatalogIndex and the per-file
+  UI key index.
+  apply() folds a batch of changed paths into that state and rewrites only
+  the reports whose content changed.
+  """
+
+  def __init__(self, args):
+    self.nodes_path = os.path.abspath(args.nodes)
+    self.i18n_dir = os.path.abspath(args.i18n_dir)
+    self.report_dir = args.report_dir
+    self.ignore_dirs = _ignore_dirs_from_args(args)
+    self.cache_path = _scan_cache_path_from_args(args)
+    self.jobs = args.jobs
+    self.scan_paths = [os.path.abspath(p) for p in args.scan_paths]
+    self.scan_dirs = [
+      p for p in self.scan_paths
+      if os.path.isdir(p) and not _should_skip_path(Path(p), self.ignore_dirs)
+    ]
+    self.scan_files = {
+      str(hp) for p in self.scan_paths if os.path.isfile(p)
+      for hp in iter_html_files([p], self.ignore_dirs)
+    }
+    self.written: Dict[str, object] = {}
+    self.reload_all()
+
+  def reload_all(self) -> None:
+    self.index = scan_ui_index(self.scan_paths, self.ignore_dirs, self.cache_path, False, self.jobs)
+    self.catalog = CatalogIndex(
+      (n.key for n in load_nodes(self.nodes_path, verify=False)),
+      read_i18n_dir(self.i18n_dir),
+      (k for file_keys in self.index.values() for k in file_keys),
+    )
+
+  def watch_roots(self) -> List[Tuple[str, bool]]:
+    roots = [(d, True) for d in self.scan_dirs]
+    roots += [(os.path.dirname(f), False) for f in sorted(self.scan_files)]
+    roots += [(self.i18n_dir, False), (self._nodes_dir(), False)]
+    return roots
+
+  def _is_scanned_html(self, path: str) -> bool:
+    if path in self.scan_files:
+      return True
+    if not fnmatch.fnmatch(os.path.basename(path), "*.html"):
+      return False
+    for d in self.scan_dirs:
+      if path.startswith(d + os.sep):
+        rel_dirs = os.path.relpath(os.path.dirname(path), d).split(os.sep)
+        return not (set(rel_dirs) & self.ignore_dirs)
+    return False
+
+  def _nodes_dir(self) -> str:
+    return self.nodes_path if os.path.isdir(self.nodes_path) else os.path.dirname(self.nodes_path)
+
+  def _is_nodes_file(self, path: str) -> bool:
+    if os.path.isdir(self.nodes_path):
+      return os.path.dirname(path) == self.nodes_path and path.endswith(".json")
+    return path == self.nodes_path
+
+  def is_relevant(self, path: str) -> bool:
+    return (
+      self._is_nodes_file(path)
+      or (os.path.dirname(path) == self.i18n_dir and path.endswith(".json"))
+      or self._is_scanned_html(path)
+    )
+
+  def apply(self, changed: Set[str], rescan_token: str) -> None:
+    if rescan_token in changed:
+      self.reload_all()
+      return
+
+    langs: Set[str] = set()
+    nodes_changed = False
+    for path in changed:
+      if self._is_nodes_file(path):
+        nodes_changed = True
+      elif os.path.dirname(path) == self.i18n_dir and path.endswith(".json"):
+        langs.add(os.path.basename(path)[:-5])
+      elif self._is_scanned_html(path):
+        res = _scan_one((path, None))
+        if res is None:
+          self.index.pop(path, None)
+        else:
+          self.index[path] = res[4]
+
+    if nodes_changed:
+      # Shards and index are rewritten one by one, so skip the hash check
+      self.catalog.set_nodes(n.key for n in load_nodes(self.nodes_path, verify=False))
+    for lang in sorted(langs):
+      fp = os.path.join(self.i18n_dir, lang + ".json")
+      if os.path.exists(fp):
+        self.catalog.set_lang(lang, read_i18n_file(fp))
+      else:
+        self.catalog.drop_lang(lang)
+
+  def reports(self) -> Dict[str, object]:
+    ui_keys = set()
+    for file_keys in self.index.values():
+      ui_keys.update(file_keys)
+
+    missing_report, orphan_report = self.catalog.validation_reports()
+    out: Dict[str, object] = {
+      "missing_keys.json": missing_report,
+      "orphan_keys.json": orphan_report,
+      "diff_summary.md": validation_summary_md(missing_report, orphan_report),
+    }
+    out.update(self.catalog.ui_reports(ui_keys))
+    return out
+
+  def write_changed(self) -> List[str]:
+    wrote = []
+    for fn, obj in self.reports().items():
+      if self.written.get(fn) == obj:
+        continue
+      path = os.path.join(self.report_dir, fn)
+      if isinstance(obj, str):
+        write_text(path, obj)
+      else:
+        write_json(path, obj)
+      self.written[fn] = obj
+      wrote.append(fn)
+    return wrote
+
+
+def cmd_watch(args):
+  from fswatch import RESCAN, make_watcher
+
+  t0 = time.perf_counter()
+  session = WatchSession(args)
+  session.write_changed()
+  watcher = make_watcher(session.watch_roots(), session.ignore_dirs, args.interval, args.polling)
+  print(f"[watch] {len(session.index)} HTML files, {len(session.catalog.lang_masks)} langs indexed "
+        f"in {(time.perf_counter() - t0) * 1000:.0f} ms ({watcher.kind}); Ctrl-C to stop.")
+
+  try:
+    while True:
+      changed = {p for p in watcher.poll(None) if p == RESCAN or session.is_relevant(p)}
+      if not changed:
+        continue
+      t0 = time.perf_counter()
+      try:
+        session.apply(changed, RESCAN)
+        wrote = session.write_changed()
+      except (OSError, ValueError) as e:
+        # Half-saved JSON and the like: keep the previous state and wait.
+        print(f"[watch] skipped update: {e}")
+        continue
+      ms = (time.perf_counter() - t0) * 1000
+      print(f"[watch] {len(changed)} change(s) -> {', '.join(wrote) or 'no report changes'} ({ms:.1f} ms)")
+  except KeyboardInterrupt:
+    pass
+  finally:
+    watcher.close()
+
+
+def _add_scan_args(p) -> None:
+  p.add_argument("--scan-paths", nargs="+", required=True)
+  p.add_argument("--ignore", nargs="*", default=[], help="Directory names to ignore during recursive scan.")
+  p.add_argument("--cache-dir", default=DEFAULT_CACHE_DIR, help="Where the per-file scan cache is kept.")
+  p.add_argument("--no-cache", action="store_true", help="Scan every file; do not read or write the cache.")
+  p.add_argument("--rebuild-cache", action="store_true", help="Ignore cached entries and rewrite the cache.")
+  p.add_argument("--jobs", type=int, default=1, help="Worker processes for scanning (0 = one per CPU).")
+
+
+def _add_domain_filter_arg(p) -> None:
+  p.add_argument("--only-domains", nargs="+", default=None,
+                 help="Load only these node domains (only their shards, with a sharded --nodes).")
+
+
+def _write_timings(args, t0: float, profiler, mem_top) -> None:
+  report_dir = getattr(args, "report_dir", None) or DEFAULT_REPORT_DIR
+  obj = {
     "version": VERSION,
-    "count": len(legacy_orphan),
-    "keys": legacy_orphan,
-  })
+    "command": args.cmd,
+    "argv": sys.argv[1:],
+    "total_seconds": round(time.perf_counter() - t0, 6),
+  }
+  obj.update(TIMINGS.report())
+  if profiler is not None:
+    import pstats
+
+    prof_path = os.path.join(report_dir, "profile.pstats")
+    os.makedirs(report_dir, exist_ok=True)
+    profiler.dump_stats(prof_path)
+    stats = pstats.Stats(profiler)
+    top = sorted(stats.stats.items(), key=lambda kv: kv[1][3], reverse=True)[:PROFILE_TOP]
+    obj["profile"] = {
+      "pstats": prof_path,
+      "top_cumulative": [
+        {"function": f"{os.path.relpath(fn) if os.path.isabs(fn) else fn}:{line}({name})",
+         "calls": nc, "total_s": round(tt, 6), "cumulative_s": round(ct, 6)}
+        for (fn, line, name), (_, nc, tt, ct, _) in top
+      ],
+    }
+  if mem_top is not None:
+    obj["tracemalloc"] = mem_top
+  # Not via write_json: it would time and count itself
+  write_text(os.path.join(report_dir, "timings.json"), json.dumps(obj, ensure_ascii=False, indent=2))
+
+
+def _tracemalloc_top() -> dict:
+  import tracemalloc
+
+  snapshot = tracemalloc.take_snapshot()
+  current, peak = tracemalloc.get_traced_memory()
+  tracemalloc.stop()
+  stats = snapshot.statistics("lineno")[:PROFILE_TOP]
+  return {
+    "current_kb": current // 1024,
+    "peak_kb": peak // 1024,
+    "top_lines": [
+      {"where": f"{os.path.relpath(st.traceback[0].filename)}:{st.traceback[0].lineno}",
+       "kb": st.size // 1024, "blocks": st.count}
+      for st in stats
+    ],
+  }
 
 
 def main():
   ap = argparse.ArgumentParser(prog="grammar_i18n_compiler")
+  ap.add_argument("--timings", action="store_true",
+                  help="Write per-phase timings and counts to <report-dir or dist/reports>/timings.json.")
+  ap.add_argument("--profile", action="store_true",
+                  help="Also run under cProfile (profile.pstats + top functions in timings.json). Implies --timings.")
+  ap.add_argument("--tracemalloc", action="store_true",
+                  help="Also record allocation peak and top allocating lines. Implies --timings.")
+  ap.add_argument("--compact", action="store_true",
+                  help="Write JSON outputs without indentation or spaces.")
   sub = ap.add_subparsers(dest="cmd", required=True)
 
   p1 = sub.add_parser("i18n-to-nodes")
   p1.add_argument("--i18n-dir", required=True)
   p1.add_argument("--out", required=True)
+  p1.add_argument("--domains", nargs="+", default=None,
+                  help="Tag rules: 'domain' or 'a.b=tag' (default: %s)." % " ".join(DEFAULT_DOMAIN_TAGS))
   p1.set_defaults(func=cmd_i18n_to_nodes)
 
   p2 = sub.add_parser("nodes-to-skeleton")
   p2.add_argument("--nodes", required=True)
   p2.add_argument("--langs", nargs="+", required=True)
   p2.add_argument("--out-dir", required=True)
+  _add_domain_filter_arg(p2)
   p2.set_defaults(func=cmd_nodes_to_skeleton)
 
   p3 = sub.add_parser("validate")
   p3.add_argument("--nodes", required=True)
-  p3.add_argument("--i18n-dir", required=True)
+  p3.add_argument("--i18n-dir", required=True, help="i18n/*.json directory or a compiled bundle file.")
   p3.add_argument("--report-dir", required=True)
+  _add_domain_filter_arg(p3)
   p3.set_defaults(func=cmd_validate)
 
   p4 = sub.add_parser("patch")
   p4.add_argument("--nodes", required=True)
-  p4.add_argument("--i18n-dir", required=True)
+  p4.add_argument("--i18n-dir", required=True, help="i18n/*.json directory or a compiled bundle file.")
   p4.add_argument("--base-lang", required=True)
   p4.add_argument("--out-dir", required=True)
+  p4.add_argument("--jobs", type=int, default=0, help="Writer threads (0 = one per CPU).")
+  p4.add_argument("--report", default=None, help="Write the per-language fill counts here as JSON (optional).")
   p4.set_defaults(func=cmd_patch)
 
   p5 = sub.add_parser("scan-ui")
   p5.add_argument("--nodes", required=True)
-  p5.add_argument("--i18n-dir", required=True)
-  p5.add_argument("--scan-paths", nargs="+", required=True)
-  p5.add_argument("--ignore", nargs="*", default=[], help="Directory names to ignore during recursive scan.")
+  p5.add_argument("--i18n-dir", required=True, help="i18n/*.json directory or a compiled bundle file.")
   p5.add_argument("--report-dir", required=True)
+  p5.add_argument("--locations", action="store_true", help="Also write ui_key_locations.json (path:line:col per key).")
+  _add_scan_args(p5)
   p5.set_defaults(func=cmd_scan_ui)
 
+  p6 = sub.add_parser("gate", help="Run validate, scan-ui and the CI gate rules in one pass.")
+  p6.add_argument("--nodes", required=True)
+  p6.add_argument("--i18n-dir", required=True, help="i18n/*.json directory or a compiled bundle file.")
+  p6.add_argument("--report-dir", default=None, help="Also write all reports here (optional).")
+  _add_scan_args(p6)
+  p6.set_defaults(func=cmd_gate)
+
+  p7 = sub.add_parser("watch", help="Keep reports up to date as HTML/i18n/nodes files change.")
+  p7.add_argument("--nodes", required=True)
+  p7.add_argument("--i18n-dir", required=True)
+  p7.add_argument("--report-dir", required=True)
+  p7.add_argument("--polling", action="store_true", help="Force stat polling instead of inotify.")
+  p7.add_argument("--interval", type=float, default=0.5, help="Polling interval in seconds.")
+  _add_scan_args(p7)
+  p7.set_defaults(func=cmd_watch)
+
+  p8 = sub.add_parser("bundle", help="Compile i18n/*.json into a binary bundle (+ per-language web files).")
+  p8.add_argument("--i18n-dir", required=True)
+  p8.add_argument("--out", default=os.path.join("dist", "i18n", "i18n.bin"))
+  p8.add_argument("--web-dir", default=None, help="Also write <lang>.json / <lang>.js here (optional).")
+  p8.add_argument("--base-lang", default="en", help="Placeholder sets of other languages must match this one.")
+  p8.add_argument("--report-dir", default=None, help="Write placeholder_mismatch.json here (optional).")
+  p8.add_argument("--allow-placeholder-mismatch", action="store_true", help="Report mismatches but still build.")
+  p8.set_defaults(func=cmd_bundle)
+
+  p9 = sub.add_parser("subset", help="Per-page, per-language i18n chunks plus a shared core.")
+  p9.add_argument("--i18n-dir", required=True, help="i18n/*.json directory, a compiled bundle file or a JS catalog (assets/i18n.data.js).")
+  p9.add_argument("--out-dir", default=os.path.join("assets", "i18n"), help="Where pages load the chunks from.")
+  p9.add_argument("--keep", nargs="*", default=[], help="Key patterns (fnmatch) always put in the core, e.g. for keys built at runtime.")
+  p9.add_argument("--no-scripts", action="store_true", help="Only data-i18n keys; do not look for keys in page scripts.")
+  _add_scan_args(p9)
+  p9.set_defaults(func=cmd_subset)
+
+  p10 = sub.add_parser("nodes-split", help="Write nodes as one compact shard per domain plus an index.")
+  p10.add_argument("--nodes", required=True, help="nodes.json, or a shard directory to re-index.")
+  p10.add_argument("--out-dir", required=True)
+  p10.set_defaults(func=cmd_nodes_split)
+
+  p11 = sub.add_parser("nodes-merge", help="Merge a shard directory back into one nodes.json.")
+  p11.add_argument("--nodes", required=True, help="Shard directory (or its index.json).")
+  p11.add_argument("--out", required=True)
+  p11.set_defaults(func=cmd_nodes_merge)
+
   args = ap.parse_args()
-  args.func(args)
+  global JSON_COMPACT
+  JSON_COMPACT = args.compact
+  if not (args.timings or args.profile or args.tracemalloc):
+    args.func(args)
+    return
+
+  TIMINGS.enable()
+  profiler = None
+  if args.tracemalloc:
+    import tracemalloc
+
+    tracemalloc.start()
+  if args.profile:
+    import cProfile
+
+    profiler = cProfile.Profile()
+    profiler.enable()
+  t0 = time.perf_counter()
+  try:
+    args.func(args)
+  finally:
+    # Also on sys.exit() from gate and Ctrl-C in watch
+    if profiler is not None:
+      profiler.disable()
+    _write_timings(args, t0, profiler, _tracemalloc_top() if args.tracemalloc else None)
 
 
 if __name__ == "__main__":
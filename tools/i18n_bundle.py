@@ -0,0 +1,208 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Precompiled i18n bundle: one memory-mappable file for every language.
+
+Layout (little-endian):
+
+  header    magic "GI18", u16 version, u16 flags,
+            u32 key_count, u32 lang_count, u32 keys_off, u32 langs_off
+  keys      key_count x (u32 off, u32 len)    sorted by UTF-8 bytes
+  langs     lang_count x (u32 name_off, u32 name_len, u32 values_off)
+  values    per language: key_count x (u32 off, u32 len);
+            off == ABSENT means the language has no entry for that key
+  heap      UTF-8 strings; offsets above are relative to the file start,
+            identical strings are stored once
+
+Readers mmap the file and decode only what they touch: the language names
+at open, the key table on first iteration, values one at a time.
+"""
+
+import mmap
+import os
+import struct
+from collections.abc import Mapping
+from typing import Dict, Iterator, List, Optional, Tuple
+
+MAGIC = b"GI18"
+BUNDLE_VERSION = 1
+ABSENT = 0xFFFFFFFF
+
+_HEADER = struct.Struct("<4sHHIIII")
+_SPAN = struct.Struct("<II")
+_LANG = struct.Struct("<III")
+
+
+def write_bundle(path: str, i18n_maps: Dict[str, Dict[str, str]]) -> dict:
+  """
+  Writes the bundle atomically. Languages keep the order of i18n_maps.
+  Returns: { "keys": n, "langs": n, "bytes": n }
+  """
+  langs = list(i18n_maps)
+  keys = sorted(set().union(*(i18n_maps[l].keys() for l in langs)), key=lambda k: k.encode("utf-8"))
+  nk = len(keys)
+
+  keys_off = _HEADER.size
+  langs_off = keys_off + nk * _SPAN.size
+  values_off = langs_off + len(langs) * _LANG.size
+  heap_off = values_off + len(langs) * nk * _SPAN.size
+
+  heap = bytearray()
+  spans: Dict[str, Tuple[int, int]] = {}
+
+  def put(s: str) -> Tuple[int, int]:
+    span = spans.get(s)
+    if span is None:
+      b = s.encode("utf-8")
+      span = (heap_off + len(heap), len(b))
+      heap.extend(b)
+      spans[s] = span
+    return span
+
+  key_table = bytearray()
+  for k in keys:
+    key_table += _SPAN.pack(*put(k))
+
+  lang_table = bytearray()
+  values = bytearray()
+  for i, lang in enumerate(langs):
+    name_off, name_len = put(lang)
+    lang_table += _LANG.pack(name_off, name_len, values_off + i * nk * _SPAN.size)
+    m = i18n_maps[lang]
+    for k in keys:
+      v = m.get(k)
+      values += _SPAN.pack(ABSENT, 0) if v is None else _SPAN.pack(*put(v))
+
+  header = _HEADER.pack(MAGIC, BUNDLE_VERSION, 0, nk, len(langs), keys_off, langs_off)
+  data = header + key_table + lang_table + values + heap
+
+  os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+  tmp = f"{path}.{os.getpid()}.tmp"
+  with open(tmp, "wb") as f:
+    f.write(data)
+  os.replace(tmp, path)
+  return {"keys": nk, "langs": len(langs), "bytes": len(data)}
+
+
+class I18nBundle:
+  """Read-only, mmap-backed view of a bundle written by write_bundle()."""
+
+  def __init__(self, path: str):
+    self.path = path
+    with open(path, "rb") as f:
+      self._mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+    if len(self._mm) < _HEADER.size:
+      raise ValueError(f"{path}: not an i18n bundle (too short).")
+    magic, version, _, nk, nl, keys_off, langs_off = _HEADER.unpack_from(self._mm, 0)
+    if magic != MAGIC:
+      raise ValueError(f"{path}: not an i18n bundle (bad magic).")
+    if version != BUNDLE_VERSION:
+      raise ValueError(f"{path}: unsupported bundle version {version}.")
+    self.key_count = nk
+    self._keys_off = keys_off
+    self._values_off: Dict[str, int] = {}
+    for i in range(nl):
+      name_off, name_len, values_off = _LANG.unpack_from(self._mm, langs_off + i * _LANG.size)
+      self._values_off[self._str(name_off, name_len)] = values_off
+    self.langs: List[str] = list(self._values_off)
+    self._keys: Optional[List[str]] = None
+    self._key_ids: Optional[Dict[str, int]] = None
+
+  def _str(self, off: int, n: int) -> str:
+    return self._mm[off:off + n].decode("utf-8")
+
+  def _key_at(self, i: int) -> str:
+    return self._str(*_SPAN.unpack_from(self._mm, self._keys_off + i * _SPAN.size))
+
+  def keys(self) -> List[str]:
+    """All keys (union over languages), decoded once and shared."""
+    if self._keys is None:
+      self._keys = [self._key_at(i) for i in range(self.key_count)]
+    return self._keys
+
+  def key_id(self, key: str) -> Optional[int]:
+    if self._key_ids is None and self._keys is None:
+      # Single lookups binary-search the mmap instead of decoding every key.
+      target = key.encode("utf-8")
+      lo, hi = 0, self.key_count
+      while lo < hi:
+        mid = (lo + hi) // 2
+        off, n = _SPAN.unpack_from(self._mm, self._keys_off + mid * _SPAN.size)
+        if self._mm[off:off + n] < target:
+          lo = mid + 1
+        else:
+          hi = mid
+      if lo < self.key_count and self._key_at(lo) == key:
+        return lo
+      return None
+    if self._key_ids is None:
+      self._key_ids = {k: i for i, k in enumerate(self.keys())}
+    return self._key_ids.get(key)
+
+  def _span(self, lang: str, i: int) -> Tuple[int, int]:
+    return _SPAN.unpack_from(self._mm, self._values_off[lang] + i * _SPAN.size)
+
+  def present_ids(self, lang: str) -> List[int]:
+    base = self._values_off[lang]
+    view = self._mm[base:base + self.key_count * _SPAN.size]
+    return [i for i, (off, _) in enumerate(_SPAN.iter_unpack(view)) if off != ABSENT]
+
+  def get(self, lang: str, key: str, default: Optional[str] = None) -> Optional[str]:
+    i = self.key_id(key)
+    if i is None or lang not in self._values_off:
+      return default
+    off, n = self._span(lang, i)
+    if off == ABSENT:
+      return default
+    return self._str(off, n)
+
+  def lang(self, lang: str) -> "BundleLang":
+    if lang not in self._values_off:
+      raise KeyError(lang)
+    return BundleLang(self, lang)
+
+  def maps(self) -> Dict[str, "BundleLang"]:
+    """{ lang: lazy key -> value mapping }, usable where read_i18n_dir()'s dicts are."""
+    return {lang: BundleLang(self, lang) for lang in self.langs}
+
+  def close(self) -> None:
+    self._mm.close()
+
+  def __enter__(self):
+    return self
+
+  def __exit__(self, *exc):
+    self.close()
+
+
+class BundleLang(Mapping):
+  """One language of a bundle as a read-only mapping; values decode on access."""
+
+  __slots__ = ("_bundle", "_lang", "_ids")
+
+  def __init__(self, bundle: I18nBundle, lang: str):
+    self._bundle = bundle
+    self._lang = lang
+    self._ids: Optional[List[int]] = None
+
+  def _present(self) -> List[int]:
+    if self._ids is None:
+      self._ids = self._bundle.present_ids(self._lang)
+    return self._ids
+
+  def __getitem__(self, key: str) -> str:
+    v = self._bundle.get(self._lang, key)
+    if v is None:
+      raise KeyError(key)
+    return v
+
+  def __contains__(self, key) -> bool:
+    return isinstance(key, str) and self._bundle.get(self._lang, key) is not None
+
+  def __iter__(self) -> Iterator[str]:
+    keys = self._bundle.keys()
+    return (keys[i] for i in self._present())
+
+  def __len__(self) -> int:
+    return len(self._present())
+
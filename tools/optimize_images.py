@@ -0,0 +1,288 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Lossless image optimizer with content-hash dedupe.
+
+  python tools/optimize_images.py           # recompress PNGs in place, write the report
+  python tools/optimize_images.py --check   # change nothing; exit 1 if a PNG would shrink
+
+Every PNG in the repo (outside dist/ and dot directories) is re-encoded
+with metadata stripped (text, time, EXIF, sRGB chunks; an ICC profile is
+kept) at zlib level 9, in each lossless form that applies: its
+alpha-free or grayscale reduction, and an exact palette when it has at
+most 256 distinct RGBA colors. The smallest candidate whose decoded
+pixels equal the original's is written, if it is smaller. 16-bit and
+animated PNGs are left alone, as are other formats (fractal.webp is
+lossy already; re-encoding it cannot be lossless and smaller).
+
+The report (dist/reports/images.json) lists every PNG with its size
+before and after optimization. A file that is unchanged since an earlier
+run keeps that run's entry, so a repeat run reproduces the report
+instead of marking everything cached.
+
+Images with the same content hash are reported as duplicates, with the
+file to keep (the most referenced one) and every reference to the others
+found in HTML/CSS/JS/JSON, so they can be pointed at the kept copy. Files
+are not removed or rewritten by this step.
+
+Hashes known to be optimal are cached in dist/.cache/optimize_images.json,
+so a repeat run decodes nothing.
+"""
+
+import argparse
+import io
+import json
+import os
+import re
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+try:
+  import PIL
+  from PIL import Image, ImageChops
+except ImportError:
+  print("PIL (Pillow) not found. Install with: pip install Pillow")
+  sys.exit(1)
+
+from asset_manifest import ROOT, HashCache, read_json, write_text
+from page_budget import resolve
+
+OPT_VERSION = "optimize-images/1"
+DEFAULT_REPORT = os.path.join("dist", "reports", "images.json")
+OPT_CACHE = os.path.join("dist", ".cache", "optimize_images.json")
+HASH_CACHE = os.path.join("dist", ".cache", "optimize_images_hashes.json")
+
+IMAGE_EXTS = {".png", ".jpg", ".jpeg", ".gif", ".webp", ".avif", ".svg", ".ico"}
+REF_EXTS = {".html", ".css", ".js", ".json", ".webmanifest"}
+SKIP_DIRS = {"dist", "node_modules"}
+IMAGE_REF_RE = re.compile(r"""[^\s"'`()<>=,]+\.(?:png|jpe?g|gif|webp|avif|svg|ico)\b""", re.I)
+
+
+def iter_repo_files(root: Path) -> List[str]:
+  out = []
+  for dirpath, dirnames, files in os.walk(root):
+    dirnames[:] = sorted(d for d in dirnames if not d.startswith(".") and d not in SKIP_DIRS)
+    for fn in files:
+      out.append((Path(dirpath) / fn).relative_to(root).as_posix())
+  return sorted(out)
+
+
+def _encode(im: Image.Image, **params) -> bytes:
+  buf = io.BytesIO()
+  im.save(buf, "PNG", optimize=True, compress_level=9, **params)
+  return buf.getvalue()
+
+
+def _palette_image(rgba: Image.Image, colors: List[Tuple[int, tuple]]) -> Tuple[Image.Image, Optional[bytes]]:
+  # Translucent entries first so the tRNS chunk stays short; then by use
+  colors = sorted(colors, key=lambda c: (c[1][3] == 255, -c[0]))
+  index = {bytes(c): i for i, (_, c) in enumerate(colors)}
+  data = rgba.tobytes()
+  im = Image.frombytes("P", rgba.size, bytes(index[data[i:i + 4]] for i in range(0, len(data), 4)))
+  im.putpalette([v for _, c in colors for v in c[:3]])
+  alphas = bytes(c[3] for _, c in colors if c[3] != 255)
+  return im, alphas or None
+
+
+def candidates(rgba: Image.Image) -> List[Tuple[str, Image.Image, dict]]:
+  """Lossless re-encodings of an RGBA image: (form, image, extra save params)."""
+  out = []
+  opaque = rgba.getchannel("A").getextrema() == (255, 255)
+  r, g, b, _ = rgba.split()
+  gray = ImageChops.difference(r, g).getbbox() is None and ImageChops.difference(g, b).getbbox() is None
+  out.append(("rgb", rgba.convert("RGB"), {}) if opaque else ("rgba", rgba, {}))
+  if gray:
+    out.append(("l", rgba.convert("L"), {}) if opaque else ("la", rgba.convert("LA"), {}))
+  colors = rgba.getcolors(256)
+  if colors:
+    im, alphas = _palette_image(rgba, colors)
+    out.append(("palette", im, {"transparency": alphas} if alphas else {}))
+  return out
+
+
+def _png_header(data: bytes) -> Tuple[int, int]:
+  # (bit depth, color type) from IHDR
+  return data[24], data[25]
+
+
+def optimize_png(data: bytes) -> Tuple[bytes, str]:
+  """(smallest lossless encoding, form), or (data, reason) when kept."""
+  if len(data) < 26 or data[:8] != b"\x89PNG\r\n\x1a\n":
+    return data, "not a PNG"
+  if _png_header(data)[0] == 16:
+    return data, "16-bit"
+  src = Image.open(io.BytesIO(data))
+  if getattr(src, "n_frames", 1) > 1:
+    return data, "animated"
+  rgba = src.convert("RGBA")
+  pixels = rgba.tobytes()
+  icc = {"icc_profile": src.info["icc_profile"]} if src.info.get("icc_profile") else {}
+
+  best, form = data, "original"
+  for name, im, params in candidates(rgba):
+    out = _encode(im, **params, **icc)
+    if len(out) >= len(best):
+      continue
+    # Every candidate is checked by decoding, not assumed lossless
+    if Image.open(io.BytesIO(out)).convert("RGBA").tobytes() == pixels:
+      best, form = out, name
+  return best, form
+
+
+def _optimize_job(path: str) -> Tuple[str, bytes, str]:
+  with open(path, "rb") as f:
+    data = f.read()
+  out, form = optimize_png(data)
+  return path, out, form
+
+
+def run_jobs(paths: List[str], jobs: int) -> list:
+  if jobs <= 1 or len(paths) <= 1:
+    return [_optimize_job(p) for p in paths]
+  with ProcessPoolExecutor(max_workers=min(jobs, len(paths))) as pool:
+    return list(pool.map(_optimize_job, paths))
+
+
+def image_references(root: Path, files: List[str]) -> Dict[str, List[dict]]:
+  """{ image path: [ {file, line, ref} ] } for image paths named in text files."""
+  refs: Dict[str, List[dict]] = {}
+  for rel in files:
+    if Path(rel).suffix.lower() not in REF_EXTS:
+      continue
+    text = (root / rel).read_text(encoding="utf-8", errors="replace")
+    for lineno, line in enumerate(text.splitlines(), 1):
+      for m in IMAGE_REF_RE.finditer(line):
+        target = resolve(root, rel, m.group(0))
+        if target is not None:
+          refs.setdefault(target, []).append({"file": rel, "line": lineno, "ref": m.group(0)})
+  return refs
+
+
+def find_duplicates(images: Dict[str, str], refs: Dict[str, List[dict]]) -> List[dict]:
+  """Groups of images with one sha256; the most referenced (then shortest) path is kept."""
+  by_hash: Dict[str, List[str]] = {}
+  for path, digest in images.items():
+    by_hash.setdefault(digest, []).append(path)
+  out = []
+  for digest, paths in sorted(by_hash.items()):
+    if len(paths) < 2:
+      continue
+    paths.sort(key=lambda p: (-len(refs.get(p, [])), len(p), p))
+    keep = paths[0]
+    out.append({
+      "sha256": digest,
+      "keep": keep,
+      "duplicates": [
+        {"path": p, "references": [dict(r, replacement=_retarget(r, keep)) for r in refs.get(p, [])]}
+        for p in paths[1:]
+      ],
+    })
+  return out
+
+
+def _retarget(ref: dict, keep: str) -> str:
+  # Same style as the original reference: root-absolute or relative to its file
+  if ref["ref"].startswith("/"):
+    return "/" + keep
+  return Path(os.path.relpath(keep, os.path.dirname(ref["file"]) or ".")).as_posix()
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="optimize_images")
+  ap.add_argument("--root", default=str(ROOT))
+  ap.add_argument("--report", default=DEFAULT_REPORT)
+  ap.add_argument("--check", action="store_true", help="Do not write images; exit 1 if any PNG would shrink.")
+  ap.add_argument("--jobs", type=int, default=0, help="Worker processes (0 = one per CPU).")
+  ap.add_argument("--force", action="store_true", help="Ignore the cache of known-optimal hashes.")
+  args = ap.parse_args()
+
+  root = Path(args.root)
+  hashes = HashCache(str(root / HASH_CACHE))
+  settings = [OPT_VERSION, PIL.__version__]
+  optimal = set()
+  if not args.force:
+    try:
+      obj = read_json(str(root / OPT_CACHE))
+      if obj.get("settings") == settings:
+        optimal = set(obj.get("optimal", []))
+    except (OSError, ValueError):
+      pass
+
+  files = iter_repo_files(root)
+  images = [p for p in files if Path(p).suffix.lower() in IMAGE_EXTS]
+  digests = {p: hashes.sha256(str(root / p)) for p in images}
+  pngs = [p for p in images if p.lower().endswith(".png")]
+  pending = [p for p in pngs if digests[p] not in optimal]
+  try:
+    previous = {e["path"]: e for e in read_json(str(root / args.report)).get("files", [])}
+  except (OSError, ValueError):
+    previous = {}
+
+  jobs = args.jobs if args.jobs > 0 else (os.cpu_count() or 1)
+  results = {}
+  for path, out, form in run_jobs([str(root / p) for p in pending], jobs):
+    results[Path(path).relative_to(root).as_posix()] = (out, form)
+
+  entries = []
+  saved = 0
+  shrinkable = 0
+  for rel in pngs:
+    before = (root / rel).stat().st_size
+    if rel not in results or len(results[rel][0]) >= before:
+      # Left as is: an earlier run's entry for exactly these bytes stands
+      prev = previous.get(rel)
+      if prev and prev.get("status") != "would optimize" and prev.get("optimized_bytes", prev.get("bytes")) == before:
+        entries.append(prev)
+        if rel in results:
+          optimal.add(digests[rel])
+        continue
+    if rel not in results:
+      entries.append({"path": rel, "bytes": before, "status": "cached"})
+      continue
+    out, form = results[rel]
+    if len(out) < before:
+      shrinkable += 1
+      saved += before - len(out)
+      if not args.check:
+        dst = root / rel
+        tmp = f"{dst}.{os.getpid()}.tmp"
+        with open(tmp, "wb") as f:
+          f.write(out)
+        os.replace(tmp, dst)
+        digests[rel] = hashes.sha256(str(dst))
+      entries.append({"path": rel, "bytes": before, "optimized_bytes": len(out), "form": form,
+                      "status": "would optimize" if args.check else "optimized"})
+    else:
+      entries.append({"path": rel, "bytes": before, "status": "optimal" if form == "original" else f"kept ({form})"})
+    if args.check and len(out) < before:
+      continue
+    optimal.add(digests[rel])
+
+  # Optimizing identical inputs gives identical outputs, so dedupe after writing
+  refs = image_references(root, files)
+  dupes = find_duplicates({p: digests[p] for p in images}, refs)
+  # Totals over the report's entries, including ones carried over
+  report = {
+    "version": OPT_VERSION,
+    "files": entries,
+    "saved_bytes": sum(e["bytes"] - e["optimized_bytes"] for e in entries if e["status"] == "optimized"),
+    "duplicates": dupes,
+  }
+  write_text(str(root / args.report), json.dumps(report, indent=2) + "\n")
+  hashes.save()
+  write_text(str(root / OPT_CACHE), json.dumps({"settings": settings, "optimal": sorted(optimal)}))
+
+  verb = "would save" if args.check else "saved"
+  print(f"[OK] {len(pngs)} PNG(s): {len(pending)} examined, {len(pngs) - len(pending)} cached; "
+        f"{shrinkable} shrinkable, {verb} {saved} B")
+  for d in dupes:
+    for dup in d["duplicates"]:
+      print(f"[DUP] {dup['path']} == {d['keep']} ({len(dup['references'])} reference(s) to rewrite)")
+  if args.check and shrinkable:
+    sys.exit(1)
+
+
+if __name__ == "__main__":
+  main()
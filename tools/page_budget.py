@@ -0,0 +1,292 @@
+#!/usr/bin/env python3
+# -*- coding: utf-8 -*-
+"""
+Page-weight analyzer for the budget gate in tools/ci_gate.py.
+
+  python tools/page_budget.py [--root DIR] [--config tools/budget.json] [--out dist/reports/budget.json]
+
+For every page in the config it follows what a first visit downloads:
+  <script src>, <link href> (stylesheet, icon, manifest, preload),
+  <img src/srcset>, <source srcset>, url() in inline <style> and style=""
+  attributes, and url() / @import inside the referenced CSS (recursively).
+Of srcset and image-set() alternatives only the largest existing one is
+counted, since the browser downloads one. External URLs and data: URIs
+are skipped; references to files that do not exist are listed as missing.
+
+Each asset is measured raw, gzip (level 9) and brotli (quality 11; needs
+the `brotli` package, null otherwise). Binary formats are not compressed
+in transit, so their gzip/br sizes are their raw size. With --root
+dist/site the precompressed .gz/.br siblings from tools/build_site.py are
+measured instead of compressing again. Compressed sizes are cached by
+content hash in dist/.cache/page_budget.json.
+
+Without the gate (ci_gate.py --budget) this only writes the report.
+"""
+
+import argparse
+import gzip
+import json
+import os
+import re
+from html.parser import HTMLParser
+from pathlib import Path
+from typing import Dict, List, Optional, Tuple
+
+from asset_manifest import ROOT, HashCache, read_json, write_text
+from build_site import BROTLI_QUALITY, COMPRESS_EXTS, GZIP_LEVEL, brotli
+
+BUDGET_VERSION = "page-budget/1"
+DEFAULT_CONFIG = os.path.join("tools", "budget.json")
+DEFAULT_REPORT = os.path.join("dist", "reports", "budget.json")
+SIZE_CACHE = os.path.join("dist", ".cache", "page_budget.json")
+HASH_CACHE = os.path.join("dist", ".cache", "page_budget_hashes.json")
+
+# Asset type per extension; anything else (fonts, manifests, JSON) is "other"
+ASSET_TYPES = {
+  ".html": "html",
+  ".js": "js", ".mjs": "js",
+  ".css": "css",
+  ".png": "image", ".jpg": "image", ".jpeg": "image", ".gif": "image",
+  ".webp": "image", ".avif": "image", ".svg": "image", ".ico": "image",
+}
+TYPES = ("html", "js", "css", "image", "other")
+METRICS = ("raw", "gzip", "br")
+
+LINK_RELS = {"stylesheet", "icon", "shortcut", "apple-touch-icon", "manifest", "preload", "modulepreload"}
+
+CSS_COMMENT_RE = re.compile(r"/\*[\s\S]*?\*/")
+CSS_URL_RE = re.compile(r"""url\(\s*(?:"([^"]*)"|'([^']*)'|([^)\s]*))\s*\)""", re.I)
+CSS_IMPORT_RE = re.compile(r"""@import\s+(?:"([^"]*)"|'([^']*)')""", re.I)
+IMAGE_SET_RE = re.compile(r"(?:-webkit-)?image-set\(", re.I)
+
+
+def asset_type(path: str) -> str:
+  return ASSET_TYPES.get(Path(path).suffix.lower(), "other")
+
+
+def _is_local(url: str) -> bool:
+  return bool(url) and not url.startswith(("data:", "#", "//")) and not re.match(r"[a-zA-Z][a-zA-Z0-9+.-]*:", url)
+
+
+def resolve(root: Path, base: str, url: str) -> Optional[str]:
+  """Root-relative POSIX path of a local reference from file `base`; None for external URLs."""
+  url = url.strip().split("#", 1)[0].split("?", 1)[0]
+  if not _is_local(url):
+    return None
+  if url.startswith("/"):
+    target = root / url.lstrip("/")
+  else:
+    target = (root / base).parent / url
+  rel = os.path.relpath(os.path.normpath(target), root)
+  if rel.startswith(".."):
+    return None
+  rel = Path(rel).as_posix()
+  if url.endswith("/"):
+    rel = f"{rel}/index.html" if rel != "." else "index.html"
+  return rel
+
+
+def _srcset_urls(srcset: str) -> List[str]:
+  return [c.strip().split()[0] for c in srcset.split(",") if c.strip()]
+
+
+def css_refs(text: str) -> List[List[str]]:
+  """Reference groups in CSS: [url] or the alternatives of one image-set()."""
+  text = CSS_COMMENT_RE.sub("", text)
+  groups: List[List[str]] = []
+  spans: List[Tuple[int, int]] = []
+  for m in IMAGE_SET_RE.finditer(text):
+    depth, i = 1, m.end()
+    while i < len(text) and depth:
+      depth += {"(": 1, ")": -1}.get(text[i], 0)
+      i += 1
+    spans.append((m.start(), i))
+    groups.append([next(g for g in u.groups() if g is not None) for u in CSS_URL_RE.finditer(text, m.end(), i)])
+  for m in CSS_URL_RE.finditer(text):
+    if not any(a <= m.start() < b for a, b in spans):
+      groups.append([next(g for g in m.groups() if g is not None)])
+  for m in CSS_IMPORT_RE.finditer(text):
+    groups.append([m.group(1) if m.group(1) is not None else m.group(2)])
+  return [g for g in groups if g]
+
+
+class _PageRefs(HTMLParser):
+  def __init__(self):
+    super().__init__(convert_charrefs=True)
+    self.groups: List[List[str]] = []
+    self.in_style = False
+    self.style: List[str] = []
+
+  def handle_starttag(self, tag, attrs):
+    a = {k: (v or "") for k, v in attrs}
+    if tag == "script" and a.get("src"):
+      self.groups.append([a["src"]])
+    elif tag == "link" and a.get("href") and LINK_RELS & set(a.get("rel", "").lower().split()):
+      self.groups.append([a["href"]])
+    elif tag in ("img", "source"):
+      alts = _srcset_urls(a.get("srcset", "")) + ([a["src"]] if a.get("src") else [])
+      if alts:
+        self.groups.append(alts)
+    elif tag == "style":
+      self.in_style = True
+    if a.get("style"):
+      self.groups.extend(css_refs(a["style"]))
+
+  def handle_endtag(self, tag):
+    if tag == "style":
+      self.in_style = False
+
+  def handle_data(self, data):
+    if self.in_style:
+      self.style.append(data)
+
+
+def html_refs(text: str) -> List[List[str]]:
+  p = _PageRefs()
+  p.feed(text)
+  p.close()
+  return p.groups + css_refs("".join(p.style))
+
+
+class Sizer:
+  """raw/gzip/br bytes per file; compressed sizes cached by content hash."""
+
+  def __init__(self, root: Path, cache_path: Optional[str], hash_cache_path: Optional[str]):
+    self.root = root
+    self.cache_path = cache_path
+    self.hashes = HashCache(hash_cache_path)
+    self.entries: Dict[str, list] = {}
+    self.used: Dict[str, list] = {}
+    if cache_path:
+      try:
+        obj = read_json(cache_path)
+        if obj.get("version") == BUDGET_VERSION:
+          self.entries = obj.get("sizes", {})
+      except (OSError, ValueError):
+        pass
+
+  def _sibling(self, path: Path, ext: str) -> Optional[int]:
+    p = path.with_name(path.name + ext)
+    # build_site only writes a sibling when it is smaller than the file
+    return p.stat().st_size if p.is_file() else None
+
+  def measure(self, rel: str) -> dict:
+    path = self.root / rel
+    raw = path.stat().st_size
+    if path.suffix.lower() not in COMPRESS_EXTS:
+      return {"raw": raw, "gzip": raw, "br": raw}
+    digest = self.hashes.sha256(str(path))
+    sizes = self.entries.get(digest)
+    if sizes is None or (sizes[1] is None and brotli is not None):
+      gz = self._sibling(path, ".gz")
+      br = self._sibling(path, ".br")
+      if gz is None or (br is None and brotli is not None):
+        data = path.read_bytes()
+        gz = min(raw, len(gzip.compress(data, compresslevel=GZIP_LEVEL, mtime=0)))
+        br = min(raw, len(brotli.compress(data, quality=BROTLI_QUALITY))) if brotli is not None else None
+      sizes = [gz, br]
+    self.used[digest] = sizes
+    return {"raw": raw, "gzip": sizes[0], "br": sizes[1]}
+
+  def save(self) -> None:
+    self.hashes.save()
+    if self.cache_path:
+      write_text(self.cache_path, json.dumps({"version": BUDGET_VERSION, "sizes": self.used}, sort_keys=True))
+
+
+def page_assets(root: Path, page: str) -> Tuple[List[str], List[str]]:
+  """(files the page loads, including itself; missing references), both sorted."""
+  seen = {page}
+  missing = set()
+  queue = [page]
+  while queue:
+    rel = queue.pop()
+    kind = asset_type(rel)
+    if kind not in ("html", "css"):
+      continue
+    text = (root / rel).read_text(encoding="utf-8", errors="replace")
+    for group in html_refs(text) if kind == "html" else css_refs(text):
+      found = []
+      for url in group:
+        target = resolve(root, rel, url)
+        if target is None:
+          continue
+        if (root / target).is_file():
+          found.append(target)
+        else:
+          missing.add(target)
+      if not found:
+        continue
+      pick = max(found, key=lambda t: (root / t).stat().st_size)
+      if pick not in seen:
+        seen.add(pick)
+        # Pages link to each other only via <a>, so HTML here is the page itself
+        if asset_type(pick) == "css":
+          queue.append(pick)
+  return sorted(seen), sorted(missing)
+
+
+def _zero() -> Dict[str, Optional[int]]:
+  return {m: 0 for m in METRICS}
+
+
+def _add(acc: dict, sizes: dict) -> None:
+  for m in METRICS:
+    acc[m] = None if acc[m] is None or sizes[m] is None else acc[m] + sizes[m]
+
+
+def analyze(root: Path, pages: List[str], sizer: Sizer) -> dict:
+  out = {}
+  for page in pages:
+    if not (root / page).is_file():
+      out[page] = {"error": "page not found"}
+      continue
+    files, missing = page_assets(root, page)
+    by_type = {t: _zero() for t in TYPES}
+    total = _zero()
+    assets = []
+    for rel in files:
+      sizes = sizer.measure(rel)
+      kind = asset_type(rel)
+      _add(by_type[kind], sizes)
+      _add(total, sizes)
+      assets.append({"path": rel, "type": kind, **sizes})
+    out[page] = {"assets": assets, "types": by_type, "total": total, "missing": missing}
+  return out
+
+
+def build_report(root: Path, config: dict, cache: bool = True) -> dict:
+  sizer = Sizer(root, str(ROOT / SIZE_CACHE) if cache else None, str(ROOT / HASH_CACHE) if cache else None)
+  pages = analyze(root, list(config.get("pages", {})), sizer)
+  sizer.save()
+  return {
+    "version": BUDGET_VERSION,
+    "root": os.path.relpath(root, ROOT) if root.is_relative_to(ROOT) else str(root),
+    "brotli": brotli is not None,
+    "pages": pages,
+  }
+
+
+def main():
+  ap = argparse.ArgumentParser(prog="page_budget")
+  ap.add_argument("--root", default=str(ROOT), help="Site root to measure (default: repo root; or dist/site).")
+  ap.add_argument("--config", default=str(ROOT / DEFAULT_CONFIG))
+  ap.add_argument("--out", default=str(ROOT / DEFAULT_REPORT))
+  ap.add_argument("--no-cache", action="store_true", help="Compress everything; do not read or write the size cache.")
+  args = ap.parse_args()
+
+  report = build_report(Path(args.root).resolve(), read_json(args.config), not args.no_cache)
+  write_text(args.out, json.dumps(report, indent=2) + "\n")
+  for page, ent in report["pages"].items():
+    if "error" in ent:
+      print(f"[FAIL] {page}: {ent['error']}")
+      continue
+    t = ent["total"]
+    print(f"[budget] {page}: {len(ent['assets'])} file(s), {t['raw']} B raw, {t['gzip']} B gzip, {t['br']} B brotli"
+          + (f"; {len(ent['missing'])} missing reference(s)" if ent["missing"] else ""))
+  if not report["brotli"]:
+    print("[WARN] brotli not installed (pip install brotli); br sizes are null")
+
+
+if __name__ == "__main__":
+  main()